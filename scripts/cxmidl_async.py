@@ -0,0 +1,248 @@
+"""
+CXMIDL Orchestration Async Connector
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+asyncio front end for CXMIDLOrchestrationConnector. Blocking ODBC work runs
+on a managed thread pool sized to the shared connection pool, so an event
+loop can keep many queries in flight without stalling and without one
+thread per request. pandas and pyarrow are only needed by the results, so
+importing this module loads neither.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
+from cxmidl_connector import CXMIDLOrchestrationConnector
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+logger = logging.getLogger(__name__)
+
+_STREAM_DONE = object()
+
+
+class AsyncCXMIDLOrchestrationConnector:
+    """asyncio connector for the CXMIDL Orchestration database."""
+
+    def __init__(self,
+                 database: str = "Orchestration",
+                 connector: Optional[CXMIDLOrchestrationConnector] = None,
+                 max_workers: Optional[int] = None,
+                 **connector_options):
+        """
+        Initialize the async connector.
+
+        Args:
+            database: Target database name (ignored when ``connector`` is given)
+            connector: Existing synchronous connector to wrap
+            max_workers: Executor threads (default: pool size plus overflow)
+            **connector_options: Passed to CXMIDLOrchestrationConnector
+        """
+        self.connector = connector or CXMIDLOrchestrationConnector(database=database, **connector_options)
+        self.max_workers = max_workers or max(1, self.connector.pool_size + self.connector.max_overflow)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Thread pool running the blocking ODBC calls (created on first use)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="cxmidl-async"
+            )
+        return self._executor
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """Run a blocking call on the managed executor."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(func, *args, **kwargs))
+
+    async def connect(self) -> bool:
+        """Establish connection to CXMIDL server."""
+        return await self._run(self.connector.connect)
+
+    async def execute_query(self,
+                            query: str,
+                            params: Optional[Dict[str, Any]] = None,
+                            return_dataframe: bool = True,
+                            timeout: Optional[int] = None,
+                            cache_ttl: Optional[float] = None,
+                            retry: Optional[bool] = None,
+                            compact_dtypes: bool = False) -> Union[pd.DataFrame, List[Dict]]:
+        """
+        Execute SQL query without blocking the event loop.
+
+        Arguments match ``CXMIDLOrchestrationConnector.execute_query``.
+        """
+        return await self._run(
+            self.connector.execute_query, query, params,
+            return_dataframe=return_dataframe, timeout=timeout, cache_ttl=cache_ttl,
+            retry=retry, compact_dtypes=compact_dtypes
+        )
+
+    async def execute_many(self,
+                           queries: List[Union[str, Tuple[str, Optional[Dict[str, Any]]]]],
+                           return_dataframe: bool = True,
+                           timeout: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Execute independent queries concurrently.
+
+        Queries are scheduled directly on the managed executor (bounded by
+        ``max_workers``); results come back in input order with latency.
+        """
+        async def _one(index: int, item) -> Dict[str, Any]:
+            query, params = (item, None) if isinstance(item, str) else item
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            try:
+                result = await self.execute_query(query, params, return_dataframe, timeout)
+                return {"index": index, "success": True, "result": result, "error": None,
+                        "latency_seconds": round(loop.time() - start, 6)}
+            except Exception as e:
+                return {"index": index, "success": False, "result": None, "error": str(e),
+                        "latency_seconds": round(loop.time() - start, 6)}
+
+        return list(await asyncio.gather(*(_one(i, item) for i, item in enumerate(queries))))
+
+    async def _iterate(self, iterator) -> AsyncIterator[Any]:
+        """
+        Advance a blocking iterator on the executor, one item per await.
+
+        A ``next`` call already running on a worker thread cannot be
+        interrupted, so on cancellation it is awaited (shielded) before the
+        iterator is closed; closing a generator that is still executing
+        would fail and leak its pooled connection.
+        """
+        loop = asyncio.get_running_loop()
+        pending: Optional[asyncio.Future] = None
+        try:
+            while True:
+                pending = loop.run_in_executor(self.executor, next, iterator, _STREAM_DONE)
+                item = await asyncio.shield(pending)
+                pending = None
+                if item is _STREAM_DONE:
+                    break
+                yield item
+        finally:
+            if pending is not None:
+                try:
+                    await asyncio.shield(pending)
+                except BaseException:
+                    pass
+            # Closing releases the pooled connection held by the generator
+            await loop.run_in_executor(self.executor, iterator.close)
+
+    def stream_query(self,
+                     query: str,
+                     params: Optional[Dict[str, Any]] = None,
+                     chunk_size: int = 10000,
+                     return_dataframe: bool = True) -> AsyncIterator[Union[pd.DataFrame, List[Dict]]]:
+        """
+        Asynchronously iterate over result chunks of a streaming query.
+
+        The pooled connection is held until the stream is exhausted or
+        closed. After breaking out of ``async for`` early, close the stream
+        with ``await stream.aclose()`` (or iterate inside
+        ``contextlib.aclosing``) to release it deterministically instead of
+        at garbage collection.
+        """
+        iterator = self.connector.execute_query_stream(query, params, chunk_size, return_dataframe)
+        return self._iterate(iterator)
+
+    def stream_arrow_batches(self,
+                             query: str,
+                             params: Optional[Dict[str, Any]] = None,
+                             batch_size: int = 65536) -> AsyncIterator[pa.RecordBatch]:
+        """
+        Asynchronously iterate over Arrow record batches of a query.
+
+        Close the stream with ``aclose()`` after leaving it early (see ``stream_query``).
+        """
+        iterator = self.connector.execute_query_arrow_batches(query, params, batch_size)
+        return self._iterate(iterator)
+
+    async def stream_changes(self,
+                             tables: List[Union[str, Dict[str, Any]]],
+                             state_path: Union[str, Path],
+                             mode: str = "change_tracking",
+                             poll_interval: float = 5.0,
+                             max_polls: Optional[int] = None,
+                             **options) -> AsyncIterator[pa.RecordBatch]:
+        """
+        Asynchronously stream Change Tracking / CDC batches of ``tables``.
+
+        Each poll runs on the executor; the idle wait between polls is an
+        ``asyncio.sleep`` so it holds no worker thread. Close the stream with
+        ``aclose()`` after leaving it early (see ``stream_query``). See
+        ``cxmidl_change_feed.ChangeFeed`` for the available options.
+        """
+        from cxmidl_change_feed import ChangeFeed
+        feed = await self._run(ChangeFeed, self.connector, tables, state_path, mode=mode, **options)
+        polls = 0
+        while max_polls is None or polls < max_polls:
+            polls += 1
+            delivered = False
+            batches = self._iterate(feed.poll())
+            try:
+                async for batch in batches:
+                    delivered = True
+                    yield batch
+            finally:
+                # An aclose() of this stream lands at the yield above; pass it on
+                await batches.aclose()
+            if not delivered and (max_polls is None or polls < max_polls):
+                await asyncio.sleep(poll_interval)
+
+    async def health_check(self) -> Dict[str, Any]:
+        """Perform comprehensive health check."""
+        return await self._run(self.connector.health_check)
+
+    async def get_server_info(self) -> Dict[str, Any]:
+        """Get comprehensive server information."""
+        return await self._run(self.connector.get_server_info)
+
+    async def get_databases(self) -> pd.DataFrame:
+        """Get list of available databases."""
+        return await self._run(self.connector.get_databases)
+
+    async def close(self):
+        """Release the connector and shut down the executor."""
+        if self._executor is not None:
+            await self._run(self.connector.close)
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        else:
+            self.connector.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+
+def create_async_cxmidl_connector(database: str = "Orchestration", **options) -> AsyncCXMIDLOrchestrationConnector:
+    """
+    Factory function to create an async CXMIDL connector with enterprise defaults.
+
+    Args:
+        database: Target database name
+        **options: Further AsyncCXMIDLOrchestrationConnector arguments
+            (``max_workers``, or connector options such as ``url`` or ``engine``)
+
+    Returns:
+        AsyncCXMIDLOrchestrationConnector instance
+    """
+    return AsyncCXMIDLOrchestrationConnector(database=database, **options)
@@ -0,0 +1,485 @@
+"""
+CXMIDL Orchestration Connector Benchmarks
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+Reproducible benchmarks for CXMIDLOrchestrationConnector against a local
+stand-in for the Orchestration database (by default a SQLite file injected
+through the connector's ``url``). Synthetic Orchestration-shaped execution
+log tables are generated once at 10K, 1M and 10M rows with a fixed seed.
+
+Every case runs in a fresh worker process so its peak RSS is its own, and
+reports latency percentiles and throughput. Results can be saved as a
+baseline and later runs compared against it to flag regressions:
+
+    python cxmidl_benchmark.py --scales 10k,1m --save-baseline baseline.json
+    python cxmidl_benchmark.py --scales 10k,1m --baseline baseline.json
+"""
+
+import argparse
+import json
+import logging
+import multiprocessing
+import platform
+import sqlite3
+import sys
+import tempfile
+import time
+import traceback
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+SCALES = {"10k": 10_000, "1m": 1_000_000, "10m": 10_000_000}
+DEFAULT_DATABASE_PATH = Path(tempfile.gettempdir()) / "cxmidl_benchmark" / "orchestration.db"
+DEFAULT_TOLERANCE = 0.10
+SEED = 20240501
+GENERATE_BATCH_ROWS = 100_000
+
+# Materializing a whole table as DataFrame/dicts is only benchmarked up to
+# this size; larger tables are covered by the streaming cases
+FULL_FETCH_MAX_ROWS = 1_000_000
+
+# Full-table cases scale their iterations down with table size but never
+# below this; p99 is only compared against a baseline when both runs took at
+# least P99_MIN_SAMPLES samples (below that it is just the slowest sample)
+MIN_ITERATIONS = 5
+P99_MIN_SAMPLES = 100
+
+WORKFLOWS = [f"Workflow_{i:02d}" for i in range(50)]
+TASKS = [f"Task_{i:03d}" for i in range(500)]
+STATUSES = ["Succeeded", "Failed", "Running", "Cancelled", "Queued"]
+STATUS_WEIGHTS = [0.86, 0.05, 0.04, 0.02, 0.03]
+OPERATORS = ["svc-orchestrator", "svc-scheduler", "svc-backfill", "ops-manual"]
+
+EXECUTION_LOG_DDL = """
+CREATE TABLE IF NOT EXISTS {table} (
+    ExecutionId INTEGER PRIMARY KEY,
+    WorkflowName TEXT NOT NULL,
+    TaskName TEXT NOT NULL,
+    Status TEXT NOT NULL,
+    StartTime TIMESTAMP NOT NULL,
+    DurationMs INTEGER NOT NULL,
+    RowsProcessed INTEGER NOT NULL,
+    RetryCount INTEGER NOT NULL,
+    ErrorMessage TEXT,
+    CreatedBy TEXT NOT NULL
+)
+"""
+
+
+def table_name(scale: str) -> str:
+    """Synthetic execution log table for ``scale``."""
+    return f"ExecutionLog_{scale}"
+
+
+def _generate_rows(rng: np.random.Generator, start_id: int, count: int) -> List[Tuple]:
+    """One batch of synthetic execution log rows."""
+    ids = np.arange(start_id, start_id + count)
+    workflows = rng.integers(0, len(WORKFLOWS), count)
+    tasks = rng.integers(0, len(TASKS), count)
+    statuses = rng.choice(len(STATUSES), count, p=STATUS_WEIGHTS)
+    epoch = datetime(2024, 1, 1)
+    offsets = rng.integers(0, 365 * 24 * 3600, count)
+    durations = rng.lognormal(8, 1.5, count).astype(np.int64)
+    processed = rng.integers(0, 5_000_000, count)
+    retries = rng.poisson(0.2, count)
+    operators = rng.integers(0, len(OPERATORS), count)
+    return [
+        (
+            int(ids[i]), WORKFLOWS[workflows[i]], TASKS[tasks[i]], STATUSES[statuses[i]],
+            (epoch + timedelta(seconds=int(offsets[i]))).isoformat(sep=" "),
+            int(durations[i]), int(processed[i]), int(retries[i]),
+            f"Timeout waiting for {TASKS[tasks[i]]} (attempt {retries[i] + 1})" if statuses[i] == 1 else None,
+            OPERATORS[operators[i]]
+        )
+        for i in range(count)
+    ]
+
+
+def prepare_database(path: Union[str, Path], scales: Sequence[str]) -> Path:
+    """
+    Create the synthetic tables for ``scales`` in a SQLite file.
+
+    Tables already holding the expected row count are reused, so the (slow)
+    10M-row generation happens once per machine.
+
+    Returns:
+        Path of the database file
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    connection = sqlite3.connect(path)
+    try:
+        connection.execute("PRAGMA journal_mode = WAL")
+        connection.execute("PRAGMA synchronous = OFF")
+        for scale in scales:
+            rows = SCALES[scale]
+            table = table_name(scale)
+            connection.execute(EXECUTION_LOG_DDL.format(table=table))
+            existing = connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            if existing == rows:
+                continue
+            start = time.perf_counter()
+            connection.execute(f"DELETE FROM {table}")
+            rng = np.random.default_rng(SEED)
+            for start_id in range(1, rows + 1, GENERATE_BATCH_ROWS):
+                count = min(GENERATE_BATCH_ROWS, rows + 1 - start_id)
+                connection.executemany(
+                    f"INSERT INTO {table} VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    _generate_rows(rng, start_id, count)
+                )
+            connection.commit()
+            logger.info(f"Generated {table} ({rows} rows) in {time.perf_counter() - start:.1f}s")
+    finally:
+        connection.close()
+    return path
+
+
+def _peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process in MB (None where unsupported)."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS and kilobytes elsewhere
+    return round(peak / (1024 * 1024 if sys.platform == "darwin" else 1024), 1)
+
+
+def _summarize(latencies: List[float], rows: int) -> Dict[str, Any]:
+    samples = np.asarray(latencies)
+    total = float(samples.sum())
+    return {
+        "iterations": len(latencies),
+        "p50_ms": round(float(np.percentile(samples, 50)) * 1000, 3),
+        "p99_ms": round(float(np.percentile(samples, 99)) * 1000, 3),
+        "mean_ms": round(float(samples.mean()) * 1000, 3),
+        "rows": rows,
+        "ops_per_second": round(len(latencies) / total, 2) if total else None,
+        "rows_per_second": round(rows / total, 1) if total and rows else None
+    }
+
+
+def _consume_rows(result: Any) -> int:
+    """Row count of a query result, streamed chunk/batch iterator included."""
+    if hasattr(result, "num_rows"):
+        return result.num_rows
+    if hasattr(result, "__len__"):
+        return len(result)
+    return sum(_consume_rows(part) for part in result)
+
+
+def _case_operation(connector, case: str, scale: str, url: str, rng: np.random.Generator) -> Callable[[], int]:
+    """The timed operation for ``case``; returns the rows it produced."""
+    from cxmidl_connector import CXMIDLOrchestrationConnector, dispose_connection_pools
+
+    table = connector.backend.qualify("dbo", table_name(scale))
+    full_scan = f"SELECT * FROM {table}"
+    point_lookup = f"SELECT * FROM {table} WHERE ExecutionId = :execution_id"
+    columns_params = {"schema": connector.backend.schema_name("dbo")}
+
+    def _connect(cold: bool) -> int:
+        if cold:
+            dispose_connection_pools()
+        with CXMIDLOrchestrationConnector(url=url, collect_metrics=False):
+            pass
+        return 0
+
+    def _lookup(return_dataframe: bool) -> int:
+        params = {"execution_id": int(rng.integers(1, SCALES[scale] + 1))}
+        return len(connector.execute_query(point_lookup, params, return_dataframe=return_dataframe))
+
+    operations = {
+        "connect_cold": lambda: _connect(cold=True),
+        "connect_warm": lambda: _connect(cold=False),
+        "point_lookup_dataframe": lambda: _lookup(True),
+        "point_lookup_dicts": lambda: _lookup(False),
+        "catalog_tables": lambda: len(connector.get_orchestration_tables()),
+        "catalog_columns": lambda: len(connector.execute_query(
+            connector.backend.columns_query, columns_params, return_dataframe=False
+        )),
+        "fetch_dataframe": lambda: len(connector.execute_query(full_scan)),
+        "fetch_compact": lambda: len(connector.execute_query(full_scan, compact_dtypes=True)),
+        "fetch_dicts": lambda: len(connector.execute_query(full_scan, return_dataframe=False)),
+        "stream_dataframe": lambda: _consume_rows(connector.execute_query_stream(full_scan, chunk_size=50_000)),
+        "stream_arrow": lambda: _consume_rows(connector.execute_query_arrow_batches(full_scan))
+    }
+    return operations[case]
+
+
+# (case, iterations at 10K rows); full-table cases scale iterations down
+CASES = [
+    ("connect_cold", 20),
+    ("connect_warm", 50),
+    ("point_lookup_dataframe", 500),
+    ("point_lookup_dicts", 500),
+    ("catalog_tables", 100),
+    ("catalog_columns", 100),
+    ("fetch_dataframe", 10),
+    ("fetch_compact", 10),
+    ("fetch_dicts", 10),
+    ("stream_dataframe", 10),
+    ("stream_arrow", 10)
+]
+_SCALE_INDEPENDENT = {"connect_cold", "connect_warm", "catalog_tables", "catalog_columns"}
+_FULL_TABLE = {"fetch_dataframe", "fetch_compact", "fetch_dicts", "stream_dataframe", "stream_arrow"}
+
+
+def run_case(case: str, scale: str, url: str, iterations: int, warmup: int = 1) -> Dict[str, Any]:
+    """
+    Run one benchmark case in this process.
+
+    Args:
+        case: Case name (see ``CASES``)
+        scale: Table scale key (see ``SCALES``)
+        url: SQLAlchemy URL of the backend
+        iterations: Timed iterations
+        warmup: Untimed iterations run first
+
+    Returns:
+        Latency percentiles, throughput and peak RSS for the case
+    """
+    from cxmidl_connector import CXMIDLOrchestrationConnector
+
+    logging.getLogger("cxmidl_connector").setLevel(logging.WARNING)
+    rng = np.random.default_rng(SEED)
+    connector = CXMIDLOrchestrationConnector(url=url, collect_metrics=False)
+    try:
+        if not connector.connect():
+            raise ConnectionError(f"Could not connect to benchmark backend {connector.server}")
+        operation = _case_operation(connector, case, scale, url, rng)
+        for _ in range(warmup):
+            operation()
+        latencies = []
+        rows = 0
+        for _ in range(iterations):
+            start = time.perf_counter()
+            rows += operation()
+            latencies.append(time.perf_counter() - start)
+    finally:
+        connector.close()
+    return {"case": case, "scale": scale, **_summarize(latencies, rows), "peak_rss_mb": _peak_rss_mb()}
+
+
+def _isolated_case(connection, case: str, scale: str, url: str, iterations: int) -> None:
+    """Worker process entry point: send ``run_case``'s result (or error) back."""
+    try:
+        connection.send(("ok", run_case(case, scale, url, iterations)))
+    except BaseException as e:
+        connection.send(("error", f"{type(e).__name__}: {e}\n{traceback.format_exc()}"))
+    finally:
+        connection.close()
+
+
+def _run_isolated(case: str, scale: str, url: str, iterations: int) -> Dict[str, Any]:
+    """Run one case in a freshly spawned process so nothing carries over between cases."""
+    context = multiprocessing.get_context("spawn")
+    receiver, sender = context.Pipe(duplex=False)
+    process = context.Process(target=_isolated_case, args=(sender, case, scale, url, iterations))
+    process.start()
+    sender.close()
+    try:
+        status, payload = receiver.recv()
+    except EOFError:
+        status, payload = "error", "worker exited without a result"
+    finally:
+        receiver.close()
+        process.join()
+    if status != "ok":
+        raise RuntimeError(f"Benchmark case {case}[{scale}] failed (exit code {process.exitcode}): {payload}")
+    return payload
+
+
+def _planned_cases(scales: Sequence[str], cases: Optional[Sequence[str]]) -> List[Tuple[str, str, int]]:
+    planned = []
+    for case, iterations in CASES:
+        if cases and case not in cases:
+            continue
+        for scale in ([scales[0]] if case in _SCALE_INDEPENDENT else scales):
+            rows = SCALES[scale]
+            if case in _FULL_TABLE:
+                if case.startswith("fetch") and rows > FULL_FETCH_MAX_ROWS:
+                    continue
+                iterations_at_scale = max(MIN_ITERATIONS, iterations * SCALES["10k"] // rows)
+            else:
+                iterations_at_scale = iterations
+            planned.append((case, scale, iterations_at_scale))
+    return planned
+
+
+def run_benchmarks(url: Optional[str] = None,
+                   scales: Sequence[str] = ("10k", "1m"),
+                   cases: Optional[Sequence[str]] = None,
+                   database_path: Union[str, Path] = DEFAULT_DATABASE_PATH,
+                   isolate: bool = True) -> Dict[str, Any]:
+    """
+    Run the benchmark suite.
+
+    Args:
+        url: SQLAlchemy URL of a backend that already holds the synthetic
+            tables (default: generate them in a SQLite file at ``database_path``)
+        scales: Table scales to run (``10k``, ``1m``, ``10m``)
+        cases: Subset of case names (default: all)
+        database_path: SQLite file used when ``url`` is not given
+        isolate: Run every case in a fresh process so peak RSS is per case
+
+    Returns:
+        Run document with environment details and one result per case/scale
+    """
+    unknown = [scale for scale in scales if scale not in SCALES]
+    if unknown:
+        raise ValueError(f"Unknown scale(s) {unknown}; expected {sorted(SCALES)}")
+    if url is None:
+        url = f"sqlite:///{prepare_database(database_path, scales)}"
+
+    planned = _planned_cases(list(scales), cases)
+    results = []
+    start = time.perf_counter()
+    if isolate:
+        for case, scale, iterations in planned:
+            results.append(_run_isolated(case, scale, url, iterations))
+            logger.info(_format_result(results[-1]))
+    else:
+        for case, scale, iterations in planned:
+            results.append(run_case(case, scale, url, iterations))
+            logger.info(_format_result(results[-1]))
+
+    import pandas as pd
+    import sqlalchemy as sa
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "backend": sa.engine.make_url(url).render_as_string(hide_password=True),
+        "environment": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": multiprocessing.cpu_count(),
+            "sqlalchemy": sa.__version__,
+            "pandas": pd.__version__,
+            "numpy": np.__version__
+        },
+        "isolated": isolate,
+        "duration_seconds": round(time.perf_counter() - start, 2),
+        "results": results,
+        "integration_id": "cxmidl-orchestration-enterprise"
+    }
+
+
+def _format_result(result: Dict[str, Any]) -> str:
+    throughput = (f"{result['rows_per_second']:,.0f} rows/s" if result["rows_per_second"]
+                  else f"{result['ops_per_second']:,.1f} ops/s")
+    rss = f", peak RSS {result['peak_rss_mb']} MB" if result["peak_rss_mb"] is not None else ""
+    return (f"{result['case']}[{result['scale']}]: p50 {result['p50_ms']:.2f}ms, "
+            f"p99 {result['p99_ms']:.2f}ms, {throughput}{rss}")
+
+
+# Metric -> True when larger is better
+_COMPARED_METRICS = {
+    "p50_ms": False,
+    "p99_ms": False,
+    "ops_per_second": True,
+    "rows_per_second": True,
+    "peak_rss_mb": False
+}
+
+
+def compare_to_baseline(run: Dict[str, Any],
+                        baseline: Dict[str, Any],
+                        tolerance: float = DEFAULT_TOLERANCE) -> Dict[str, Any]:
+    """
+    Compare a run against a baseline run.
+
+    A metric regresses when it is worse than the baseline by more than
+    ``tolerance`` (a fraction, 0.10 = 10%). Cases missing from either side
+    are reported but never flagged, and p99 is skipped for cases where
+    either run took fewer than ``P99_MIN_SAMPLES`` iterations.
+
+    Returns:
+        Per-metric changes plus the lists of regressions and improvements
+    """
+    previous = {(item["case"], item["scale"]): item for item in baseline.get("results", [])}
+    comparisons, regressions, improvements, missing = [], [], [], []
+    for result in run["results"]:
+        key = (result["case"], result["scale"])
+        before = previous.pop(key, None)
+        if before is None:
+            missing.append(f"{key[0]}[{key[1]}]")
+            continue
+        for metric, higher_is_better in _COMPARED_METRICS.items():
+            old, new = before.get(metric), result.get(metric)
+            if not old or new is None:
+                continue
+            if metric == "p99_ms" and min(before.get("iterations", 0), result["iterations"]) < P99_MIN_SAMPLES:
+                continue
+            change = (new - old) / old
+            entry = {"case": key[0], "scale": key[1], "metric": metric,
+                     "baseline": old, "current": new, "change": round(change, 4)}
+            comparisons.append(entry)
+            worse = -change if higher_is_better else change
+            if worse > tolerance:
+                regressions.append(entry)
+            elif worse < -tolerance:
+                improvements.append(entry)
+    missing.extend(f"{case}[{scale}]" for case, scale in previous)
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "baseline_timestamp": baseline.get("timestamp"),
+        "tolerance": tolerance,
+        "comparisons": comparisons,
+        "regressions": regressions,
+        "improvements": improvements,
+        "not_compared": missing,
+        "integration_id": "cxmidl-orchestration-enterprise"
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark CXMIDLOrchestrationConnector against a local backend")
+    parser.add_argument("--url", help="SQLAlchemy URL of a backend holding the synthetic tables")
+    parser.add_argument("--database-path", default=str(DEFAULT_DATABASE_PATH),
+                        help="SQLite file for the generated tables (when --url is not given)")
+    parser.add_argument("--scales", default="10k,1m", help="Comma-separated scales: 10k, 1m, 10m")
+    parser.add_argument("--cases", help="Comma-separated subset of cases")
+    parser.add_argument("--output", help="Write the run document to this JSON file")
+    parser.add_argument("--baseline", help="Compare against this baseline JSON and fail on regressions")
+    parser.add_argument("--save-baseline", help="Write the run as a new baseline JSON")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed relative slowdown before a metric is a regression")
+    parser.add_argument("--no-isolate", action="store_true", help="Run all cases in this process")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO)
+    run = run_benchmarks(
+        url=args.url,
+        scales=[scale.strip().lower() for scale in args.scales.split(",") if scale.strip()],
+        cases=[case.strip() for case in args.cases.split(",")] if args.cases else None,
+        database_path=args.database_path,
+        isolate=not args.no_isolate
+    )
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            Path(path).write_text(json.dumps(run, indent=2), encoding="utf-8")
+
+    if args.baseline:
+        comparison = compare_to_baseline(run, json.loads(Path(args.baseline).read_text(encoding="utf-8")),
+                                         tolerance=args.tolerance)
+        for entry in comparison["regressions"]:
+            print(f"REGRESSION {entry['case']}[{entry['scale']}] {entry['metric']}: "
+                  f"{entry['baseline']} -> {entry['current']} ({entry['change']:+.1%})")
+        for entry in comparison["improvements"]:
+            print(f"improved   {entry['case']}[{entry['scale']}] {entry['metric']}: "
+                  f"{entry['baseline']} -> {entry['current']} ({entry['change']:+.1%})")
+        return 1 if comparison["regressions"] else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,486 @@
+"""
+CXMIDL Orchestration Schema Catalog Snapshot
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+This module keeps an indexed local SQLite copy of the Orchestration catalog
+(sys.objects, sys.sql_modules, sys.columns, sys.indexes and
+sys.sql_expression_dependencies). The snapshot is pulled in a handful of
+bulk queries, refreshed incrementally by ``modify_date``, and answers
+definition, column and dependency lookups offline.
+"""
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+
+from cxmidl_connector import CXMIDLOrchestrationConnector
+from cxmidl_dialects import require_sql_server
+
+logger = logging.getLogger(__name__)
+
+# Above this many changed objects a refresh re-reads everything instead of
+# filtering by object_id (one scan beats many IN-list queries)
+FULL_REFRESH_THRESHOLD = 500
+OBJECT_ID_CHUNK = 900
+
+_SCHEMA_DDL = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+CREATE TABLE IF NOT EXISTS objects (
+    object_id INTEGER PRIMARY KEY,
+    schema_name TEXT NOT NULL,
+    name TEXT NOT NULL,
+    type TEXT NOT NULL,
+    type_desc TEXT,
+    parent_object_id INTEGER,
+    create_date TEXT,
+    modify_date TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_objects_name ON objects (name COLLATE NOCASE, schema_name COLLATE NOCASE);
+CREATE INDEX IF NOT EXISTS ix_objects_type ON objects (type);
+CREATE TABLE IF NOT EXISTS modules (
+    object_id INTEGER PRIMARY KEY,
+    definition TEXT,
+    definition_hash TEXT
+);
+CREATE TABLE IF NOT EXISTS columns (
+    object_id INTEGER NOT NULL,
+    column_id INTEGER NOT NULL,
+    name TEXT NOT NULL,
+    type_name TEXT,
+    max_length INTEGER,
+    precision INTEGER,
+    scale INTEGER,
+    is_nullable INTEGER,
+    is_identity INTEGER,
+    PRIMARY KEY (object_id, column_id)
+);
+CREATE TABLE IF NOT EXISTS indexes (
+    object_id INTEGER NOT NULL,
+    index_id INTEGER NOT NULL,
+    name TEXT,
+    type_desc TEXT,
+    is_unique INTEGER,
+    is_primary_key INTEGER,
+    key_columns TEXT,
+    included_columns TEXT,
+    PRIMARY KEY (object_id, index_id)
+);
+CREATE TABLE IF NOT EXISTS dependencies (
+    referencing_id INTEGER NOT NULL,
+    referenced_id INTEGER,
+    referenced_schema TEXT,
+    referenced_entity TEXT,
+    referenced_database TEXT,
+    is_ambiguous INTEGER
+);
+-- Snapshots written before the unique index existed may hold duplicated rows
+DELETE FROM dependencies WHERE rowid NOT IN (
+    SELECT MIN(rowid) FROM dependencies
+    GROUP BY referencing_id, referenced_id, referenced_schema, referenced_entity, referenced_database
+);
+CREATE UNIQUE INDEX IF NOT EXISTS ux_dependencies ON dependencies (
+    referencing_id, IFNULL(referenced_id, -1), IFNULL(referenced_schema, ''),
+    IFNULL(referenced_entity, ''), IFNULL(referenced_database, '')
+);
+CREATE INDEX IF NOT EXISTS ix_dependencies_referencing ON dependencies (referencing_id);
+CREATE INDEX IF NOT EXISTS ix_dependencies_referenced ON dependencies (referenced_id);
+CREATE INDEX IF NOT EXISTS ix_dependencies_entity ON dependencies (referenced_entity COLLATE NOCASE);
+"""
+
+OBJECTS_QUERY = """
+SELECT
+    o.object_id,
+    SCHEMA_NAME(o.schema_id) as schema_name,
+    o.name,
+    RTRIM(o.type) as type,
+    o.type_desc,
+    o.parent_object_id,
+    o.create_date,
+    o.modify_date
+FROM sys.objects o
+WHERE o.is_ms_shipped = 0
+"""
+
+MODULES_QUERY = """
+SELECT m.object_id, m.definition
+FROM sys.sql_modules m
+JOIN sys.objects o ON o.object_id = m.object_id
+WHERE o.is_ms_shipped = 0 {filter}
+"""
+
+COLUMNS_QUERY = """
+SELECT
+    c.object_id,
+    c.column_id,
+    c.name,
+    TYPE_NAME(c.user_type_id) as type_name,
+    c.max_length,
+    c.precision,
+    c.scale,
+    c.is_nullable,
+    c.is_identity
+FROM sys.columns c
+JOIN sys.objects o ON o.object_id = c.object_id
+WHERE o.is_ms_shipped = 0 {filter}
+"""
+
+INDEXES_QUERY = """
+SELECT
+    i.object_id,
+    i.index_id,
+    i.name,
+    i.type_desc,
+    i.is_unique,
+    i.is_primary_key,
+    (SELECT STRING_AGG(c.name, ', ') WITHIN GROUP (ORDER BY ic.key_ordinal)
+     FROM sys.index_columns ic
+     JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+     WHERE ic.object_id = i.object_id AND ic.index_id = i.index_id AND ic.is_included_column = 0) as key_columns,
+    (SELECT STRING_AGG(c.name, ', ') WITHIN GROUP (ORDER BY ic.index_column_id)
+     FROM sys.index_columns ic
+     JOIN sys.columns c ON c.object_id = ic.object_id AND c.column_id = ic.column_id
+     WHERE ic.object_id = i.object_id AND ic.index_id = i.index_id AND ic.is_included_column = 1) as included_columns
+FROM sys.indexes i
+JOIN sys.objects o ON o.object_id = i.object_id
+WHERE o.is_ms_shipped = 0 AND i.type > 0 {filter}
+"""
+
+DEPENDENCIES_QUERY = """
+SELECT
+    d.referencing_id,
+    d.referenced_id,
+    d.referenced_schema_name as referenced_schema,
+    d.referenced_entity_name as referenced_entity,
+    d.referenced_database_name as referenced_database,
+    d.is_ambiguous
+FROM sys.sql_expression_dependencies d
+JOIN sys.objects o ON o.object_id = d.referencing_id
+WHERE o.is_ms_shipped = 0 {filter}
+"""
+
+
+def _timestamp(value: Any) -> Optional[str]:
+    """ISO text for datetimes coming back from the catalog."""
+    if value is None:
+        return None
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _chunks(values: List[int], size: int) -> Iterable[List[int]]:
+    for offset in range(0, len(values), size):
+        yield values[offset:offset + size]
+
+
+class CatalogSnapshot:
+    """Indexed local SQLite snapshot of the Orchestration catalog."""
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        """
+        Open (or create) a snapshot store.
+
+        Args:
+            path: SQLite file for the snapshot (default: in-memory)
+        """
+        self.path = str(path)
+        if self.path != ":memory:":
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.executescript(_SCHEMA_DDL)
+        self._lock = threading.Lock()
+
+    # ------------------------------------------------------------------
+    # Refresh
+    # ------------------------------------------------------------------
+
+    def refresh(self,
+                connector: CXMIDLOrchestrationConnector,
+                full: bool = False) -> Dict[str, Any]:
+        """
+        Bring the snapshot up to date with the server.
+
+        sys.objects is always read (it is small); modules, columns, indexes
+        and dependencies are re-fetched only for objects that are new or
+        whose ``modify_date`` changed. The detail queries run in parallel.
+
+        Args:
+            connector: Orchestration connector
+            full: Re-fetch every object regardless of ``modify_date``
+
+        Returns:
+            Refresh summary with changed/removed counts and timing
+        """
+        require_sql_server(connector, "Catalog snapshots")
+        start = time.perf_counter()
+        remote = connector.execute_query(OBJECTS_QUERY, return_dataframe=False)
+        remote_by_id = {row["object_id"]: row for row in remote}
+
+        with self._lock:
+            local = dict(self._db.execute("SELECT object_id, modify_date FROM objects").fetchall())
+
+        removed = [object_id for object_id in local if object_id not in remote_by_id]
+        if full or not local:
+            changed = list(remote_by_id)
+        else:
+            changed = [
+                object_id for object_id, row in remote_by_id.items()
+                if local.get(object_id) != _timestamp(row["modify_date"])
+            ]
+
+        details = {"modules": [], "columns": [], "indexes": [], "dependencies": []}
+        if changed:
+            queries = [MODULES_QUERY, COLUMNS_QUERY, INDEXES_QUERY, DEPENDENCIES_QUERY]
+            if len(changed) > FULL_REFRESH_THRESHOLD or len(changed) == len(remote_by_id):
+                filters = [""]
+            else:
+                filters = [
+                    f"AND o.object_id IN ({', '.join(str(int(object_id)) for object_id in chunk)})"
+                    for chunk in _chunks(changed, OBJECT_ID_CHUNK)
+                ]
+            batch = [(query.format(filter=object_filter), None) for object_filter in filters for query in queries]
+            results = connector.execute_many(batch, return_dataframe=False)
+            failures = [item["error"] for item in results if not item["success"]]
+            if failures:
+                raise RuntimeError(f"Catalog refresh failed: {failures[0]}")
+            for index, item in enumerate(results):
+                details[list(details)[index % len(queries)]].extend(item["result"])
+
+        self._apply(remote_by_id, changed, removed, details, connector)
+
+        duration = time.perf_counter() - start
+        summary = {
+            "timestamp": datetime.now().isoformat(),
+            "server": connector.server,
+            "database": connector.database,
+            "objects": len(remote_by_id),
+            "changed": len(changed),
+            "removed": len(removed),
+            "duration_seconds": round(duration, 3),
+            "integration_id": connector.integration_id
+        }
+        logger.info(
+            f"Catalog snapshot refreshed in {duration:.2f}s: {len(remote_by_id)} objects, "
+            f"{len(changed)} changed, {len(removed)} removed"
+        )
+        return summary
+
+    def _apply(self,
+               remote_by_id: Dict[int, Dict[str, Any]],
+               changed: List[int],
+               removed: List[int],
+               details: Dict[str, List[Dict[str, Any]]],
+               connector: CXMIDLOrchestrationConnector):
+        """Replace changed/removed objects in one transaction."""
+        stale = [(object_id,) for object_id in changed + removed]
+        # Above FULL_REFRESH_THRESHOLD the details were read for every object;
+        # keep only the changed ones so unchanged objects are not duplicated
+        wanted = set(changed)
+        details = {
+            name: [row for row in rows if row["referencing_id" if name == "dependencies" else "object_id"] in wanted]
+            for name, rows in details.items()
+        }
+        with self._lock, self._db:
+            self._db.executemany("DELETE FROM objects WHERE object_id = ?", stale)
+            self._db.executemany("DELETE FROM modules WHERE object_id = ?", stale)
+            self._db.executemany("DELETE FROM columns WHERE object_id = ?", stale)
+            self._db.executemany("DELETE FROM indexes WHERE object_id = ?", stale)
+            self._db.executemany("DELETE FROM dependencies WHERE referencing_id = ?", stale)
+
+            self._db.executemany(
+                "INSERT INTO objects VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (row["object_id"], row["schema_name"], row["name"], row["type"], row["type_desc"],
+                     row["parent_object_id"], _timestamp(row["create_date"]), _timestamp(row["modify_date"]))
+                    for row in (remote_by_id[object_id] for object_id in changed)
+                ]
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO modules VALUES (?, ?, ?)",
+                [
+                    (row["object_id"], row["definition"],
+                     hashlib.sha256((row["definition"] or "").encode("utf-8")).hexdigest())
+                    for row in details["modules"]
+                ]
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO columns VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (row["object_id"], row["column_id"], row["name"], row["type_name"], row["max_length"],
+                     row["precision"], row["scale"], int(bool(row["is_nullable"])), int(bool(row["is_identity"])))
+                    for row in details["columns"]
+                ]
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO indexes VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (row["object_id"], row["index_id"], row["name"], row["type_desc"],
+                     int(bool(row["is_unique"])), int(bool(row["is_primary_key"])),
+                     row["key_columns"], row["included_columns"])
+                    for row in details["indexes"]
+                ]
+            )
+            self._db.executemany(
+                "INSERT OR IGNORE INTO dependencies VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (row["referencing_id"], row["referenced_id"], row["referenced_schema"],
+                     row["referenced_entity"], row["referenced_database"], int(bool(row["is_ambiguous"])))
+                    for row in details["dependencies"]
+                ]
+            )
+            self._db.executemany(
+                "INSERT OR REPLACE INTO meta VALUES (?, ?)",
+                [
+                    ("server", connector.server),
+                    ("database", connector.database),
+                    ("last_refresh", datetime.now().isoformat())
+                ]
+            )
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def _query(self, sql: str, params: Tuple = ()) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [dict(row) for row in self._db.execute(sql, params).fetchall()]
+
+    def find_object(self, name: str, schema: Optional[str] = None) -> Optional[Dict[str, Any]]:
+        """
+        Resolve an object by ``name`` or ``schema.name`` (case-insensitive).
+
+        Returns:
+            Object row (object_id, schema_name, name, type, ...) or None
+        """
+        if schema is None and "." in name:
+            schema, name = name.split(".", 1)
+        name = name.strip("[]")
+        if schema is not None:
+            rows = self._query(
+                "SELECT * FROM objects WHERE name = ? COLLATE NOCASE AND schema_name = ? COLLATE NOCASE",
+                (name, schema.strip("[]"))
+            )
+        else:
+            rows = self._query("SELECT * FROM objects WHERE name = ? COLLATE NOCASE", (name,))
+        return rows[0] if rows else None
+
+    def _object_id(self, name: Union[str, int], schema: Optional[str] = None) -> Optional[int]:
+        if isinstance(name, int):
+            return name
+        found = self.find_object(name, schema)
+        return found["object_id"] if found else None
+
+    def list_objects(self, object_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """All objects, optionally filtered by sys.objects type code (e.g. 'P', 'U', 'V')."""
+        if object_type:
+            return self._query(
+                "SELECT * FROM objects WHERE type = ? ORDER BY schema_name, name", (object_type,)
+            )
+        return self._query("SELECT * FROM objects ORDER BY schema_name, name")
+
+    def get_definition(self, name: Union[str, int], schema: Optional[str] = None) -> Optional[str]:
+        """SQL definition of a procedure, view, function or trigger."""
+        object_id = self._object_id(name, schema)
+        rows = self._query("SELECT definition FROM modules WHERE object_id = ?", (object_id,))
+        return rows[0]["definition"] if rows else None
+
+    def get_definitions(self, object_type: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Definitions with their hashes, optionally filtered by object type."""
+        sql = (
+            "SELECT o.object_id, o.schema_name, o.name, o.type, o.modify_date, m.definition, m.definition_hash "
+            "FROM modules m JOIN objects o ON o.object_id = m.object_id"
+        )
+        if object_type:
+            return self._query(sql + " WHERE o.type = ? ORDER BY o.schema_name, o.name", (object_type,))
+        return self._query(sql + " ORDER BY o.schema_name, o.name")
+
+    def get_columns(self, name: Union[str, int], schema: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Columns of a table, view or table-valued function in ordinal order."""
+        object_id = self._object_id(name, schema)
+        return self._query("SELECT * FROM columns WHERE object_id = ? ORDER BY column_id", (object_id,))
+
+    def get_indexes(self, name: Union[str, int], schema: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Indexes of a table or view."""
+        object_id = self._object_id(name, schema)
+        return self._query("SELECT * FROM indexes WHERE object_id = ? ORDER BY index_id", (object_id,))
+
+    def get_dependencies(self, name: Union[str, int], schema: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Objects referenced by an object (what it depends on)."""
+        object_id = self._object_id(name, schema)
+        return self._query(
+            "SELECT d.*, o.type as referenced_type FROM dependencies d "
+            "LEFT JOIN objects o ON o.object_id = d.referenced_id "
+            "WHERE d.referencing_id = ? ORDER BY d.referenced_schema, d.referenced_entity",
+            (object_id,)
+        )
+
+    def get_dependents(self, name: Union[str, int], schema: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Objects that reference an object (what depends on it)."""
+        object_id = self._object_id(name, schema)
+        return self._query(
+            "SELECT o.* FROM dependencies d JOIN objects o ON o.object_id = d.referencing_id "
+            "WHERE d.referenced_id = ? ORDER BY o.schema_name, o.name",
+            (object_id,)
+        )
+
+    def dependency_edges(self) -> List[Tuple[int, int]]:
+        """All resolved (referencing_id, referenced_id) pairs within the database."""
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT DISTINCT referencing_id, referenced_id FROM dependencies "
+                "WHERE referenced_id IS NOT NULL AND referenced_database IS NULL"
+            ).fetchall()
+        return [(row[0], row[1]) for row in rows]
+
+    def statistics(self) -> Dict[str, Any]:
+        """Object counts by type plus snapshot metadata."""
+        with self._lock:
+            by_type = dict(self._db.execute("SELECT type, COUNT(*) FROM objects GROUP BY type").fetchall())
+            meta = dict(self._db.execute("SELECT key, value FROM meta").fetchall())
+            dependencies = self._db.execute("SELECT COUNT(*) FROM dependencies").fetchone()[0]
+        return {
+            "path": self.path,
+            "objects_by_type": by_type,
+            "objects": sum(by_type.values()),
+            "dependencies": dependencies,
+            **meta
+        }
+
+    def close(self):
+        """Close the snapshot store."""
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+def create_catalog_snapshot(connector: CXMIDLOrchestrationConnector,
+                            path: Union[str, Path],
+                            refresh: bool = True) -> CatalogSnapshot:
+    """
+    Open a catalog snapshot and (optionally) bring it up to date.
+
+    Args:
+        connector: Orchestration connector
+        path: SQLite snapshot file
+        refresh: Refresh from the server before returning
+
+    Returns:
+        CatalogSnapshot instance
+    """
+    snapshot = CatalogSnapshot(path)
+    if refresh:
+        snapshot.refresh(connector)
+    return snapshot
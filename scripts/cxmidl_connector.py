@@ -6,23 +6,1180 @@ Version: 1.0.0 UNNILNILIUM
 This module provides enterprise-grade connectivity to the CXMIDL Azure SQL Server
 Orchestration database with MFA support, advanced security, monitoring, and 
 integration capabilities.
+
+Heavy dependencies (SQLAlchemy and the ODBC driver, pandas, numpy, pyarrow,
+azure-identity) are imported on first use, so importing the module or
+building a connection string stays cheap for CLI wrappers and probes.
 """
 
-import pyodbc
-import sqlalchemy as sa
-from sqlalchemy import create_engine, text
-from azure.identity import DefaultAzureCredential, ChainedTokenCredential, ManagedIdentityCredential, InteractiveBrowserCredential
-import pandas as pd
+from __future__ import annotations
+
+import functools
+import importlib
+import itertools
 import logging
-from typing import Optional, Dict, Any, List, Union
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, nullcontext
+from typing import Optional, Dict, Any, List, Union, Tuple, Iterator, Callable
 from datetime import datetime
 import json
+import base64
+import copy
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import struct
+import decimal
+import uuid
+from datetime import date, time as dt_time
 from pathlib import Path
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+from cxmidl_dialects import DialectAdapter, get_dialect_adapter, positional_placeholders
+
 logger = logging.getLogger(__name__)
 
+
+class _LazyModule:
+    """Module proxy that imports ``name`` on first attribute access."""
+    
+    def __init__(self, name: str):
+        self._name = name
+        self._module = None
+    
+    def __getattr__(self, attribute: str) -> Any:
+        module = self._module
+        if module is None:
+            module = self._module = importlib.import_module(self._name)
+        return getattr(module, attribute)
+    
+    def __repr__(self) -> str:
+        state = "loaded" if self._module is not None else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+sa = _LazyModule("sqlalchemy")
+np = _LazyModule("numpy")
+pd = _LazyModule("pandas")
+pa = _LazyModule("pyarrow")
+
+# ODBC pre-connect attribute for passing an AAD access token (msodbcsql.h)
+SQL_COPT_SS_ACCESS_TOKEN = 1256
+AZURE_SQL_TOKEN_SCOPE = "https://database.windows.net/.default"
+
+# Process-wide engine pools keyed by (server, database, auth method)
+_ENGINE_POOLS: Dict[Tuple[str, str, str], "_PooledEngine"] = {}
+_ENGINE_POOLS_LOCK = threading.Lock()
+
+
+class _PooledEngine:
+    """Shared SQLAlchemy engine plus checkout statistics for one pool key."""
+
+    def __init__(self, engine: sa.engine.Engine):
+        self.engine = engine
+        self.created_at = datetime.now()
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_checkout(self, wait_seconds: float):
+        """Record the time spent waiting for a pooled connection."""
+        with self._lock:
+            self.checkouts += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+    def statistics(self) -> Dict[str, Any]:
+        """Snapshot of pool occupancy and checkout wait times."""
+        pool = self.engine.pool
+        with self._lock:
+            checkouts = self.checkouts
+            total_wait = self.total_wait_seconds
+            max_wait = self.max_wait_seconds
+
+        def _pool_value(name: str) -> Optional[int]:
+            method = getattr(pool, name, None)
+            return method() if callable(method) else None
+
+        return {
+            "pool_class": type(pool).__name__,
+            "pool_size": _pool_value("size"),
+            "checked_out": _pool_value("checkedout"),
+            "idle": _pool_value("checkedin"),
+            "overflow": _pool_value("overflow"),
+            "checkouts": checkouts,
+            "total_wait_seconds": round(total_wait, 6),
+            "avg_wait_seconds": round(total_wait / checkouts, 6) if checkouts else 0.0,
+            "max_wait_seconds": round(max_wait, 6),
+            "created_at": self.created_at.isoformat()
+        }
+
+
+class _AccessTokenCache:
+    """
+    AAD access token for Azure SQL, cached in memory and refreshed before expiry.
+    
+    The token is fetched once from the credential and reused for every new
+    pooled connection. A daemon timer refreshes it ``refresh_margin`` seconds
+    before it expires. When ``cache_path`` and a Fernet key are given, the
+    token is also kept encrypted on disk so short-lived processes can skip
+    the credential round trip entirely.
+    """
+    
+    def __init__(self,
+                 credential_provider: Callable[[], Any],
+                 scope: str = AZURE_SQL_TOKEN_SCOPE,
+                 refresh_margin: int = 300,
+                 background_refresh: bool = True,
+                 cache_path: Optional[Union[str, Path]] = None,
+                 encryption_key: Optional[bytes] = None):
+        """
+        Args:
+            credential_provider: Returns an object with ``get_token(scope)``
+                (any azure-identity credential, or a fake in tests)
+            scope: Token scope
+            refresh_margin: Seconds before expiry at which to refresh
+            background_refresh: Refresh proactively on a daemon timer
+            cache_path: Optional encrypted on-disk token cache file
+            encryption_key: Fernet key for the disk cache
+                (default: ``CXMIDL_TOKEN_CACHE_KEY`` environment variable)
+        """
+        self._credential_provider = credential_provider
+        self.scope = scope
+        self.refresh_margin = refresh_margin
+        self.background_refresh = background_refresh
+        self.cache_path = Path(cache_path) if cache_path else None
+        self._fernet = self._create_fernet(encryption_key) if self.cache_path else None
+        self._lock = threading.Lock()
+        self._token: Optional[str] = None
+        self._expires_on = 0.0
+        self._timer: Optional[threading.Timer] = None
+        self.acquisitions = 0
+    
+    def _create_fernet(self, encryption_key: Optional[bytes]):
+        """Fernet instance for the disk cache, or None if it cannot be enabled."""
+        key = encryption_key or os.environ.get("CXMIDL_TOKEN_CACHE_KEY")
+        if not key:
+            logger.warning("Token disk cache disabled: no encryption key (set CXMIDL_TOKEN_CACHE_KEY)")
+            return None
+        try:
+            from cryptography.fernet import Fernet
+            return Fernet(key)
+        except Exception as e:
+            logger.warning(f"Token disk cache disabled: {e}")
+            return None
+    
+    @property
+    def expires_on(self) -> float:
+        """Expiry of the cached token as a POSIX timestamp (0 if none)."""
+        return self._expires_on
+    
+    def _is_fresh(self, now: float) -> bool:
+        return self._token is not None and now < self._expires_on - self.refresh_margin
+    
+    def get_token(self) -> str:
+        """Return a valid access token, acquiring or refreshing it if needed."""
+        now = time.time()
+        if self._is_fresh(now):
+            return self._token
+        with self._lock:
+            if not self._is_fresh(time.time()):
+                if not self._load_from_disk():
+                    self._acquire()
+            return self._token
+    
+    def token_struct(self) -> bytes:
+        """Token packed for SQL_COPT_SS_ACCESS_TOKEN (length-prefixed UTF-16-LE)."""
+        token_bytes = self.get_token().encode("utf-16-le")
+        return struct.pack(f"<I{len(token_bytes)}s", len(token_bytes), token_bytes)
+    
+    def _acquire(self):
+        """Fetch a new token from the credential (lock held)."""
+        access_token = self._credential_provider().get_token(self.scope)
+        self._token = access_token.token
+        self._expires_on = float(access_token.expires_on)
+        self.acquisitions += 1
+        logger.info(f"Acquired Azure SQL access token valid until {datetime.fromtimestamp(self._expires_on).isoformat()}")
+        self._save_to_disk()
+        self._schedule_refresh()
+    
+    def _schedule_refresh(self):
+        """Arm the background refresh timer for the current token (lock held)."""
+        if not self.background_refresh:
+            return
+        if self._timer is not None:
+            self._timer.cancel()
+        delay = max(1.0, self._expires_on - self.refresh_margin - time.time())
+        self._timer = threading.Timer(delay, self._background_refresh)
+        self._timer.daemon = True
+        self._timer.start()
+    
+    def _background_refresh(self):
+        """Timer callback: refresh the token, retrying shortly on failure."""
+        try:
+            with self._lock:
+                self._acquire()
+        except Exception as e:
+            logger.error(f"Background access token refresh failed: {e}")
+            with self._lock:
+                self._timer = threading.Timer(30.0, self._background_refresh)
+                self._timer.daemon = True
+                self._timer.start()
+    
+    def _load_from_disk(self) -> bool:
+        """Load a still-fresh token from the encrypted disk cache (lock held)."""
+        if self._fernet is None or not self.cache_path.exists():
+            return False
+        try:
+            payload = json.loads(self._fernet.decrypt(self.cache_path.read_bytes()))
+            if payload.get("scope") != self.scope:
+                return False
+            self._token = payload["token"]
+            self._expires_on = float(payload["expires_on"])
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable token cache {self.cache_path}: {e}")
+            return False
+        if not self._is_fresh(time.time()):
+            return False
+        logger.info("Loaded Azure SQL access token from encrypted disk cache")
+        self._schedule_refresh()
+        return True
+    
+    def _save_to_disk(self):
+        """Write the current token to the encrypted disk cache (lock held)."""
+        if self._fernet is None:
+            return
+        try:
+            payload = json.dumps({"scope": self.scope, "token": self._token, "expires_on": self._expires_on})
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(self.cache_path.suffix + ".tmp")
+            tmp_path.write_bytes(self._fernet.encrypt(payload.encode("utf-8")))
+            os.chmod(tmp_path, 0o600)
+            os.replace(tmp_path, self.cache_path)
+        except Exception as e:
+            logger.warning(f"Failed to write token cache {self.cache_path}: {e}")
+    
+    def stop(self):
+        """Cancel the background refresh timer."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+
+_SQL_WHITESPACE_PATTERN = re.compile(r"('(?:[^']|'')*')|\s+")
+
+
+def _normalize_sql(query: str) -> str:
+    """Collapse whitespace outside string literals so formatting-only differences match."""
+    return _SQL_WHITESPACE_PATTERN.sub(lambda m: m.group(1) or " ", query).strip()
+
+
+# Tagged JSON for row values that json cannot represent natively
+_JSON_VALUE_TYPES = {
+    "datetime": (datetime, datetime.isoformat, datetime.fromisoformat),
+    "date": (date, date.isoformat, date.fromisoformat),
+    "time": (dt_time, dt_time.isoformat, dt_time.fromisoformat),
+    "decimal": (decimal.Decimal, str, decimal.Decimal),
+    "uuid": (uuid.UUID, str, uuid.UUID),
+    "bytes": ((bytes, bytearray, memoryview),
+              lambda value: base64.b64encode(bytes(value)).decode("ascii"), base64.b64decode)
+}
+
+
+def _encode_json_value(value: Any) -> Any:
+    """``json.dumps`` default hook: tag non-JSON row values with their type."""
+    # datetime is a date subclass, so it has to be matched first (dict order)
+    for tag, (types, encode, _) in _JSON_VALUE_TYPES.items():
+        if isinstance(value, types):
+            return {"__cxmidl_type__": tag, "value": encode(value)}
+    raise TypeError(f"Cannot cache value of type {type(value).__name__}")
+
+
+def _decode_json_value(obj: Dict[str, Any]) -> Any:
+    """``json.loads`` object hook reversing ``_encode_json_value``."""
+    tag = obj.get("__cxmidl_type__")
+    if tag in _JSON_VALUE_TYPES and len(obj) == 2:
+        return _JSON_VALUE_TYPES[tag][2](obj["value"])
+    return obj
+
+
+def _serialize_result(value: Any) -> Tuple[str, bytes]:
+    """
+    Encode a cached result for the on-disk store without pickle.
+    
+    DataFrames are written as an Arrow IPC stream (pandas metadata keeps the
+    index and categorical columns); row lists as tagged JSON.
+    """
+    if isinstance(value, pd.DataFrame):
+        sink = pa.BufferOutputStream()
+        table = pa.Table.from_pandas(value)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return "arrow", sink.getvalue().to_pybytes()
+    return "json", json.dumps(value, default=_encode_json_value).encode("utf-8")
+
+
+def _deserialize_result(encoding: str, payload: bytes) -> Any:
+    """Decode a value written by ``_serialize_result``."""
+    if encoding == "arrow":
+        return pa.ipc.open_stream(payload).read_all().to_pandas()
+    if encoding == "json":
+        return json.loads(payload.decode("utf-8"), object_hook=_decode_json_value)
+    raise ValueError(f"Unknown result cache encoding '{encoding}'")
+
+
+class _QueryResultCache:
+    """
+    TTL + LRU cache of query results keyed on normalized SQL, params and database.
+    
+    Entries live in a size-bounded in-memory LRU. With ``path`` set, entries
+    are also written to a SQLite file so other processes (CLI probes,
+    dashboards) can reuse them until they expire. The file holds Arrow IPC
+    and JSON payloads only, never pickles, so reading it cannot run code.
+    """
+    
+    def __init__(self,
+                 default_ttl: float = 300,
+                 max_entries: int = 256,
+                 path: Optional[Union[str, Path]] = None):
+        self.default_ttl = default_ttl
+        self.max_entries = max_entries
+        self.path = Path(path) if path else None
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if self.path:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with self._disk() as db:
+                # query_cache held pickled values; they are dropped, not loaded
+                db.execute("DROP TABLE IF EXISTS query_cache")
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS query_results ("
+                    "cache_key TEXT PRIMARY KEY, query TEXT, expires_at REAL, encoding TEXT, value BLOB)"
+                )
+    
+    @contextmanager
+    def _disk(self) -> Iterator[sqlite3.Connection]:
+        """Short-lived connection to the on-disk store, committed and closed on exit."""
+        db = sqlite3.connect(str(self.path), timeout=10)
+        try:
+            with db:
+                yield db
+        finally:
+            db.close()
+    
+    @staticmethod
+    def make_key(database: str,
+                 query: str,
+                 params: Optional[Dict[str, Any]],
+                 return_dataframe: Union[bool, str]) -> str:
+        """Stable cache key for a query execution (``return_dataframe`` is the result mode)."""
+        payload = json.dumps(
+            [database, _normalize_sql(query), params or {}, return_dataframe],
+            sort_keys=True, default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+    
+    @staticmethod
+    def _copy(value: Any) -> Any:
+        """Defensive copy so callers cannot mutate cached results."""
+        if isinstance(value, pd.DataFrame):
+            return value.copy()
+        if isinstance(value, list):
+            return [dict(row) for row in value]
+        return value
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Cached value for ``key`` or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._copy(entry[1])
+                del self._entries[key]
+        
+        if self.path:
+            with self._disk() as db:
+                row = db.execute(
+                    "SELECT expires_at, encoding, value FROM query_results WHERE cache_key = ?", (key,)
+                ).fetchone()
+            if row is not None and row[0] > now:
+                value = _deserialize_result(row[1], row[2])
+                with self._lock:
+                    self._store(key, row[0], value)
+                    self.hits += 1
+                return self._copy(value)
+        
+        with self._lock:
+            self.misses += 1
+        return None
+    
+    def put(self, key: str, value: Any, ttl: Optional[float] = None, query: str = ""):
+        """Store a result for ``ttl`` seconds (default TTL when None)."""
+        expires_at = time.time() + (self.default_ttl if ttl is None else ttl)
+        value = self._copy(value)
+        with self._lock:
+            self._store(key, expires_at, value)
+        if self.path:
+            try:
+                encoding, payload = _serialize_result(value)
+            except (TypeError, ValueError, pa.ArrowException) as e:
+                # Still cached in memory; only the cross-process copy is skipped
+                logger.warning(f"Result not written to the disk cache: {e}")
+                return
+            with self._disk() as db:
+                db.execute(
+                    "INSERT OR REPLACE INTO query_results (cache_key, query, expires_at, encoding, value) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (key, _normalize_sql(query), expires_at, encoding, payload)
+                )
+    
+    def _store(self, key: str, expires_at: float, value: Any):
+        """Insert into the in-memory LRU, evicting the oldest entries (lock held)."""
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+    
+    def invalidate(self, key: Optional[str] = None) -> int:
+        """Drop one entry (or all entries when ``key`` is None); returns entries removed."""
+        with self._lock:
+            if key is None:
+                removed = len(self._entries)
+                self._entries.clear()
+            else:
+                removed = 1 if self._entries.pop(key, None) is not None else 0
+        if self.path:
+            with self._disk() as db:
+                if key is None:
+                    removed = max(removed, db.execute("DELETE FROM query_results").rowcount)
+                else:
+                    removed = max(removed, db.execute("DELETE FROM query_results WHERE cache_key = ?", (key,)).rowcount)
+        return removed
+    
+    def statistics(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "default_ttl": self.default_ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+                "disk_path": str(self.path) if self.path else None
+            }
+
+
+_SQL_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+
+# Latency histogram bucket upper bounds in seconds (Prometheus-style, cumulative)
+_LATENCY_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 600.0, float("inf")
+)
+_QUERY_PHASES = ("acquire", "execute", "fetch", "convert")
+
+
+def _query_shape(query: str) -> str:
+    """Query text with literals replaced by ``?`` and whitespace normalized."""
+    return _SQL_LITERAL_PATTERN.sub("?", _normalize_sql(query))
+
+
+def _query_fingerprint(query: str) -> str:
+    """Short stable id for a query shape."""
+    return hashlib.sha1(_query_shape(query).encode("utf-8")).hexdigest()[:16]
+
+
+class _LatencyHistogram:
+    """Fixed-bucket latency histogram with percentile estimation."""
+    
+    def __init__(self):
+        self.counts = [0] * len(_LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+    
+    def observe(self, seconds: float):
+        for index, bound in enumerate(_LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[index] += 1
+                break
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+    
+    def percentile(self, fraction: float) -> float:
+        """Estimate a percentile by linear interpolation inside its bucket."""
+        if not self.count:
+            return 0.0
+        rank = fraction * self.count
+        seen = 0
+        lower = 0.0
+        for bound, bucket_count in zip(_LATENCY_BUCKETS, self.counts):
+            if bucket_count and seen + bucket_count >= rank:
+                upper = min(bound, self.max)
+                return lower + (upper - lower) * max(0.0, rank - seen) / bucket_count
+            seen += bucket_count
+            lower = bound
+        return self.max
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "sum_seconds": round(self.total, 6),
+            "mean_seconds": round(self.total / self.count, 6) if self.count else 0.0,
+            "p50_seconds": round(self.percentile(0.50), 6),
+            "p90_seconds": round(self.percentile(0.90), 6),
+            "p99_seconds": round(self.percentile(0.99), 6),
+            "max_seconds": round(self.max, 6)
+        }
+
+
+class _QueryMetrics:
+    """Per-fingerprint phase histograms and transfer counters for a connector."""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._queries: Dict[str, Dict[str, Any]] = {}
+    
+    def record(self,
+               query: str,
+               phases: Dict[str, float],
+               rows: int = 0,
+               nbytes: int = 0,
+               error: bool = False):
+        """Record one execution's phase timings, rows and bytes."""
+        shape = _query_shape(query)
+        fingerprint = hashlib.sha1(shape.encode("utf-8")).hexdigest()[:16]
+        with self._lock:
+            entry = self._queries.get(fingerprint)
+            if entry is None:
+                entry = {
+                    "query": shape[:200],
+                    "phases": {phase: _LatencyHistogram() for phase in _QUERY_PHASES},
+                    "total": _LatencyHistogram(),
+                    "executions": 0,
+                    "errors": 0,
+                    "rows": 0,
+                    "bytes": 0
+                }
+                self._queries[fingerprint] = entry
+            for phase, seconds in phases.items():
+                entry["phases"][phase].observe(seconds)
+            entry["total"].observe(sum(phases.values()))
+            entry["executions"] += 1
+            entry["errors"] += 1 if error else 0
+            entry["rows"] += rows
+            entry["bytes"] += nbytes
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            snapshot = {}
+            for fingerprint, entry in self._queries.items():
+                total_seconds = entry["total"].total
+                snapshot[fingerprint] = {
+                    "query": entry["query"],
+                    "executions": entry["executions"],
+                    "errors": entry["errors"],
+                    "rows": entry["rows"],
+                    "bytes": entry["bytes"],
+                    "rows_per_second": round(entry["rows"] / total_seconds, 1) if total_seconds else 0.0,
+                    "total": entry["total"].snapshot(),
+                    "phases": {phase: histogram.snapshot() for phase, histogram in entry["phases"].items()}
+                }
+            return snapshot
+    
+    def prometheus_text(self, labels: Dict[str, str]) -> str:
+        """Render all metrics in the Prometheus text exposition format."""
+        def _labels(extra: Dict[str, str]) -> str:
+            merged = {**labels, **extra}
+            return ",".join(f'{key}="{value}"' for key, value in merged.items())
+        
+        lines = [
+            "# HELP cxmidl_query_phase_seconds Query phase latency (acquire, execute, fetch, convert)",
+            "# TYPE cxmidl_query_phase_seconds histogram"
+        ]
+        with self._lock:
+            entries = list(self._queries.items())
+            for fingerprint, entry in entries:
+                for phase, histogram in entry["phases"].items():
+                    cumulative = 0
+                    for bound, bucket_count in zip(_LATENCY_BUCKETS, histogram.counts):
+                        cumulative += bucket_count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(
+                            f"cxmidl_query_phase_seconds_bucket{{{_labels({'fingerprint': fingerprint, 'phase': phase, 'le': le})}}} {cumulative}"
+                        )
+                    series = _labels({"fingerprint": fingerprint, "phase": phase})
+                    lines.append(f"cxmidl_query_phase_seconds_sum{{{series}}} {histogram.total}")
+                    lines.append(f"cxmidl_query_phase_seconds_count{{{series}}} {histogram.count}")
+            for name, key, help_text in (
+                ("cxmidl_query_executions_total", "executions", "Query executions"),
+                ("cxmidl_query_errors_total", "errors", "Failed query executions"),
+                ("cxmidl_query_rows_total", "rows", "Rows returned"),
+                ("cxmidl_query_bytes_total", "bytes", "Bytes materialized from results")
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for fingerprint, entry in entries:
+                    lines.append(f"{name}{{{_labels({'fingerprint': fingerprint})}}} {entry[key]}")
+        return "\n".join(lines) + "\n"
+    
+    def reset(self):
+        with self._lock:
+            self._queries.clear()
+
+
+# Azure SQL errors that clear on retry: throttling, failover/reconfiguration,
+# database unavailable, dropped transport and deadlock victims
+_TRANSIENT_ERROR_NUMBERS = frozenset({
+    64, 233, 1205, 4060, 4221, 10053, 10054, 10060, 10928, 10929,
+    40143, 40197, 40501, 40540, 40613, 49918, 49919, 49920
+})
+_TRANSIENT_SQLSTATES = frozenset({"08S01", "08001", "08004", "HYT01", "40001"})
+# SQLSTATE classes the driver raises without an answer from the server:
+# connection exceptions, timeouts and driver manager errors
+_NO_ANSWER_SQLSTATE_PREFIXES = ("08", "HYT", "IM")
+_SQLSTATE_PATTERN = re.compile(r"[0-9A-Z]{5}")
+_ERROR_NUMBER_PATTERN = re.compile(r"\((\d{2,5})\)")
+_READ_ONLY_PATTERN = re.compile(r"^\s*(?:(?:--[^\n]*\n|/\*.*?\*/)\s*)*(?:SELECT|WITH)\b", re.IGNORECASE | re.DOTALL)
+_WRITE_KEYWORD_PATTERN = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE|INTO|EXEC|EXECUTE|TRUNCATE|DROP|ALTER|CREATE)\b", re.IGNORECASE)
+
+_CIRCUIT_BREAKERS: Dict[Tuple[str, int, float], "_CircuitBreaker"] = {}
+_CIRCUIT_BREAKERS_LOCK = threading.Lock()
+
+
+class CircuitBreakerOpenError(ConnectionError):
+    """Raised without contacting the server while its circuit breaker is open."""
+
+
+def _is_transient_error(error: BaseException) -> bool:
+    """True for errors worth retrying (see ``_TRANSIENT_ERROR_NUMBERS``)."""
+    if isinstance(error, CircuitBreakerOpenError):
+        return False
+    if isinstance(error, sa.exc.DBAPIError) and error.connection_invalidated:
+        return True
+    original = getattr(error, "orig", None) or error
+    args = getattr(original, "args", ())
+    if args and isinstance(args[0], str) and args[0] in _TRANSIENT_SQLSTATES:
+        return True
+    numbers = {int(number) for number in _ERROR_NUMBER_PATTERN.findall(str(original))}
+    return bool(numbers & _TRANSIENT_ERROR_NUMBERS)
+
+
+def _server_answered(error: BaseException) -> bool:
+    """True when the database server raised ``error`` (bad SQL, permissions), proving it is reachable."""
+    if isinstance(error, sa.exc.DBAPIError):
+        if error.connection_invalidated or isinstance(error, sa.exc.InterfaceError):
+            return False
+        error = error.orig or error
+    # PEP 249: server-side errors derive from the driver's DatabaseError
+    if not any(cls.__name__ == "DatabaseError" for cls in type(error).__mro__):
+        return False
+    args = getattr(error, "args", ())
+    sqlstate = args[0] if args and isinstance(args[0], str) and _SQLSTATE_PATTERN.fullmatch(args[0]) else ""
+    return not sqlstate.startswith(_NO_ANSWER_SQLSTATE_PREFIXES)
+
+
+def _is_read_only_query(query: str) -> bool:
+    """Heuristic: a plain SELECT/WITH query that is safe to re-run."""
+    return bool(_READ_ONLY_PATTERN.match(query)) and not _WRITE_KEYWORD_PATTERN.search(_SQL_LITERAL_PATTERN.sub("", query))
+
+
+class _CircuitBreaker:
+    """
+    Per-server circuit breaker.
+    
+    After ``failure_threshold`` consecutive transient failures the circuit
+    opens and calls fail fast for ``reset_timeout`` seconds; then a single
+    trial call is let through (half-open) and its outcome closes or re-opens
+    the circuit.
+    """
+    
+    def __init__(self, failure_threshold: int = 5, reset_timeout: float = 30.0):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+        self.times_opened = 0
+        self.rejected = 0
+    
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state(time.monotonic())
+    
+    def _state(self, now: float) -> str:
+        if self._opened_at is None:
+            return "closed"
+        return "half_open" if now - self._opened_at >= self.reset_timeout else "open"
+    
+    def allow(self, server: str):
+        """Raise CircuitBreakerOpenError unless a call may go to ``server`` now."""
+        with self._lock:
+            state = self._state(time.monotonic())
+            if state == "closed":
+                return
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return
+            self.rejected += 1
+            retry_in = max(0.0, self.reset_timeout - (time.monotonic() - self._opened_at))
+        raise CircuitBreakerOpenError(
+            f"Circuit breaker open for {server} after {self._failures} transient failures; "
+            f"retry in {retry_in:.0f}s"
+        )
+    
+    def record_success(self):
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+    
+    def release_trial(self):
+        """End a half-open trial that never reached the server without deciding the state."""
+        with self._lock:
+            self._trial_in_flight = False
+    
+    def record_failure(self):
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight or (self._opened_at is None and self._failures >= self.failure_threshold):
+                self._opened_at = time.monotonic()
+                self.times_opened += 1
+            self._trial_in_flight = False
+    
+    def statistics(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self._state(time.monotonic()),
+                "consecutive_failures": self._failures,
+                "failure_threshold": self.failure_threshold,
+                "reset_timeout": self.reset_timeout,
+                "times_opened": self.times_opened,
+                "rejected_calls": self.rejected
+            }
+
+
+def _get_circuit_breaker(server: str, failure_threshold: int, reset_timeout: float) -> _CircuitBreaker:
+    """
+    Return the process-wide circuit breaker for ``server`` and these settings.
+    
+    Connectors to one server with the same threshold and reset timeout share
+    a breaker; different settings get their own, so no connector runs with
+    another's limits.
+    """
+    key = (server, failure_threshold, float(reset_timeout))
+    with _CIRCUIT_BREAKERS_LOCK:
+        breaker = _CIRCUIT_BREAKERS.get(key)
+        if breaker is None:
+            breaker = _CircuitBreaker(failure_threshold, reset_timeout)
+            _CIRCUIT_BREAKERS[key] = breaker
+        return breaker
+
+
+_QMARK_PATTERN = re.compile(r"('(?:[^']|'')*')|\?")
+# "Could not find prepared statement with handle" (session reset, e.g. failover)
+_PREPARED_HANDLE_MISSING = 8179
+_PREPARED_HANDLES_KEY = "cxmidl_prepared_handles"
+_MAX_TRACKED_STATEMENTS = 4096
+
+
+@functools.lru_cache(maxsize=512)
+def _text_statement(query: str) -> sa.sql.elements.TextClause:
+    """
+    Cached ``text()`` construct for a SQL string.
+    
+    Bind parameters are parsed once per distinct SQL text, and reusing the
+    same construct lets the engine's compiled cache serve repeat executions.
+    """
+    return sa.text(query)
+
+
+def _sql_type_for_value(value: Any) -> str:
+    """SQL Server parameter type used to declare ``value`` for sp_prepare."""
+    if isinstance(value, bool):
+        return "bit"
+    if isinstance(value, int):
+        return "bigint"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, decimal.Decimal):
+        scale = min(38, max(0, -value.as_tuple().exponent)) if value.is_finite() else 0
+        return f"decimal(38, {scale})"
+    if isinstance(value, datetime):
+        return "datetime2"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, dt_time):
+        return "time"
+    if isinstance(value, (bytes, bytearray)):
+        return "varbinary(max)"
+    if isinstance(value, uuid.UUID):
+        return "uniqueidentifier"
+    return "nvarchar(max)"
+
+
+def _get_pooled_engine(pool_key: Tuple[str, str, str],
+                       url: str,
+                       on_create: Optional[Callable[[sa.engine.Engine], None]] = None,
+                       **engine_kwargs) -> _PooledEngine:
+    """
+    Return the shared engine for ``pool_key``, creating it on first use.
+    
+    ``on_create`` runs once on a newly created engine (e.g. to register
+    connection event hooks) before it is published to other threads.
+    """
+    with _ENGINE_POOLS_LOCK:
+        pooled = _ENGINE_POOLS.get(pool_key)
+        if pooled is None:
+            engine = sa.create_engine(url, **engine_kwargs)
+            if on_create is not None:
+                on_create(engine)
+            pooled = _PooledEngine(engine)
+            _ENGINE_POOLS[pool_key] = pooled
+            logger.info(f"Created shared connection pool for {pool_key[0]}/{pool_key[1]} ({pool_key[2]})")
+        return pooled
+
+
+def _discard_pooled_engine(pool_key: Tuple[str, str, str]):
+    """Remove and dispose the shared engine for ``pool_key`` if present."""
+    with _ENGINE_POOLS_LOCK:
+        pooled = _ENGINE_POOLS.pop(pool_key, None)
+    if pooled is not None:
+        pooled.engine.dispose()
+
+
+def dispose_connection_pools():
+    """Dispose every shared engine pool (call at process shutdown)."""
+    with _ENGINE_POOLS_LOCK:
+        pools = list(_ENGINE_POOLS.values())
+        _ENGINE_POOLS.clear()
+    for pooled in pools:
+        pooled.engine.dispose()
+    logger.info(f"Disposed {len(pools)} shared connection pool(s)")
+
+
+def get_pool_statistics() -> Dict[str, Dict[str, Any]]:
+    """Statistics for every shared engine pool in this process."""
+    with _ENGINE_POOLS_LOCK:
+        pools = dict(_ENGINE_POOLS)
+    return {
+        "/".join(key): pooled.statistics()
+        for key, pooled in pools.items()
+    }
+
+
+def _quote_identifier(name: str) -> str:
+    """Quote a SQL Server identifier, escaping embedded closing brackets."""
+    return "[" + name.replace("]", "]]") + "]"
+
+
+def _arrow_type_for_column(description: Tuple) -> Optional[pa.DataType]:
+    """
+    Map a DB-API cursor description entry to an Arrow type.
+    
+    pyodbc reports the Python type of each column in ``type_code`` plus
+    precision/scale for decimals. Returns None when the type is unknown
+    (e.g. SQLite), in which case the type is inferred from the first batch.
+    """
+    type_code = description[1]
+    precision, scale = description[4], description[5]
+    if type_code is bool:
+        return pa.bool_()
+    if type_code is int:
+        return pa.int64()
+    if type_code is float:
+        return pa.float64()
+    if type_code is decimal.Decimal:
+        if precision and scale is not None and 0 < precision <= 38:
+            return pa.decimal128(precision, scale)
+        return None
+    if type_code is str or type_code is uuid.UUID:
+        return pa.string()
+    if type_code is datetime:
+        return pa.timestamp("us")
+    if type_code is date:
+        return pa.date32()
+    if type_code is dt_time:
+        return pa.time64("us")
+    if type_code in (bytes, bytearray):
+        return pa.binary()
+    return None
+
+
+def _rows_to_record_batch(rows: List[Tuple],
+                          names: List[str],
+                          types: List[Optional[pa.DataType]]) -> pa.RecordBatch:
+    """Transpose fetched rows into typed Arrow column buffers."""
+    columns = list(zip(*rows)) if rows else [()] * len(names)
+    arrays = []
+    for values, arrow_type in zip(columns, types):
+        if arrow_type is not None and pa.types.is_string(arrow_type):
+            values = [None if v is None else str(v) for v in values]
+        arrays.append(pa.array(values, type=arrow_type, from_pandas=False))
+    return pa.RecordBatch.from_arrays(arrays, names=names)
+
+
+# Strings with at most this many distinct values per row become categoricals
+_CATEGORY_MAX_RATIO = 0.5
+# Rows per fetchmany round trip when building compact DataFrames
+_COMPACT_FETCH_ROWS = 10000
+
+
+class _GrowableArray:
+    """numpy buffer with amortized (doubling) growth, filled batch by batch."""
+    
+    def __init__(self, dtype: Any, capacity: int = 1024):
+        self._data = np.empty(max(1, capacity), dtype=dtype)
+        self.size = 0
+    
+    def _reserve(self, needed: int):
+        if needed > len(self._data):
+            grown = np.empty(max(needed, 2 * len(self._data)), dtype=self._data.dtype)
+            grown[:self.size] = self._data[:self.size]
+            self._data = grown
+    
+    def extend(self, values: np.ndarray):
+        needed = self.size + len(values)
+        self._reserve(needed)
+        self._data[self.size:needed] = values
+        self.size = needed
+    
+    def fill(self, value: Any, count: int):
+        needed = self.size + count
+        self._reserve(needed)
+        self._data[self.size:needed] = value
+        self.size = needed
+    
+    def view(self) -> np.ndarray:
+        return self._data[:self.size]
+
+
+def _column_kind(python_type: Optional[type]) -> Optional[str]:
+    """Materialization kind for a result column's Python type."""
+    if python_type is None:
+        return None
+    if issubclass(python_type, bool):
+        return "bool"
+    if issubclass(python_type, int):
+        return "int"
+    if issubclass(python_type, (float, decimal.Decimal)):
+        return "float"
+    if issubclass(python_type, (datetime, date)):
+        return "datetime"
+    if issubclass(python_type, str):
+        return "string"
+    return "object"
+
+
+class _ColumnarFrameBuilder:
+    """
+    Build a compact DataFrame column by column from fetched row batches.
+    
+    Column kinds come from the cursor description (or the first non-null
+    value when the driver does not report types). Integers and booleans fill
+    preallocated value/mask buffers and become nullable extension arrays
+    downcast to the smallest integer width; dates and datetimes become
+    ``datetime64``; strings are dictionary-encoded while fetching and end up
+    categorical, or Arrow-backed strings when most values are distinct.
+    """
+    
+    def __init__(self,
+                 columns: List[str],
+                 description: Optional[Tuple] = None,
+                 capacity: int = 1024,
+                 category_max_ratio: float = _CATEGORY_MAX_RATIO):
+        self.columns = columns
+        self.capacity = capacity
+        self.category_max_ratio = category_max_ratio
+        self.rows = 0
+        types = [column[1] if isinstance(column[1], type) else None for column in description] \
+            if description else [None] * len(columns)
+        self._kinds: List[Optional[str]] = [None] * len(columns)
+        self._state: List[Any] = [0] * len(columns)
+        for index, python_type in enumerate(types):
+            kind = _column_kind(python_type)
+            if kind is not None:
+                self._start(index, kind, 0)
+    
+    def _start(self, index: int, kind: str, leading_nulls: int):
+        """Allocate buffers for a column, back-filling ``leading_nulls`` nulls."""
+        self._kinds[index] = kind
+        if kind in ("int", "bool"):
+            values = _GrowableArray(np.int64 if kind == "int" else np.bool_, self.capacity)
+            mask = _GrowableArray(np.bool_, self.capacity)
+            values.fill(0, leading_nulls)
+            mask.fill(True, leading_nulls)
+            self._state[index] = (values, mask)
+        elif kind == "float":
+            values = _GrowableArray(np.float64, self.capacity)
+            values.fill(np.nan, leading_nulls)
+            self._state[index] = values
+        elif kind == "datetime":
+            values = _GrowableArray("datetime64[us]", self.capacity)
+            values.fill(np.datetime64("NaT"), leading_nulls)
+            self._state[index] = values
+        elif kind == "string":
+            codes = _GrowableArray(np.int32, self.capacity)
+            codes.fill(-1, leading_nulls)
+            self._state[index] = (codes, {})
+        else:
+            self._state[index] = [None] * leading_nulls
+    
+    def _demote(self, index: int):
+        """Fall back to a plain object column when values do not fit the kind."""
+        existing = pd.Series(self._finish_column(index, self.rows)).astype(object)
+        self._kinds[index] = "object"
+        self._state[index] = existing.where(existing.notna(), None).tolist()
+    
+    def append(self, rows: List[Tuple]):
+        """Add a fetched batch of row tuples."""
+        if not rows:
+            return
+        count = len(rows)
+        for index, values in enumerate(zip(*rows)):
+            kind = self._kinds[index]
+            if kind is None:
+                first = next((value for value in values if value is not None), None)
+                if first is None:
+                    self._state[index] += count
+                    continue
+                kind = _column_kind(type(first))
+                if kind == "datetime" and getattr(first, "tzinfo", None) is not None:
+                    kind = "object"
+                self._start(index, kind, self._state[index])
+            try:
+                self._append_values(index, kind, values, count)
+            except (TypeError, ValueError, OverflowError):
+                self._demote(index)
+                self._state[index].extend(values)
+        self.rows += count
+    
+    def _append_values(self, index: int, kind: str, values: Tuple, count: int):
+        state = self._state[index]
+        if kind in ("int", "bool"):
+            buffer, mask = state
+            null = np.fromiter((value is None for value in values), dtype=np.bool_, count=count)
+            filled = np.fromiter((0 if value is None else value for value in values),
+                                 dtype=buffer.view().dtype, count=count)
+            buffer.extend(filled)
+            mask.extend(null)
+        elif kind == "float":
+            state.extend(np.fromiter((np.nan if value is None else value for value in values),
+                                     dtype=np.float64, count=count))
+        elif kind == "datetime":
+            state.extend(np.array(values, dtype="datetime64[us]"))
+        elif kind == "string":
+            codes, lookup = state
+            codes.extend(np.fromiter(
+                (-1 if value is None else lookup.setdefault(value, len(lookup)) for value in values),
+                dtype=np.int32, count=count
+            ))
+        else:
+            state.extend(values)
+    
+    def _finish_column(self, index: int, rows: int) -> Any:
+        kind = self._kinds[index]
+        state = self._state[index]
+        if kind is None:
+            return np.full(rows, None, dtype=object)
+        if kind == "int":
+            values, mask = state[0].view(), state[1].view()
+            present = values[~mask]
+            target = np.int64
+            if len(present):
+                low, high = int(present.min()), int(present.max())
+                for candidate in (np.int8, np.int16, np.int32):
+                    if np.iinfo(candidate).min <= low and high <= np.iinfo(candidate).max:
+                        target = candidate
+                        break
+            return pd.arrays.IntegerArray(values.astype(target), mask.copy())
+        if kind == "bool":
+            return pd.arrays.BooleanArray(state[0].view().copy(), state[1].view().copy())
+        if kind in ("float", "datetime"):
+            return state.view().copy()
+        if kind == "string":
+            codes, lookup = state[0].view(), state[1]
+            categories = list(lookup)
+            if rows and len(categories) <= self.category_max_ratio * rows:
+                return pd.Categorical.from_codes(codes, categories=categories)
+            try:
+                dictionary = pa.DictionaryArray.from_arrays(
+                    pa.array(codes, mask=codes < 0), pa.array(categories, type=pa.string())
+                )
+                return pd.arrays.ArrowExtensionArray(dictionary.dictionary_decode())
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                lookup_array = np.array(categories + [None], dtype=object)
+                return lookup_array[codes]
+        values = np.empty(len(state), dtype=object)
+        values[:] = state
+        return values
+    
+    def build(self) -> pd.DataFrame:
+        """Assemble the DataFrame (no further row copies for numeric columns)."""
+        arrays = {index: self._finish_column(index, self.rows) for index in range(len(self.columns))}
+        frame = pd.DataFrame(arrays, copy=False)
+        frame.columns = self.columns
+        return frame
+
+
+def _iter_row_batches(data: Any,
+                      batch_size: int,
+                      columns: Optional[List[str]] = None) -> Iterator[Tuple[List[str], List[Tuple]]]:
+    """
+    Normalize bulk-load input into (columns, list of row tuples) batches.
+    
+    Accepts a DataFrame, an Arrow Table/RecordBatch, or an iterable of those
+    (or of lists of dicts/tuples). Missing values (NaN/NaT/None) become None.
+    """
+    if isinstance(data, pd.DataFrame):
+        frame_columns = columns or [str(column) for column in data.columns]
+        for offset in range(0, len(data), batch_size):
+            chunk = data.iloc[offset:offset + batch_size]
+            if columns:
+                chunk = chunk[columns]
+            chunk = chunk.astype(object).where(chunk.notna(), None)
+            yield frame_columns, list(chunk.itertuples(index=False, name=None))
+        return
+    
+    if isinstance(data, (pa.Table, pa.RecordBatch)):
+        table = pa.Table.from_batches([data]) if isinstance(data, pa.RecordBatch) else data
+        if columns:
+            table = table.select(columns)
+        for batch in table.to_batches(max_chunksize=batch_size):
+            yield batch.schema.names, list(zip(*(column.to_pylist() for column in batch.columns)))
+        return
+    
+    for item in data:
+        if isinstance(item, (pd.DataFrame, pa.Table, pa.RecordBatch)):
+            yield from _iter_row_batches(item, batch_size, columns)
+        elif item and isinstance(item[0], dict):
+            item_columns = columns or list(item[0].keys())
+            yield item_columns, [tuple(row.get(column) for column in item_columns) for row in item]
+        elif item:
+            if not columns:
+                raise ValueError("columns are required when bulk loading row tuples")
+            yield columns, [tuple(row) for row in item]
+
+
 class CXMIDLOrchestrationConnector:
     """Enterprise Azure SQL Server connector for CXMIDL Orchestration database."""
     
@@ -30,7 +1187,30 @@ class CXMIDLOrchestrationConnector:
                  database: str = "Orchestration",
                  use_mfa: bool = True,
                  connection_timeout: int = 30,
-                 command_timeout: int = 600):
+                 command_timeout: int = 600,
+                 pool_size: int = 5,
+                 max_overflow: int = 10,
+                 pool_timeout: int = 30,
+                 pool_recycle: int = 1800,
+                 pool_pre_ping: bool = True,
+                 use_access_token: bool = True,
+                 credential: Optional[Any] = None,
+                 token_refresh_margin: int = 300,
+                 token_cache_path: Optional[Union[str, Path]] = None,
+                 token_cache_key: Optional[bytes] = None,
+                 result_cache: bool = False,
+                 cache_ttl: float = 300,
+                 cache_max_entries: int = 256,
+                 cache_path: Optional[Union[str, Path]] = None,
+                 collect_metrics: bool = True,
+                 max_retries: int = 3,
+                 retry_backoff: float = 0.5,
+                 retry_max_backoff: float = 30.0,
+                 circuit_breaker_threshold: int = 5,
+                 circuit_breaker_reset: float = 30.0,
+                 prepare_threshold: Optional[int] = None,
+                 url: Optional[str] = None,
+                 engine: Optional[sa.engine.Engine] = None):
         """
         Initialize CXMIDL Orchestration connector with enterprise security settings.
         
@@ -39,27 +1219,134 @@ class CXMIDLOrchestrationConnector:
             use_mfa: Use Multi-Factor Authentication (Interactive Browser)
             connection_timeout: Connection timeout in seconds
             command_timeout: Command execution timeout in seconds
+            pool_size: Connections kept open in the shared pool
+            max_overflow: Extra connections allowed beyond pool_size under load
+            pool_timeout: Seconds to wait for a free pooled connection
+            pool_recycle: Recycle pooled connections older than this many seconds
+            pool_pre_ping: Validate pooled connections before handing them out
+            use_access_token: Acquire the AAD token once from the credential and
+                pass it via SQL_COPT_SS_ACCESS_TOKEN instead of letting the ODBC
+                driver authenticate every new connection
+            credential: Pre-built credential (anything with ``get_token``);
+                skips building the default MFA/credential chain. Connectors
+                share a pool only when they share the credential object
+            token_refresh_margin: Refresh the cached token this many seconds before expiry
+            token_cache_path: Optional encrypted on-disk token cache file
+            token_cache_key: Fernet key for the disk cache (default: CXMIDL_TOKEN_CACHE_KEY)
+            result_cache: Cache catalog/metadata results and queries run with ``cache_ttl``
+            cache_ttl: Default time-to-live in seconds for cached results
+            cache_max_entries: Maximum results held in the in-memory LRU
+            cache_path: Optional SQLite file sharing cached results across processes
+            collect_metrics: Keep per-query latency histograms (see ``metrics()``)
+            max_retries: Retries for transient errors (connect, read queries, streams)
+            retry_backoff: Base delay in seconds for jittered exponential backoff
+            retry_max_backoff: Upper bound for a single backoff delay
+            circuit_breaker_threshold: Consecutive transient failures that open
+                the per-server circuit breaker
+            circuit_breaker_reset: Seconds the circuit stays open before a trial call
+            prepare_threshold: After a query text has run this many times, prepare
+                it once per pooled connection (sp_prepare) and reuse the handle
+                via sp_execute (default: off)
+            url: SQLAlchemy URL of a different backend (e.g. SQLite, DuckDB or a
+                local SQL Server container); Azure authentication is skipped
+            engine: Pre-built SQLAlchemy engine to use instead of a shared pool
+                (its owner disposes it); implies its URL's backend
         """
-        self.server = "cxmidl.database.windows.net"
+        self._engine = engine
+        if engine is not None:
+            self.url = engine.url
+        else:
+            self.url = sa.engine.make_url(url) if url is not None else None
+        # Backend-specific SQL (catalog queries, pagination, upserts, quoting)
+        self.backend: DialectAdapter = get_dialect_adapter(
+            self.url.get_backend_name() if self.url is not None else "mssql"
+        )
+        self.server = (
+            "cxmidl.database.windows.net" if self.url is None
+            else self.url.host or self.url.get_backend_name()
+        )
         self.database = database
         self.use_mfa = use_mfa
         self.connection_timeout = connection_timeout
         self.command_timeout = command_timeout
         
+        # Shared pool settings (applied when the pool for this key is first created)
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.pool_timeout = pool_timeout
+        self.pool_recycle = pool_recycle
+        self.pool_pre_ping = pool_pre_ping
+        
         # Enterprise integration metadata
         self.integration_id = "cxmidl-orchestration-enterprise"
         self.version = "1.0.0_UNNILNILIUM"
         
         # Connection objects
-        self._pyodbc_connection = None
+        self._pooled_engine: Optional[_PooledEngine] = None
         self._sqlalchemy_engine = None
-        self._credential = None
+        # Set on the views yielded by transaction(): every query shares this connection
+        self._pinned_connection = None
+        # Built on first token acquisition unless given (see _get_credential)
+        self._credential = credential
+        # A given credential gets its own pool: pooled connections carry its tokens
+        self._credential_key = (
+            f"Credential:{type(credential).__name__}@{id(credential):x}" if credential is not None else None
+        )
+        self._credential_lock = threading.Lock()
+        
+        # Token-based authentication: one token reused by every pooled connection
+        self.use_access_token = use_access_token and self.url is None
+        self._token_cache = _AccessTokenCache(
+            self._get_credential,
+            refresh_margin=token_refresh_margin,
+            cache_path=token_cache_path,
+            encryption_key=token_cache_key
+        ) if self.use_access_token else None
+        
+        # Opt-in query result cache for catalog/metadata queries
+        self.cache_ttl = cache_ttl
+        self._result_cache = _QueryResultCache(
+            default_ttl=cache_ttl,
+            max_entries=cache_max_entries,
+            path=cache_path
+        ) if result_cache else None
+        
+        # Per-query latency histograms and transfer counters
+        self._metrics = _QueryMetrics() if collect_metrics else None
         
-        # Initialize Azure credential
-        self._setup_credentials()
+        # Opt-in slow-query profiler (see enable_profiling)
+        self._profiler = None
+        
+        # Optional server-side prepared statement reuse for frequently repeated queries
+        self.prepare_threshold = prepare_threshold
+        self._statement_counts: Dict[str, int] = {}
+        self._statement_lock = threading.Lock()
+        self._prepared_stats = {"prepares": 0, "prepared_executions": 0, "reprepares": 0}
+        
+        # Transient error handling: retries with backoff and a shared per-server breaker
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+        self.retry_max_backoff = retry_max_backoff
+        self._circuit_breaker = _get_circuit_breaker(
+            self.server, circuit_breaker_threshold, circuit_breaker_reset
+        )
+    
+    def _get_credential(self):
+        """
+        The Azure credential, built on first use.
+        
+        Only token acquisition needs it, so connectors that never connect (or
+        find a fresh token in the disk cache) skip the credential setup.
+        """
+        if self._credential is None:
+            with self._credential_lock:
+                if self._credential is None:
+                    self._setup_credentials()
+        return self._credential
         
     def _setup_credentials(self):
         """Setup Azure authentication credentials with MFA support."""
+        from azure.identity import ChainedTokenCredential, DefaultAzureCredential, InteractiveBrowserCredential
         try:
             if self.use_mfa:
                 # Use Interactive Browser as primary for MFA
@@ -79,19 +1366,37 @@ class CXMIDLOrchestrationConnector:
             logger.error(f"Failed to initialize Azure credentials: {e}")
             raise
     
+    @property
+    def auth_method(self) -> str:
+        """ODBC authentication method used for this connector."""
+        if self.url is not None:
+            return "Url"
+        return "ActiveDirectoryInteractive" if self.use_mfa else "ActiveDirectoryDefault"
+    
+    @property
+    def pool_key(self) -> Tuple[str, str, str]:
+        """Key identifying the shared connection pool for this connector."""
+        if self.url is not None:
+            return (self.server, self.url.database or self.database, self.auth_method)
+        if self.use_access_token:
+            return (self.server, self.database, f"AccessToken:{self._credential_key or self.auth_method}")
+        return (self.server, self.database, self.auth_method)
+    
     @property
     def connection_string(self) -> str:
-        """Generate enterprise connection string."""
-        if self.use_mfa:
-            auth_method = "ActiveDirectoryInteractive"
-        else:
-            auth_method = "ActiveDirectoryDefault"
+        """
+        Generate enterprise connection string.
+        
+        With ``use_access_token`` the Authentication keyword is omitted: the
+        token is supplied per connection through SQL_COPT_SS_ACCESS_TOKEN.
+        """
+        authentication = "" if self.use_access_token else f"Authentication={self.auth_method};"
             
         return (
             f"Driver={{ODBC Driver 18 for SQL Server}};"
             f"Server=tcp:{self.server},1433;"
             f"Database={self.database};"
-            f"Authentication={auth_method};"
+            f"{authentication}"
             f"Encrypt=yes;"
             f"TrustServerCertificate=no;"
             f"Connection Timeout={self.connection_timeout};"
@@ -101,6 +1406,8 @@ class CXMIDLOrchestrationConnector:
     @property
     def sqlalchemy_url(self) -> str:
         """Generate SQLAlchemy connection URL."""
+        if self.url is not None:
+            return self.url.render_as_string(hide_password=False)
         from urllib.parse import quote_plus
         connection_string_encoded = quote_plus(self.connection_string)
         return f"mssql+pyodbc:///?odbc_connect={connection_string_encoded}"
@@ -113,39 +1420,184 @@ class CXMIDLOrchestrationConnector:
             bool: True if connection successful, False otherwise
         """
         try:
-            # Test PyODBC connection
-            self._pyodbc_connection = pyodbc.connect(
-                self.connection_string,
-                timeout=self.connection_timeout
-            )
-            
-            # Create SQLAlchemy engine
-            self._sqlalchemy_engine = create_engine(
-                self.sqlalchemy_url,
-                connect_args={
-                    "timeout": self.connection_timeout,
-                    "autocommit": False
-                },
-                echo=False
-            )
-            
-            # Test the connection
-            with self._sqlalchemy_engine.connect() as conn:
-                result = conn.execute(text("SELECT GETDATE() as CurrentTime"))
-                current_time = result.fetchone()[0]
-                
-            logger.info(f"Successfully connected to CXMIDL server at {current_time}")
+            self._with_retries(self._open_pool, "connect")
+            logger.info(f"Successfully connected to CXMIDL server {self.server}/{self.database}")
             return True
             
         except Exception as e:
             logger.error(f"Failed to connect to CXMIDL server: {e}")
-            self._cleanup_connections()
+            self._cleanup_connections(discard_pool=True)
             return False
     
+    def _open_pool(self):
+        """Get the shared pool and check out one connection to validate it."""
+        if self._engine is not None:
+            # Injected engine: its pool belongs to the caller and is not shared
+            if self._pooled_engine is None:
+                self._pooled_engine = _PooledEngine(self._engine)
+        else:
+            # Reuse (or create) the process-wide pool for this server/database/auth
+            self._pooled_engine = _get_pooled_engine(
+                self.pool_key,
+                self.sqlalchemy_url,
+                on_create=self._register_token_provider if self.use_access_token else None,
+                echo=False,
+                **self.backend.engine_options(self)
+            )
+        self._sqlalchemy_engine = self._pooled_engine.engine
+        
+        # Check out one connection so failures surface here; a warm pool
+        # answers from an idle connection and a cold one keeps it for reuse
+        with self._acquire_connection():
+            pass
+    
+    def _backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for retry ``attempt`` (0-based)."""
+        return random.uniform(0, min(self.retry_max_backoff, self.retry_backoff * (2 ** attempt)))
+    
+    def _with_retries(self, operation: Callable[[], Any], description: str, retry: bool = True) -> Any:
+        """
+        Run ``operation`` through the circuit breaker, retrying transient errors.
+        
+        Non-transient errors are raised immediately. Those raised by the
+        server (bad SQL, permissions) show it is reachable and reset the
+        breaker; any other error leaves the breaker as it was.
+        """
+        attempt = 0
+        while True:
+            self._circuit_breaker.allow(self.server)
+            try:
+                result = operation()
+            except Exception as e:
+                if not _is_transient_error(e):
+                    self._record_permanent_error(e)
+                    raise
+                self._circuit_breaker.record_failure()
+                if not retry or attempt >= self.max_retries:
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Transient error during {description} (attempt {attempt}/{self.max_retries}), "
+                    f"retrying in {delay:.2f}s: {e}"
+                )
+                time.sleep(delay)
+                continue
+            except BaseException:
+                # KeyboardInterrupt and friends must not leave a half-open trial in flight
+                self._circuit_breaker.record_failure()
+                raise
+            self._circuit_breaker.record_success()
+            return result
+    
+    def _record_permanent_error(self, error: Exception):
+        """Count a non-transient ``error`` as a success only if the server raised it."""
+        if _server_answered(error):
+            self._circuit_breaker.record_success()
+        else:
+            self._circuit_breaker.release_trial()
+    
+    def _register_token_provider(self, engine: sa.engine.Engine):
+        """Inject the cached access token into every new DBAPI connection."""
+        token_cache = self._token_cache
+        
+        @sa.event.listens_for(engine, "do_connect")
+        def _provide_token(dialect, conn_rec, cargs, cparams):
+            attrs_before = dict(cparams.get("attrs_before") or {})
+            attrs_before[SQL_COPT_SS_ACCESS_TOKEN] = token_cache.token_struct()
+            cparams["attrs_before"] = attrs_before
+    
+    @contextmanager
+    def _acquire_connection(self, query_timeout: Optional[int] = None):
+        """
+        Check out a pooled connection, recording the wait in pool statistics.
+        
+        Args:
+            query_timeout: Per-statement timeout in seconds applied to the
+                driver connection for this checkout (pyodbc ``timeout``)
+        """
+        pinned = self._pinned_connection is not None
+        if pinned:
+            conn = self._pinned_connection
+        else:
+            start = time.perf_counter()
+            conn = self._sqlalchemy_engine.connect()
+            if self._pooled_engine is not None:
+                self._pooled_engine.record_checkout(time.perf_counter() - start)
+        
+        dbapi_connection = None
+        previous_timeout = None
+        if query_timeout is not None:
+            dbapi_connection = conn.connection.dbapi_connection
+            if hasattr(dbapi_connection, "timeout"):
+                previous_timeout = dbapi_connection.timeout
+                dbapi_connection.timeout = query_timeout
+            else:
+                dbapi_connection = None
+        try:
+            yield conn
+        finally:
+            if dbapi_connection is not None:
+                dbapi_connection.timeout = previous_timeout
+            if not pinned:
+                conn.close()
+    
+    @contextmanager
+    def transaction(self, isolation_level: Optional[str] = None) -> Iterator["CXMIDLOrchestrationConnector"]:
+        """
+        Run several queries in one transaction on one pooled connection.
+        
+        Yields a view of this connector whose queries (``execute_query`` and
+        the streaming/Arrow methods) all run on the pinned connection, so
+        they read one consistent state, e.g. with ``isolation_level="SNAPSHOT"``
+        on SQL Server. The view bypasses the result cache and may be used
+        from any thread, one call at a time. The transaction commits on
+        normal exit and rolls back otherwise; the pool restores the
+        connection's isolation level when it is returned.
+        
+        Args:
+            isolation_level: SQLAlchemy isolation level for this transaction
+                (default: the connection's)
+        """
+        if not self._sqlalchemy_engine:
+            if not self.connect():
+                raise ConnectionError("Failed to establish connection to CXMIDL server")
+        
+        with self._acquire_connection() as conn:
+            if isolation_level is not None:
+                conn.execution_options(isolation_level=isolation_level)
+            with conn.begin():
+                view = copy.copy(self)
+                view._pinned_connection = conn
+                view._result_cache = None
+                yield view
+    
+    def pool_statistics(self) -> Dict[str, Any]:
+        """
+        Get statistics for the shared connection pool used by this connector.
+        
+        Returns:
+            Pool occupancy (checked out, idle, overflow) and checkout wait times
+        """
+        stats = {
+            "timestamp": datetime.now().isoformat(),
+            "server": self.server,
+            "database": self.database,
+            "auth_method": self.auth_method,
+            "connected": self._pooled_engine is not None
+        }
+        if self._pooled_engine is not None:
+            stats.update(self._pooled_engine.statistics())
+        return stats
+    
     def execute_query(self, 
                      query: str, 
                      params: Optional[Dict[str, Any]] = None,
-                     return_dataframe: bool = True) -> Union[pd.DataFrame, List[Dict]]:
+                     return_dataframe: bool = True,
+                     timeout: Optional[int] = None,
+                     cache_ttl: Optional[float] = None,
+                     retry: Optional[bool] = None,
+                     compact_dtypes: bool = False) -> Union[pd.DataFrame, List[Dict]]:
         """
         Execute SQL query with enterprise security and monitoring.
         
@@ -153,131 +1605,734 @@ class CXMIDLOrchestrationConnector:
             query: SQL query to execute
             params: Query parameters (optional)
             return_dataframe: Return results as pandas DataFrame
+            timeout: Query timeout in seconds (default: driver/command timeout)
+            cache_ttl: Serve/store the result in the result cache for this many
+                seconds (ignored unless the connector has ``result_cache``)
+            retry: Retry transient errors with backoff (default: only for
+                read-only SELECT/WITH queries, which are safe to re-run)
+            compact_dtypes: Build the DataFrame from the result metadata with
+                compact dtypes (categorical/Arrow strings, nullable and
+                downcast integers, datetime64) instead of object columns
             
         Returns:
             Query results as DataFrame or list of dictionaries
         """
+        cache_key = None
+        if cache_ttl is not None and self._result_cache is not None:
+            result_mode = "compact" if return_dataframe and compact_dtypes else return_dataframe
+            cache_key = self._result_cache.make_key(self.database, query, params, result_mode)
+            cached = self._result_cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"Query served from result cache, returned {len(cached)} rows")
+                return cached
+        
         if not self._sqlalchemy_engine:
             if not self.connect():
                 raise ConnectionError("Failed to establish connection to CXMIDL server")
         
+        output = self._with_retries(
+            lambda: self._execute_once(query, params, return_dataframe, timeout, compact_dtypes),
+            "query",
+            retry=_is_read_only_query(query) if retry is None else retry
+        )
+        if cache_key is not None:
+            self._result_cache.put(cache_key, output, cache_ttl, query)
+        return output
+    
+    def _execute_once(self,
+                      query: str,
+                      params: Optional[Dict[str, Any]],
+                      return_dataframe: bool,
+                      timeout: Optional[int],
+                      compact_dtypes: bool = False) -> Union[pd.DataFrame, List[Dict]]:
+        """Single execution attempt of ``execute_query`` (timed and profiled)."""
+        phases = {}
+        rows_returned = 0
+        nbytes = 0
+        failed = False
+        profiler = self._profiler
+        profile: Dict[str, Any] = {}
+        error = None
+        start_time = time.perf_counter()
         try:
-            start_time = datetime.now()
-            
-            with self._sqlalchemy_engine.connect() as conn:
-                if return_dataframe:
-                    df = pd.read_sql_query(query, conn, params=params)
-                    execution_time = (datetime.now() - start_time).total_seconds()
-                    
-                    logger.info(f"Query executed successfully in {execution_time:.2f}s, returned {len(df)} rows")
-                    return df
+            with self._acquire_connection(query_timeout=timeout) as conn:
+                phase_start = time.perf_counter()
+                phases["acquire"] = phase_start - start_time
+                
+                if profiler is not None:
+                    # Statistics messages and the showplan are read off the raw cursor
+                    columns, fetched, profile = profiler.execute(conn, query, params)
+                    phases["execute"] = time.perf_counter() - phase_start
+                elif self._should_prepare(conn, query):
+                    columns, fetched = self._execute_prepared(conn, query, params)
+                    phases["execute"] = time.perf_counter() - phase_start
                 else:
-                    result = conn.execute(text(query), params or {})
-                    rows = [dict(row._mapping) for row in result]
-                    execution_time = (datetime.now() - start_time).total_seconds()
+                    result = conn.execute(_text_statement(query), params or {})
+                    phases["execute"] = time.perf_counter() - phase_start
                     
-                    logger.info(f"Query executed successfully in {execution_time:.2f}s, returned {len(rows)} rows")
-                    return rows
+                    phase_start = time.perf_counter()
+                    columns = list(result.keys())
+                    if compact_dtypes and return_dataframe:
+                        # Fill typed column buffers batch by batch instead of
+                        # holding every row tuple before conversion
+                        builder = _ColumnarFrameBuilder(
+                            columns, result.cursor.description, capacity=_COMPACT_FETCH_ROWS
+                        )
+                        phases["fetch"] = phases["convert"] = 0.0
+                        while True:
+                            fetch_start = time.perf_counter()
+                            rows = result.fetchmany(_COMPACT_FETCH_ROWS)
+                            convert_start = time.perf_counter()
+                            phases["fetch"] += convert_start - fetch_start
+                            if not rows:
+                                break
+                            builder.append(rows)
+                            phases["convert"] += time.perf_counter() - convert_start
+                        fetched = None
+                    else:
+                        fetched = result.fetchall()
+                        phases["fetch"] = time.perf_counter() - phase_start
+            
+            phase_start = time.perf_counter()
+            if compact_dtypes and return_dataframe:
+                if fetched is not None:
+                    builder = _ColumnarFrameBuilder(columns, capacity=max(1, len(fetched)))
+                    builder.append(fetched)
+                output = builder.build()
+                rows_returned = builder.rows
+                nbytes = int(output.memory_usage(index=False, deep=True).sum())
+            elif return_dataframe:
+                output = pd.DataFrame.from_records(fetched, columns=columns, coerce_float=True)
+                nbytes = int(output.memory_usage(index=False).sum())
+                rows_returned = len(fetched)
+            else:
+                output = [dict(zip(columns, row)) for row in fetched]
+                rows_returned = len(fetched)
+            phases["convert"] = phases.get("convert", 0.0) + time.perf_counter() - phase_start
+            
+            execution_time = time.perf_counter() - start_time
+            logger.info(f"Query executed successfully in {execution_time:.2f}s, returned {rows_returned} rows")
+            return output
                     
         except Exception as e:
+            failed = True
+            error = str(e)
             logger.error(f"Query execution failed: {e}")
             raise
+        
+        finally:
+            if self._metrics is not None:
+                self._metrics.record(query, phases, rows_returned, nbytes, error=failed)
+            if profiler is not None:
+                profiler.record(query, params, time.perf_counter() - start_time,
+                                rows_returned, profile, error=error)
     
-    def get_server_info(self) -> Dict[str, Any]:
-        """Get comprehensive server information."""
-        info_query = """
-        SELECT 
-            @@SERVERNAME as ServerName,
-            @@VERSION as SqlVersion,
-            DB_NAME() as CurrentDatabase,
-            SYSTEM_USER as CurrentUser,
-            GETDATE() as CurrentTime,
-            @@LANGUAGE as LanguageSetting,
-            'N/A' as TextSizeInfo,
-            'N/A' as LockTimeoutInfo
-        """
-        
-        result = self.execute_query(info_query, return_dataframe=False)
-        return result[0] if result else {}
+    def _should_prepare(self, conn, query: str) -> bool:
+        """Count executions of ``query`` and decide whether to use sp_prepare/sp_execute."""
+        if self.prepare_threshold is None or conn.dialect.name != "mssql":
+            return False
+        with self._statement_lock:
+            if len(self._statement_counts) >= _MAX_TRACKED_STATEMENTS and query not in self._statement_counts:
+                # Ad-hoc literal SQL never repeats; forget one-off texts
+                self._statement_counts = {
+                    tracked: count for tracked, count in self._statement_counts.items() if count > 1
+                }
+            count = self._statement_counts.get(query, 0) + 1
+            self._statement_counts[query] = count
+        return count >= self.prepare_threshold
     
-    def get_databases(self) -> pd.DataFrame:
-        """Get list of available databases."""
-        db_query = """
-        SELECT 
-            name as DatabaseName,
-            database_id as DatabaseId,
-            create_date as CreatedDate,
-            collation_name as Collation,
-            state_desc as State,
-            compatibility_level as CompatibilityLevel
-        FROM sys.databases 
-        WHERE name NOT IN ('master', 'tempdb', 'model', 'msdb')
-        ORDER BY name
+    def _execute_prepared(self,
+                          conn,
+                          query: str,
+                          params: Optional[Dict[str, Any]]) -> Tuple[List[str], List[Tuple]]:
         """
+        Execute ``query`` through a prepared handle cached on the pooled connection.
         
-        return self.execute_query(db_query)
+        Handles live in the pool entry's ``info`` dict, so they survive
+        checkouts and are dropped with the connection when it is invalidated
+        or recycled. A handle lost to a session reset is prepared again once.
+        """
+        compiled = _text_statement(query).compile(dialect=conn.dialect)
+        values = [(params or {}).get(name) for name in (compiled.positiontup or [])]
+        numbering = itertools.count(1)
+        statement = _QMARK_PATTERN.sub(lambda match: match.group(1) or f"@P{next(numbering)}", str(compiled))
+        declaration = ", ".join(f"@P{i} {_sql_type_for_value(value)}" for i, value in enumerate(values, 1))
+        
+        handles = conn.connection.info.setdefault(_PREPARED_HANDLES_KEY, {})
+        key = (statement, declaration)
+        cursor = conn.connection.dbapi_connection.cursor()
+        try:
+            for attempt in range(2):
+                handle = handles.get(key)
+                if handle is None:
+                    handle = self._prepare_statement(cursor, statement, declaration)
+                    handles[key] = handle
+                try:
+                    cursor.execute("EXEC sp_execute ?" + ", ?" * len(values), [handle, *values])
+                    break
+                except Exception as e:
+                    if attempt or str(_PREPARED_HANDLE_MISSING) not in str(e):
+                        raise
+                    handles.pop(key, None)
+                    self._count_prepared("reprepares")
+            self._count_prepared("prepared_executions")
+            
+            # Skip any leading rowcount-only results to the first row set
+            while cursor.description is None and cursor.nextset():
+                pass
+            if cursor.description is None:
+                return [], []
+            columns = [column[0] for column in cursor.description]
+            return columns, [tuple(row) for row in cursor.fetchall()]
+        finally:
+            cursor.close()
     
-    def get_orchestration_analysis(self) -> Dict[str, Any]:
-        """Get comprehensive Orchestration database analysis."""
-        orchestration_query = """
-        -- Orchestration Database Comprehensive Analysis
-        SELECT 
-            'Database_Metadata' as AnalysisType,
-            DB_NAME() as DatabaseName,
-            SYSTEM_USER as CurrentUser,
-            @@SPID as SessionId,
-            GETDATE() as AnalysisTime,
-            @@VERSION as SqlVersion
+    def _prepare_statement(self, cursor, statement: str, declaration: str) -> int:
+        """Run sp_prepare and return the statement handle."""
+        cursor.execute(
+            "SET NOCOUNT ON; DECLARE @handle int; "
+            "EXEC sp_prepare @handle OUTPUT, ?, ?; "
+            "SELECT @handle AS prepared_handle",
+            [declaration or None, statement]
+        )
+        handle = None
+        while True:
+            if cursor.description and cursor.description[0][0] == "prepared_handle":
+                handle = cursor.fetchone()[0]
+            if not cursor.nextset():
+                break
+        if handle is None:
+            raise RuntimeError("sp_prepare did not return a statement handle")
+        self._count_prepared("prepares")
+        return handle
+    
+    def _count_prepared(self, counter: str):
+        with self._statement_lock:
+            self._prepared_stats[counter] += 1
+    
+    def statement_cache_statistics(self) -> Dict[str, Any]:
+        """Client-side statement cache and prepared statement counters."""
+        info = _text_statement.cache_info()
+        with self._statement_lock:
+            repeated = sum(1 for count in self._statement_counts.values() if count > 1)
+            tracked = len(self._statement_counts)
+            prepared_stats = dict(self._prepared_stats)
+        return {
+            "text_cache_hits": info.hits,
+            "text_cache_misses": info.misses,
+            "text_cache_size": info.currsize,
+            "text_cache_max_size": info.maxsize,
+            "prepare_threshold": self.prepare_threshold,
+            "tracked_statements": tracked,
+            "repeated_statements": repeated,
+            **prepared_stats
+        }
+    
+    def invalidate_cache(self,
+                         query: Optional[str] = None,
+                         params: Optional[Dict[str, Any]] = None,
+                         return_dataframe: bool = True) -> int:
+        """
+        Invalidate cached results.
+        
+        Args:
+            query: Query whose cached result to drop (default: clear everything)
+            params: Parameters of that query
+            return_dataframe: Result mode of that query
+            
+        Returns:
+            Number of cache entries removed
+        """
+        if self._result_cache is None:
+            return 0
+        if query is None:
+            removed = self._result_cache.invalidate()
+        else:
+            removed = self._result_cache.invalidate(
+                self._result_cache.make_key(self.database, query, params, return_dataframe)
+            )
+        logger.info(f"Invalidated {removed} cached query result(s)")
+        return removed
+    
+    def cache_statistics(self) -> Dict[str, Any]:
+        """Result cache hit/miss counters and occupancy."""
+        if self._result_cache is None:
+            return {"enabled": False}
+        return {"enabled": True, **self._result_cache.statistics()}
+    
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Snapshot of query metrics collected by this connector.
+        
+        Per query fingerprint: executions, errors, rows, bytes, rows/second and
+        latency histograms (p50/p90/p99/max) for the acquire, execute, fetch
+        and convert phases, so slow jobs can be pinned on the pool/network,
+        SQL Server, or client-side conversion.
+        """
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "server": self.server,
+            "database": self.database,
+            "enabled": self._metrics is not None,
+            "pool": self.pool_statistics() if self._pooled_engine is not None else None,
+            "queries": self._metrics.snapshot() if self._metrics is not None else {}
+        }
+    
+    def metrics_prometheus(self) -> str:
+        """Query metrics in the Prometheus text exposition format."""
+        if self._metrics is None:
+            return ""
+        return self._metrics.prometheus_text({"server": self.server, "database": self.database})
+    
+    def reset_metrics(self):
+        """Clear collected query metrics."""
+        if self._metrics is not None:
+            self._metrics.reset()
+    
+    def enable_profiling(self,
+                         threshold_seconds: float = 1.0,
+                         capture_showplan: bool = False,
+                         max_entries: int = 50,
+                         top_operators: int = 5):
+        """
+        Profile ``execute_query`` calls with SET STATISTICS IO/TIME.
+        
+        Statistics are collected for every query while enabled; those taking
+        at least ``threshold_seconds`` are kept (the ``max_entries`` slowest)
+        with logical reads, CPU time and, with ``capture_showplan``, the most
+        expensive operators of the actual execution plan.
+        
+        Args:
+            threshold_seconds: Minimum latency for a query to be kept
+            capture_showplan: Also collect the actual XML showplan (adds
+                server overhead; enable while investigating)
+            max_entries: Number of slowest queries retained
+            top_operators: Plan operators reported per query
+        """
+        from cxmidl_profiler import QueryProfiler
+        self._profiler = QueryProfiler(
+            threshold_seconds=threshold_seconds,
+            capture_showplan=capture_showplan,
+            max_entries=max_entries,
+            top_operators=top_operators
+        )
+        logger.info(
+            f"Query profiling enabled (threshold {threshold_seconds}s, "
+            f"showplan {'on' if capture_showplan else 'off'})"
+        )
+    
+    def disable_profiling(self):
+        """Stop profiling; already captured slow queries are discarded."""
+        self._profiler = None
+    
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """Slowest profiled queries (slowest first); empty when profiling is off."""
+        return self._profiler.slow_queries() if self._profiler is not None else []
+    
+    def dump_slow_queries(self, path: Union[str, Path]) -> Optional[Path]:
+        """
+        Write the captured slow queries to a JSON file.
+        
+        Returns:
+            Path written, or None when profiling is not enabled
+        """
+        if self._profiler is None:
+            return None
+        written = self._profiler.dump(path, {
+            "server": self.server,
+            "database": self.database,
+            "integration_id": self.integration_id
+        })
+        logger.info(f"Dumped {len(self._profiler.slow_queries())} slow queries to {written}")
+        return written
+    
+    def execute_many(self,
+                     queries: List[Union[str, Tuple[str, Optional[Dict[str, Any]]]]],
+                     return_dataframe: bool = True,
+                     max_concurrency: Optional[int] = None,
+                     timeout: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Execute independent queries concurrently over the shared connection pool.
+        
+        Each query runs on its own pooled connection. Concurrency is capped at
+        ``max_concurrency`` (default: pool size plus overflow) so the batch
+        never waits on pool checkout timeouts. A failing query does not stop
+        the others.
+        
+        Args:
+            queries: SQL strings or (query, params) tuples
+            return_dataframe: Return each result as a pandas DataFrame
+            max_concurrency: Maximum queries in flight at once
+            timeout: Per-query timeout in seconds
             
-        UNION ALL
+        Returns:
+            One entry per query, in input order, with ``success``, ``result``
+            or ``error`` and ``latency_seconds``
+        """
+        if not self._sqlalchemy_engine:
+            if not self.connect():
+                raise ConnectionError("Failed to establish connection to CXMIDL server")
+        
+        pool_capacity = max(1, self.pool_size + self.max_overflow)
+        max_workers = max(1, min(max_concurrency or pool_capacity, pool_capacity, len(queries) or 1))
         
-        SELECT 
-            'Schema_Count' as AnalysisType,
-            CAST(COUNT(DISTINCT SCHEMA_NAME) as VARCHAR(50)) as Value,
-            NULL, NULL, NULL, NULL
-        FROM INFORMATION_SCHEMA.SCHEMATA
-        WHERE SCHEMA_NAME NOT IN ('sys', 'INFORMATION_SCHEMA')
+        def _run(index: int, item: Union[str, Tuple[str, Optional[Dict[str, Any]]]]) -> Dict[str, Any]:
+            query, params = (item, None) if isinstance(item, str) else item
+            start = time.perf_counter()
+            try:
+                result = self.execute_query(query, params, return_dataframe=return_dataframe, timeout=timeout)
+                return {
+                    "index": index,
+                    "success": True,
+                    "result": result,
+                    "error": None,
+                    "latency_seconds": round(time.perf_counter() - start, 6)
+                }
+            except Exception as e:
+                return {
+                    "index": index,
+                    "success": False,
+                    "result": None,
+                    "error": str(e),
+                    "latency_seconds": round(time.perf_counter() - start, 6)
+                }
+        
+        start_time = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cxmidl-query") as executor:
+            results = list(executor.map(_run, range(len(queries)), queries))
+        
+        failures = sum(1 for item in results if not item["success"])
+        logger.info(
+            f"Executed {len(queries)} queries in {time.perf_counter() - start_time:.2f}s "
+            f"with concurrency {max_workers} ({failures} failed)"
+        )
+        return results
+    
+    def _resume_query(self,
+                      query: str,
+                      params: Optional[Dict[str, Any]],
+                      resume_key: str,
+                      last_key: Any) -> Tuple[str, Dict[str, Any]]:
+        """Wrap ``query`` so it returns rows ordered by, and past, ``resume_key``."""
+        key = self.backend.quote_identifier(resume_key)
+        params = dict(params or {})
+        where = ""
+        if last_key is not None:
+            where = f" WHERE {key} > :_cxmidl_resume_after"
+            params["_cxmidl_resume_after"] = last_key
+        return f"SELECT * FROM ({query}) AS _cxmidl_resume{where} ORDER BY {key}", params
+    
+    def _resilient_stream(self,
+                          open_stream: Callable[[str, Optional[Dict[str, Any]]], Iterator[Any]],
+                          query: str,
+                          params: Optional[Dict[str, Any]],
+                          resume_key: Optional[str],
+                          last_key_of: Callable[[Any], Any]) -> Iterator[Any]:
+        """
+        Retry a streaming query on transient errors.
+        
+        Before the first chunk is yielded the query is simply re-run. After
+        that, a retry is only possible with ``resume_key``: the query is
+        re-issued for rows past the key of the last chunk already yielded,
+        so no row is delivered twice and none is skipped.
+        """
+        last_key = None
+        yielded = False
+        attempt = 0
+        while True:
+            self._circuit_breaker.allow(self.server)
+            run_query, run_params = query, params
+            if resume_key is not None:
+                run_query, run_params = self._resume_query(query, params, resume_key, last_key)
+            stream = open_stream(run_query, run_params)
+            try:
+                for chunk in stream:
+                    key = last_key_of(chunk) if resume_key is not None else None
+                    if key is not None:
+                        last_key = key
+                    yielded = True
+                    attempt = 0
+                    yield chunk
+            except GeneratorExit:
+                # Consumer stopped early: the server answered, so the call succeeded
+                self._circuit_breaker.record_success()
+                raise
+            except Exception as e:
+                if not _is_transient_error(e):
+                    self._record_permanent_error(e)
+                    raise
+                self._circuit_breaker.record_failure()
+                if attempt >= self.max_retries or (yielded and resume_key is None):
+                    raise
+                delay = self._backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Transient error during streaming query (attempt {attempt}/{self.max_retries}), "
+                    f"resuming {'after ' + repr(last_key) if last_key is not None else 'from the start'} "
+                    f"in {delay:.2f}s: {e}"
+                )
+                time.sleep(delay)
+                continue
+            except BaseException:
+                self._circuit_breaker.record_failure()
+                raise
+            finally:
+                # Releases the pooled connection if the consumer stops early
+                stream.close()
+            self._circuit_breaker.record_success()
+            return
+    
+    def execute_query_stream(self,
+                             query: str,
+                             params: Optional[Dict[str, Any]] = None,
+                             chunk_size: int = 10000,
+                             return_dataframe: bool = True,
+                             resume_key: Optional[str] = None) -> Iterator[Union[pd.DataFrame, List[Dict]]]:
+        """
+        Execute SQL query and yield results in fixed-size chunks.
+        
+        Rows are read through a server-side (streaming) cursor with
+        ``fetchmany(chunk_size)``, so memory stays bounded by one chunk no
+        matter how large the result set is. The pooled connection is held
+        until the generator is exhausted or closed.
+        
+        Args:
+            query: SQL query to execute
+            params: Query parameters (optional)
+            chunk_size: Rows fetched per round trip and yielded per chunk
+            return_dataframe: Yield pandas DataFrames instead of lists of dictionaries
+            resume_key: Unique, sortable result column. Rows are then returned
+                ordered by it and a transient failure mid-stream resumes after
+                the last yielded chunk (``query`` must not have its own ORDER BY)
+            
+        Yields:
+            One DataFrame or list of dictionaries per chunk
+        """
+        if chunk_size <= 0:
+            raise ValueError("chunk_size must be a positive integer")
+        
+        def _last_key(chunk):
+            if return_dataframe:
+                if not len(chunk):
+                    return None
+                value = chunk[resume_key].iloc[-1]
+                # numpy scalars are not bindable driver parameters
+                return value.item() if isinstance(value, np.generic) else value
+            return chunk[-1][resume_key] if chunk else None
+        
+        return self._resilient_stream(
+            lambda run_query, run_params: self._stream_chunks(run_query, run_params, chunk_size, return_dataframe),
+            query, params, resume_key, _last_key
+        )
+    
+    def _stream_chunks(self,
+                       query: str,
+                       params: Optional[Dict[str, Any]],
+                       chunk_size: int,
+                       return_dataframe: bool) -> Iterator[Union[pd.DataFrame, List[Dict]]]:
+        """Single streaming attempt of ``execute_query_stream``."""
+        if not self._sqlalchemy_engine:
+            if not self.connect():
+                raise ConnectionError("Failed to establish connection to CXMIDL server")
         
-        UNION ALL
+        phases = {phase: 0.0 for phase in _QUERY_PHASES}
+        total_rows = 0
+        nbytes = 0
+        failed = False
+        try:
+            start_time = time.perf_counter()
+            chunk_count = 0
+            
+            with self._acquire_connection() as conn:
+                phase_start = time.perf_counter()
+                phases["acquire"] = phase_start - start_time
+                streaming_conn = conn.execution_options(
+                    stream_results=True,
+                    max_row_buffer=chunk_size
+                )
+                result = streaming_conn.execute(_text_statement(query), params or {})
+                columns = list(result.keys())
+                phases["execute"] = time.perf_counter() - phase_start
+                
+                while True:
+                    chunk_start = time.perf_counter()
+                    rows = result.fetchmany(chunk_size)
+                    convert_start = time.perf_counter()
+                    phases["fetch"] += convert_start - chunk_start
+                    if not rows:
+                        break
+                    
+                    if return_dataframe:
+                        chunk = pd.DataFrame.from_records(rows, columns=columns)
+                        nbytes += int(chunk.memory_usage(index=False).sum())
+                    else:
+                        chunk = [dict(row._mapping) for row in rows]
+                    phases["convert"] += time.perf_counter() - convert_start
+                    
+                    chunk_count += 1
+                    total_rows += len(rows)
+                    logger.info(
+                        f"Streamed chunk {chunk_count}: {len(rows)} rows in "
+                        f"{time.perf_counter() - chunk_start:.3f}s ({total_rows} total)"
+                    )
+                    yield chunk
+                
+                result.close()
+            
+            execution_time = time.perf_counter() - start_time
+            logger.info(f"Streaming query completed in {execution_time:.2f}s, returned {total_rows} rows in {chunk_count} chunks")
+            
+        except Exception as e:
+            failed = True
+            logger.error(f"Streaming query execution failed: {e}")
+            raise
         
-        SELECT 
-            'Table_Count' as AnalysisType,
-            CAST(COUNT(*) as VARCHAR(50)) as Value,
-            NULL, NULL, NULL, NULL
-        FROM INFORMATION_SCHEMA.TABLES 
-        WHERE TABLE_TYPE = 'BASE TABLE'
+        finally:
+            if self._metrics is not None:
+                self._metrics.record(query, phases, total_rows, nbytes, error=failed)
+    
+    def execute_query_arrow_batches(self,
+                                    query: str,
+                                    params: Optional[Dict[str, Any]] = None,
+                                    batch_size: int = 65536,
+                                    resume_key: Optional[str] = None) -> Iterator[pa.RecordBatch]:
+        """
+        Execute SQL query and yield columnar Arrow record batches.
         
-        UNION ALL
+        Column types come from the ODBC cursor description, and each fetched
+        batch is transposed straight into typed Arrow buffers without going
+        through pandas object columns. Batches convert to pandas
+        (``to_pandas()``), polars (``polars.from_arrow``) or Parquet without
+        another copy of the row data.
         
-        SELECT 
-            'View_Count' as AnalysisType,
-            CAST(COUNT(*) as VARCHAR(50)) as Value,
-            NULL, NULL, NULL, NULL
-        FROM INFORMATION_SCHEMA.VIEWS
+        Args:
+            query: SQL query to execute
+            params: Query parameters (optional)
+            batch_size: Rows fetched per round trip and per record batch
+            resume_key: Unique, sortable result column to order by and resume
+                after on transient failures (see ``execute_query_stream``)
+            
+        Yields:
+            pyarrow.RecordBatch per fetched batch (a single empty batch
+            carrying the schema when the query returns no rows)
+        """
+        if batch_size <= 0:
+            raise ValueError("batch_size must be a positive integer")
         
-        UNION ALL
+        def _last_key(batch: pa.RecordBatch):
+            return batch.column(resume_key)[-1].as_py() if batch.num_rows else None
         
-        SELECT 
-            'Stored_Procedure_Count' as AnalysisType,
-            CAST(COUNT(*) as VARCHAR(50)) as Value,
-            NULL, NULL, NULL, NULL
-        FROM INFORMATION_SCHEMA.ROUTINES 
-        WHERE ROUTINE_TYPE = 'PROCEDURE'
+        return self._resilient_stream(
+            lambda run_query, run_params: self._stream_arrow_batches(run_query, run_params, batch_size),
+            query, params, resume_key, _last_key
+        )
+    
+    def _stream_arrow_batches(self,
+                              query: str,
+                              params: Optional[Dict[str, Any]],
+                              batch_size: int) -> Iterator[pa.RecordBatch]:
+        """Single streaming attempt of ``execute_query_arrow_batches``."""
+        if not self._sqlalchemy_engine:
+            if not self.connect():
+                raise ConnectionError("Failed to establish connection to CXMIDL server")
         
-        UNION ALL
+        phases = {phase: 0.0 for phase in _QUERY_PHASES}
+        total_rows = 0
+        nbytes = 0
+        failed = False
+        try:
+            start_time = time.perf_counter()
+            
+            with self._acquire_connection() as conn:
+                phase_start = time.perf_counter()
+                phases["acquire"] = phase_start - start_time
+                streaming_conn = conn.execution_options(
+                    stream_results=True,
+                    max_row_buffer=batch_size
+                )
+                result = streaming_conn.execute(_text_statement(query), params or {})
+                description = result.cursor.description
+                names = [column[0] for column in description]
+                types = [_arrow_type_for_column(column) for column in description]
+                phases["execute"] = time.perf_counter() - phase_start
+                
+                while True:
+                    fetch_start = time.perf_counter()
+                    rows = result.fetchmany(batch_size)
+                    convert_start = time.perf_counter()
+                    phases["fetch"] += convert_start - fetch_start
+                    if not rows:
+                        break
+                    
+                    batch = _rows_to_record_batch(rows, names, types)
+                    # Pin inferred types after the first batch so every batch
+                    # shares a schema (all-null columns stay open until typed)
+                    types = [
+                        field.type if arrow_type is None and not pa.types.is_null(field.type) else arrow_type
+                        for arrow_type, field in zip(types, batch.schema)
+                    ]
+                    phases["convert"] += time.perf_counter() - convert_start
+                    total_rows += batch.num_rows
+                    nbytes += batch.nbytes
+                    yield batch
+                
+                if total_rows == 0:
+                    # Keep column names/types visible for empty results
+                    yield _rows_to_record_batch([], names, types)
+                
+                result.close()
+            
+            execution_time = time.perf_counter() - start_time
+            logger.info(f"Arrow query executed successfully in {execution_time:.2f}s, returned {total_rows} rows")
+            
+        except Exception as e:
+            failed = True
+            logger.error(f"Arrow query execution failed: {e}")
+            raise
         
-        SELECT 
-            'Function_Count' as AnalysisType,
-            CAST(COUNT(*) as VARCHAR(50)) as Value,
-            NULL, NULL, NULL, NULL
-        FROM INFORMATION_SCHEMA.ROUTINES 
-        WHERE ROUTINE_TYPE = 'FUNCTION'
+        finally:
+            if self._metrics is not None:
+                self._metrics.record(query, phases, total_rows, nbytes, error=failed)
+    
+    def execute_query_arrow(self,
+                            query: str,
+                            params: Optional[Dict[str, Any]] = None,
+                            batch_size: int = 65536) -> pa.Table:
+        """
+        Execute SQL query and return the result as a pyarrow Table.
         
-        ORDER BY AnalysisType
+        Args:
+            query: SQL query to execute
+            params: Query parameters (optional)
+            batch_size: Rows fetched per round trip
+            
+        Returns:
+            pyarrow.Table assembled from the fetched record batches
         """
+        batches = list(self.execute_query_arrow_batches(query, params, batch_size))
+        if not batches:
+            return pa.table({})
         
+        tables = [pa.Table.from_batches([batch]) for batch in batches]
         try:
-            result = self.execute_query(orchestration_query, return_dataframe=False)
+            return pa.concat_tables(tables, promote_options="permissive")
+        except TypeError:
+            # pyarrow < 14 spells schema promotion differently
+            return pa.concat_tables(tables, promote=True)
+    
+    def get_server_info(self) -> Dict[str, Any]:
+        """Get comprehensive server information."""
+        result = self.execute_query(self.backend.server_info_query, return_dataframe=False, cache_ttl=self.cache_ttl)
+        return result[0] if result else {}
+    
+    def get_databases(self) -> pd.DataFrame:
+        """Get list of available databases."""
+        return self.execute_query(self.backend.databases_query, cache_ttl=self.cache_ttl)
+    
+    def get_orchestration_analysis(self) -> Dict[str, Any]:
+        """Get comprehensive Orchestration database analysis."""
+        try:
+            result = self.execute_query(self.backend.analysis_query, return_dataframe=False, cache_ttl=self.cache_ttl)
             
             # Structure the results
             analysis = {
@@ -293,11 +2348,16 @@ class CXMIDLOrchestrationConnector:
                         "database_name": item['DatabaseName'],
                         "current_user": item['CurrentUser'],
                         "session_id": item['SessionId'],
-                        "analysis_time": item['AnalysisTime'].isoformat() if item['AnalysisTime'] else None,
+                        "analysis_time": (
+                            item['AnalysisTime'].isoformat() if hasattr(item['AnalysisTime'], "isoformat")
+                            else item['AnalysisTime']
+                        ),
                         "sql_version": item['SqlVersion']
                     })
                 else:
-                    analysis[item['AnalysisType'].lower()] = int(item['Value']) if item['Value'] else 0
+                    # UNION ALL names columns after the first SELECT, so counts arrive as DatabaseName
+                    value = item.get('Value', item.get('DatabaseName'))
+                    analysis[item['AnalysisType'].lower()] = int(value) if value else 0
             
             logger.info(f"Orchestration database analysis completed: {len(result)} metrics collected")
             return analysis
@@ -314,54 +2374,265 @@ class CXMIDLOrchestrationConnector:
     
     def get_orchestration_tables(self, schema: str = "dbo") -> pd.DataFrame:
         """Get detailed table information for Orchestration database."""
-        tables_query = """
-        SELECT 
-            t.TABLE_SCHEMA as SchemaName,
-            t.TABLE_NAME as TableName,
-            t.TABLE_TYPE as TableType,
-            c.COLUMN_COUNT as ColumnCount,
-            CASE 
-                WHEN t.TABLE_NAME LIKE '%orchestr%' OR t.TABLE_NAME LIKE '%workflow%' OR t.TABLE_NAME LIKE '%job%' OR t.TABLE_NAME LIKE '%task%' THEN 'Orchestration_Core'
-                WHEN t.TABLE_NAME LIKE '%log%' OR t.TABLE_NAME LIKE '%audit%' OR t.TABLE_NAME LIKE '%history%' THEN 'Logging_Audit'
-                WHEN t.TABLE_NAME LIKE '%config%' OR t.TABLE_NAME LIKE '%setting%' OR t.TABLE_NAME LIKE '%param%' THEN 'Configuration'
-                ELSE 'General'
-            END as TableCategory
-        FROM INFORMATION_SCHEMA.TABLES t
-        LEFT JOIN (
-            SELECT 
-                TABLE_SCHEMA,
-                TABLE_NAME,
-                COUNT(*) as COLUMN_COUNT
-            FROM INFORMATION_SCHEMA.COLUMNS
-            GROUP BY TABLE_SCHEMA, TABLE_NAME
-        ) c ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
-        WHERE t.TABLE_SCHEMA = ?
-        ORDER BY TableCategory, t.TABLE_NAME
-        """
-        
-        return self.execute_query(tables_query, params={"schema": schema})
-        """Get table information for a specific schema."""
-        table_query = """
-        SELECT 
-            t.TABLE_SCHEMA as SchemaName,
-            t.TABLE_NAME as TableName,
-            t.TABLE_TYPE as TableType,
-            c.COLUMN_COUNT as ColumnCount
-        FROM INFORMATION_SCHEMA.TABLES t
-        LEFT JOIN (
-            SELECT 
-                TABLE_SCHEMA,
-                TABLE_NAME,
-                COUNT(*) as COLUMN_COUNT
-            FROM INFORMATION_SCHEMA.COLUMNS
-            GROUP BY TABLE_SCHEMA, TABLE_NAME
-        ) c ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
-        WHERE t.TABLE_SCHEMA = ?
-        ORDER BY t.TABLE_NAME
-        """
-        
-        return self.execute_query(table_query, params={"schema": schema})
+        return self.execute_query(
+            self.backend.tables_query,
+            params={"schema": self.backend.schema_name(schema)},
+            cache_ttl=self.cache_ttl
+        )
+    
+    def _bulk_load(self,
+                   table: str,
+                   data: Any,
+                   schema: str,
+                   columns: Optional[List[str]],
+                   batch_size: int,
+                   key_columns: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Shared batch loop for bulk_insert/bulk_upsert.
+        
+        Each batch is its own transaction, except inside ``transaction()``,
+        where the batches join the pinned transaction and commit with it.
+        The upsert staging table is dropped whether or not the load succeeds.
+        """
+        if not self._sqlalchemy_engine:
+            if not self.connect():
+                raise ConnectionError("Failed to establish connection to CXMIDL server")
+        
+        backend = self.backend
+        target = backend.qualify(schema, table)
+        stage = backend.stage_table_name(uuid.uuid4().hex[:12])
+        rows_loaded = 0
+        batches = 0
+        start_time = time.perf_counter()
+        statement = None
+        
+        try:
+            with self._acquire_connection() as conn:
+                pinned = self._pinned_connection is not None
+                paramstyle = conn.dialect.dbapi.paramstyle
+                cursor = conn.connection.dbapi_connection.cursor()
+                if hasattr(cursor, "fast_executemany"):
+                    # pyodbc: bind whole parameter arrays instead of row-by-row round trips
+                    cursor.fast_executemany = True
+                staged = False
+                
+                try:
+                    for batch_columns, rows in _iter_row_batches(data, batch_size, columns):
+                        if not rows:
+                            continue
+                        column_list = ", ".join(backend.quote_identifier(column) for column in batch_columns)
+                        placeholders = positional_placeholders(len(batch_columns), paramstyle)
+                        
+                        with nullcontext() if pinned else conn.begin():
+                            if key_columns is None:
+                                statement = f"INSERT INTO {target} ({column_list}) VALUES ({placeholders})"
+                                cursor.executemany(statement, rows)
+                            else:
+                                if not staged:
+                                    staged = True
+                                    cursor.execute(backend.create_stage_statement(target, stage, column_list))
+                                statement = f"INSERT INTO {stage} ({column_list}) VALUES ({placeholders})"
+                                cursor.executemany(statement, rows)
+                                cursor.execute(backend.upsert_statement(target, stage, batch_columns, key_columns))
+                                cursor.execute(backend.clear_stage_statement(stage))
+                        
+                        batches += 1
+                        rows_loaded += len(rows)
+                        logger.info(f"Bulk loaded batch {batches} into {schema}.{table}: {len(rows)} rows ({rows_loaded} total)")
+                finally:
+                    if staged:
+                        try:
+                            with nullcontext() if pinned else conn.begin():
+                                cursor.execute(backend.drop_stage_statement(stage))
+                        except Exception as e:
+                            # A temporary stage still goes away with its session
+                            logger.warning(f"Could not drop staging table {stage}: {e}")
+                    cursor.close()
+            
+            elapsed = time.perf_counter() - start_time
+            summary = {
+                "timestamp": datetime.now().isoformat(),
+                "table": f"{schema}.{table}",
+                "operation": "upsert" if key_columns else "insert",
+                "rows": rows_loaded,
+                "batches": batches,
+                "batch_size": batch_size,
+                "seconds": round(elapsed, 3),
+                "rows_per_second": round(rows_loaded / elapsed, 1) if elapsed else 0.0,
+                "status": "completed",
+                "integration_id": self.integration_id
+            }
+            logger.info(
+                f"Bulk {summary['operation']} into {schema}.{table} completed: {rows_loaded} rows "
+                f"in {elapsed:.2f}s ({summary['rows_per_second']:.0f} rows/s)"
+            )
+            if self._metrics is not None and statement is not None:
+                self._metrics.record(statement, {"execute": elapsed}, rows_loaded)
+            return summary
+            
+        except Exception as e:
+            logger.error(f"Bulk load into {schema}.{table} failed after {rows_loaded} rows: {e}")
+            raise
+    
+    def bulk_insert(self,
+                    table: str,
+                    data: Any,
+                    schema: str = "dbo",
+                    columns: Optional[List[str]] = None,
+                    batch_size: int = 10000) -> Dict[str, Any]:
+        """
+        Bulk insert rows using pyodbc ``fast_executemany``.
+        
+        Each batch is sent as one parameter array and committed as its own
+        transaction, so a failure leaves earlier batches loaded and reports
+        how far the load got. Inside ``transaction()`` the batches join the
+        open transaction instead and commit or roll back with it.
+        
+        Args:
+            table: Target table name
+            data: DataFrame, Arrow Table/RecordBatch, or iterable of batches
+            schema: Target schema
+            columns: Columns to load (default: all columns of the input)
+            batch_size: Rows per batch/transaction
+            
+        Returns:
+            Load summary with rows, batches, elapsed time and rows/second
+        """
+        return self._bulk_load(table, data, schema, columns, batch_size)
+    
+    def bulk_upsert(self,
+                    table: str,
+                    data: Any,
+                    key_columns: List[str],
+                    schema: str = "dbo",
+                    columns: Optional[List[str]] = None,
+                    batch_size: int = 10000) -> Dict[str, Any]:
+        """
+        Bulk upsert rows: stage each batch in a temp table, then MERGE by key
+        (INSERT ... ON CONFLICT on non-SQL Server backends).
+        
+        Args:
+            table: Target table name
+            data: DataFrame, Arrow Table/RecordBatch, or iterable of batches
+            key_columns: Columns identifying a row for matching
+            schema: Target schema
+            columns: Columns to load (default: all columns of the input)
+            batch_size: Rows per batch/transaction
+            
+        Returns:
+            Load summary with rows, batches, elapsed time and rows/second
+        """
+        if not key_columns:
+            raise ValueError("key_columns are required for bulk_upsert")
+        return self._bulk_load(table, data, schema, columns, batch_size, key_columns=key_columns)
+    
+    def export_table(self,
+                     table: str,
+                     output_dir: Union[str, Path],
+                     schema: str = "dbo",
+                     key_column: Optional[str] = None,
+                     **options) -> Dict[str, Any]:
+        """
+        Export one table to sliced Parquet files with a manifest.
+        
+        See ``cxmidl_export.export_table`` for the available options.
+        """
+        from cxmidl_export import export_table
+        return export_table(self, table, output_dir, schema=schema, key_column=key_column, **options)
     
+    def export_tables(self,
+                      output_dir: Union[str, Path],
+                      tables: Optional[List[str]] = None,
+                      schema: str = "dbo",
+                      **options) -> Dict[str, Any]:
+        """
+        Export tables (default: every base table in ``schema``) to Parquet in parallel.
+        
+        See ``cxmidl_export.export_tables`` for the available options.
+        """
+        from cxmidl_export import export_tables
+        return export_tables(self, output_dir, tables=tables, schema=schema, **options)
+    
+    def sync_table(self,
+                   table: str,
+                   output_dir: Union[str, Path],
+                   watermark_column: str,
+                   schema: str = "dbo",
+                   key_columns: Optional[List[str]] = None,
+                   **options) -> Dict[str, Any]:
+        """
+        Incrementally sync a table past its stored watermark into local Parquet.
+        
+        See ``cxmidl_sync.sync_table`` for the available options.
+        """
+        from cxmidl_sync import sync_table
+        return sync_table(self, table, output_dir, watermark_column,
+                          schema=schema, key_columns=key_columns, **options)
+
+    def reconcile_table(self,
+                        table: str,
+                        export: Any,
+                        schema: str = "dbo",
+                        key_column: Optional[str] = None,
+                        **options) -> Dict[str, Any]:
+        """
+        Verify an exported copy (Parquet directory or DataFrame) against the source by chunked checksums.
+
+        See ``cxmidl_reconcile.reconcile_table`` for the available options.
+        """
+        from cxmidl_reconcile import reconcile_table
+        return reconcile_table(self, table, export, schema=schema, key_column=key_column, **options)
+
+    def change_feed(self,
+                    tables: List[Union[str, Dict[str, Any]]],
+                    state_path: Union[str, Path],
+                    mode: str = "change_tracking",
+                    **options):
+        """
+        Open a Change Tracking / CDC feed yielding Arrow batches of table changes.
+
+        See ``cxmidl_change_feed.ChangeFeed`` for the available options.
+        """
+        from cxmidl_change_feed import ChangeFeed
+        return ChangeFeed(self, tables, state_path, mode=mode, **options)
+
+    def catalog_snapshot(self,
+                         path: Union[str, Path],
+                         refresh: bool = True):
+        """
+        Open the local catalog snapshot at ``path``, refreshing it incrementally.
+
+        See ``cxmidl_catalog.CatalogSnapshot`` for the available lookups.
+        """
+        from cxmidl_catalog import create_catalog_snapshot
+        return create_catalog_snapshot(self, path, refresh=refresh)
+
+    def dependency_graph(self, snapshot=None, **options):
+        """
+        Build the in-memory object dependency graph.
+
+        Uses ``snapshot`` (a CatalogSnapshot) when given, otherwise reads the
+        catalog from the server. See ``cxmidl_dependency_graph.DependencyGraph``.
+        """
+        from cxmidl_dependency_graph import DependencyGraph
+        if snapshot is not None:
+            return DependencyGraph.from_catalog(snapshot, **options)
+        return DependencyGraph.from_connector(self, **options)
+
+    def analyze_stored_procedures(self,
+                                  output_dir: Union[str, Path],
+                                  procedures: Optional[List[str]] = None,
+                                  incremental: bool = True,
+                                  **options) -> Dict[str, Any]:
+        """
+        Write Technical Analysis reports for stored procedures in one batch.
+
+        See ``cxmidl_sp_analyzer.analyze_procedures`` for the available options.
+        """
+        from cxmidl_sp_analyzer import analyze_procedures
+        return analyze_procedures(self, output_dir, procedures=procedures,
+                                  incremental=incremental, **options)
+
     def health_check(self) -> Dict[str, Any]:
         """Perform comprehensive health check."""
         try:
@@ -369,13 +2640,7 @@ class CXMIDLOrchestrationConnector:
             server_info = self.get_server_info()
             
             # Performance metrics
-            perf_query = """
-            SELECT 
-                (SELECT COUNT(*) FROM sys.dm_exec_sessions WHERE is_user_process = 1) as ActiveSessions,
-                (SELECT COUNT(*) FROM sys.dm_exec_requests) as ActiveRequests,
-                (SELECT COUNT(*) FROM sys.databases WHERE state_desc = 'ONLINE') as OnlineDatabases
-            """
-            perf_result = self.execute_query(perf_query, return_dataframe=False)[0]
+            perf_result = self.execute_query(self.backend.health_query, return_dataframe=False)[0]
             
             health_status = {
                 "timestamp": datetime.now().isoformat(),
@@ -384,6 +2649,7 @@ class CXMIDLOrchestrationConnector:
                 "connection_status": "healthy",
                 "server_info": server_info,
                 "performance_metrics": perf_result,
+                "circuit_breaker": self._circuit_breaker.statistics(),
                 "integration_id": self.integration_id,
                 "version": self.version
             }
@@ -398,25 +2664,28 @@ class CXMIDLOrchestrationConnector:
                 "server": self.server,
                 "connection_status": "unhealthy",
                 "error": str(e),
+                "circuit_breaker": self._circuit_breaker.statistics(),
                 "integration_id": self.integration_id
             }
     
-    def _cleanup_connections(self):
-        """Clean up connection objects."""
+    def _cleanup_connections(self, discard_pool: bool = False):
+        """
+        Clean up connection objects.
+        
+        The shared pool stays warm for other connectors unless ``discard_pool``
+        is set (e.g. after a failed connect, when its connections are suspect).
+        """
         try:
-            if self._pyodbc_connection:
-                self._pyodbc_connection.close()
-                self._pyodbc_connection = None
-                
-            if self._sqlalchemy_engine:
-                self._sqlalchemy_engine.dispose()
-                self._sqlalchemy_engine = None
+            if discard_pool:
+                _discard_pooled_engine(self.pool_key)
+            self._pooled_engine = None
+            self._sqlalchemy_engine = None
                 
         except Exception as e:
             logger.error(f"Error during connection cleanup: {e}")
     
     def close(self):
-        """Close all connections and clean up resources."""
+        """Release this connector's handle on the shared pool."""
         self._cleanup_connections()
         logger.info("CXMIDL connector closed successfully")
     
@@ -431,17 +2700,19 @@ class CXMIDLOrchestrationConnector:
 
 
 # Enterprise Integration Functions
-def create_cxmidl_connector(database: str = "Orchestration") -> CXMIDLOrchestrationConnector:
+def create_cxmidl_connector(database: str = "Orchestration", **options) -> CXMIDLOrchestrationConnector:
     """
     Factory function to create CXMIDL connector with enterprise defaults.
     
     Args:
         database: Target database name
+        **options: Further CXMIDLOrchestrationConnector arguments
+            (e.g. ``url`` or ``engine`` for a local backend)
         
     Returns:
         CXMIDLOrchestrationConnector instance
     """
-    return CXMIDLOrchestrationConnector(database=database)
+    return CXMIDLOrchestrationConnector(database=database, **options)
 
 
 def test_cxmidl_integration() -> Dict[str, Any]:
@@ -465,6 +2736,8 @@ def test_cxmidl_integration() -> Dict[str, Any]:
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    
     # Example usage and testing
     print("🏢 CXMIDL Azure SQL Server Integration Test")
     print("=" * 50)
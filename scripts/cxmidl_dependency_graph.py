@@ -0,0 +1,358 @@
+"""
+CXMIDL Orchestration Dependency Graph
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+This module builds the procedure/table/view dependency graph of the
+Orchestration database once, in memory, as compressed sparse row (CSR)
+adjacency arrays. From it we derive strongly connected components,
+topological migration waves and transitive impact sets for re-planning the
+stored procedure migration after each schema change.
+"""
+
+import logging
+import time
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from cxmidl_catalog import OBJECTS_QUERY, CatalogSnapshot
+from cxmidl_connector import CXMIDLOrchestrationConnector
+from cxmidl_dialects import require_sql_server
+
+logger = logging.getLogger(__name__)
+
+# Procedures, tables, views, functions and triggers
+DEFAULT_OBJECT_TYPES = ("P", "U", "V", "FN", "IF", "TF", "TR", "SN")
+
+EDGES_QUERY = """
+SELECT DISTINCT d.referencing_id, d.referenced_id
+FROM sys.sql_expression_dependencies d
+WHERE d.referenced_id IS NOT NULL AND d.referenced_database_name IS NULL
+"""
+
+
+def _csr(n: int, edges: Sequence[Tuple[int, int]]) -> Tuple[array, array]:
+    """Compressed sparse row adjacency (offsets, targets) for ``n`` nodes."""
+    offsets = array("i", [0]) * (n + 1)
+    for source, _ in edges:
+        offsets[source + 1] += 1
+    for i in range(n):
+        offsets[i + 1] += offsets[i]
+    targets = array("i", [0]) * len(edges)
+    cursor = array("i", offsets[:n])
+    for source, target in edges:
+        targets[cursor[source]] = target
+        cursor[source] += 1
+    return offsets, targets
+
+
+def _bits(mask: int) -> Iterable[int]:
+    """Indices of the set bits of ``mask``."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class DependencyGraph:
+    """Dependency DAG of Orchestration objects with SCC, wave and impact analysis."""
+
+    def __init__(self,
+                 nodes: Sequence[Dict[str, Any]],
+                 edges: Iterable[Tuple[int, int]]):
+        """
+        Build the graph.
+
+        Args:
+            nodes: Object rows with ``object_id``, ``schema_name``, ``name`` and ``type``
+            edges: (referencing_id, referenced_id) pairs; an edge means the
+                referencing object depends on the referenced one. Edges to
+                objects outside ``nodes`` are ignored.
+        """
+        start = time.perf_counter()
+        self.object_ids = array("q", (node["object_id"] for node in nodes))
+        self.names = [f"{node['schema_name']}.{node['name']}" for node in nodes]
+        self.types = [node["type"] for node in nodes]
+        self._index = {object_id: i for i, object_id in enumerate(self.object_ids)}
+        self._by_name = {name.lower(): i for i, name in enumerate(self.names)}
+
+        dense = sorted({
+            (self._index[source], self._index[target])
+            for source, target in edges
+            if source in self._index and target in self._index
+        })
+        n = len(self.names)
+        self.offsets, self.targets = _csr(n, dense)
+        self.reverse_offsets, self.reverse_targets = _csr(n, [(t, s) for s, t in dense])
+
+        self._strongly_connected_components()
+        self._levels()
+        self._dependency_closure: Optional[List[int]] = None
+        self._impact_closure: Optional[List[int]] = None
+        self.build_seconds = time.perf_counter() - start
+        logger.info(
+            f"Dependency graph built in {self.build_seconds * 1000:.1f}ms: "
+            f"{n} objects, {len(dense)} edges, {self.component_count} components"
+        )
+
+    # ------------------------------------------------------------------
+    # Construction helpers
+    # ------------------------------------------------------------------
+
+    @classmethod
+    def from_catalog(cls,
+                     snapshot: CatalogSnapshot,
+                     object_types: Optional[Sequence[str]] = DEFAULT_OBJECT_TYPES) -> "DependencyGraph":
+        """Build from a local catalog snapshot (no server round trips)."""
+        nodes = snapshot.list_objects()
+        if object_types:
+            nodes = [node for node in nodes if node["type"] in object_types]
+        return cls(nodes, snapshot.dependency_edges())
+
+    @classmethod
+    def from_connector(cls,
+                       connector: CXMIDLOrchestrationConnector,
+                       object_types: Optional[Sequence[str]] = DEFAULT_OBJECT_TYPES) -> "DependencyGraph":
+        """Build from the server with two catalog queries run concurrently."""
+        require_sql_server(connector, "Dependency graphs")
+        results = connector.execute_many([OBJECTS_QUERY, EDGES_QUERY], return_dataframe=False)
+        failures = [item["error"] for item in results if not item["success"]]
+        if failures:
+            raise RuntimeError(f"Dependency graph query failed: {failures[0]}")
+        nodes, edges = results[0]["result"], results[1]["result"]
+        if object_types:
+            nodes = [node for node in nodes if node["type"] in object_types]
+        return cls(nodes, ((edge["referencing_id"], edge["referenced_id"]) for edge in edges))
+
+    def _strongly_connected_components(self):
+        """
+        Iterative Tarjan. Components are numbered in reverse topological
+        order, so every dependency of component ``c`` has a number <= ``c``.
+        """
+        n = len(self.names)
+        offsets, targets = self.offsets, self.targets
+        index = array("i", [-1]) * n
+        low = array("i", [0]) * n
+        on_stack = bytearray(n)
+        component = array("i", [-1]) * n
+        stack: List[int] = []
+        counter = count = 0
+
+        for root in range(n):
+            if index[root] != -1:
+                continue
+            index[root] = low[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack[root] = 1
+            work = [(root, offsets[root])]
+            while work:
+                v, position = work[-1]
+                if position < offsets[v + 1]:
+                    w = targets[position]
+                    work[-1] = (v, position + 1)
+                    if index[w] == -1:
+                        index[w] = low[w] = counter
+                        counter += 1
+                        stack.append(w)
+                        on_stack[w] = 1
+                        work.append((w, offsets[w]))
+                    elif on_stack[w] and index[w] < low[v]:
+                        low[v] = index[w]
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    if low[v] < low[parent]:
+                        low[parent] = low[v]
+                if low[v] == index[v]:
+                    while True:
+                        w = stack.pop()
+                        on_stack[w] = 0
+                        component[w] = count
+                        if w == v:
+                            break
+                    count += 1
+
+        self.component = component
+        self.component_count = count
+        members: List[List[int]] = [[] for _ in range(count)]
+        for node in range(n):
+            members[component[node]].append(node)
+        self.component_members = members
+
+    def _levels(self):
+        """Longest dependency chain below each component (its migration wave)."""
+        level = array("i", [0]) * self.component_count
+        component, offsets, targets = self.component, self.offsets, self.targets
+        for c, members in enumerate(self.component_members):
+            deepest = 0
+            for v in members:
+                for position in range(offsets[v], offsets[v + 1]):
+                    d = component[targets[position]]
+                    if d != c and level[d] + 1 > deepest:
+                        deepest = level[d] + 1
+            level[c] = deepest
+        self.component_level = level
+
+    def _closure(self, reverse: bool) -> List[int]:
+        """
+        Transitive closure per component as integer bitsets.
+
+        One pass over the condensation in topological order (dependencies
+        first, or dependents first when ``reverse``) gives every component's
+        full reachable set at once.
+        """
+        offsets, targets = (
+            (self.reverse_offsets, self.reverse_targets) if reverse else (self.offsets, self.targets)
+        )
+        component = self.component
+        reach = [0] * self.component_count
+        order = range(self.component_count - 1, -1, -1) if reverse else range(self.component_count)
+        for c in order:
+            mask = 1 << c
+            for v in self.component_members[c]:
+                for position in range(offsets[v], offsets[v + 1]):
+                    d = component[targets[position]]
+                    if d != c:
+                        mask |= reach[d]
+            reach[c] = mask
+        return reach
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def node(self, name: str) -> int:
+        """Dense node index for ``schema.name`` (or bare name when unique)."""
+        key = name.replace("[", "").replace("]", "").lower()
+        if key in self._by_name:
+            return self._by_name[key]
+        matches = [i for full, i in self._by_name.items() if full.split(".", 1)[-1] == key]
+        if len(matches) == 1:
+            return matches[0]
+        if matches:
+            raise KeyError(f"{name} is ambiguous; qualify it with a schema")
+        raise KeyError(f"{name} is not in the dependency graph")
+
+    def _names(self, component_mask: int, exclude: Optional[int] = None,
+               types: Optional[Sequence[str]] = None) -> List[str]:
+        nodes = [
+            v for c in _bits(component_mask) for v in self.component_members[c]
+            if v != exclude and (types is None or self.types[v] in types)
+        ]
+        return sorted(self.names[v] for v in nodes)
+
+    def dependencies(self, name: str, transitive: bool = True,
+                     types: Optional[Sequence[str]] = None) -> List[str]:
+        """Objects ``name`` depends on (directly or transitively)."""
+        v = self.node(name)
+        if not transitive:
+            return sorted(self.names[w] for w in self.targets[self.offsets[v]:self.offsets[v + 1]]
+                          if types is None or self.types[w] in types)
+        if self._dependency_closure is None:
+            self._dependency_closure = self._closure(reverse=False)
+        return self._names(self._dependency_closure[self.component[v]], exclude=v, types=types)
+
+    def impact_set(self, name: str, transitive: bool = True,
+                   types: Optional[Sequence[str]] = None) -> List[str]:
+        """Objects affected by a change to ``name`` (its direct or transitive dependents)."""
+        v = self.node(name)
+        if not transitive:
+            return sorted(self.names[w] for w in
+                          self.reverse_targets[self.reverse_offsets[v]:self.reverse_offsets[v + 1]]
+                          if types is None or self.types[w] in types)
+        if self._impact_closure is None:
+            self._impact_closure = self._closure(reverse=True)
+        return self._names(self._impact_closure[self.component[v]], exclude=v, types=types)
+
+    def impact_analysis(self, changed: Sequence[str],
+                        types: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Impact of a set of changed objects.
+
+        Args:
+            changed: Changed object names
+            types: Only report impacted objects of these types (e.g. ``("P",)``)
+
+        Returns:
+            Per-object impact sets, their union and the migration waves
+            touched, numbered as in ``migration_waves(types)``
+        """
+        if self._impact_closure is None:
+            self._impact_closure = self._closure(reverse=True)
+        per_object = {}
+        union = 0
+        changed_names = set()
+        for name in changed:
+            v = self.node(name)
+            mask = self._impact_closure[self.component[v]]
+            per_object[name] = self._names(mask, exclude=v, types=types)
+            changed_names.add(self.names[v])
+            union |= mask
+        impacted = [full for full in self._names(union, types=types) if full not in changed_names]
+        wave_of = self._wave_numbers(types)
+        waves = sorted({wave_of[self.component_level[self.component[self.node(full)]]] for full in impacted})
+        return {
+            "changed": list(changed),
+            "impact": per_object,
+            "impacted": impacted,
+            "impacted_count": len(impacted),
+            "waves": waves
+        }
+
+    def cycles(self) -> List[List[str]]:
+        """Strongly connected components with more than one object (or a self-reference)."""
+        cycles = []
+        for members in self.component_members:
+            v = members[0]
+            self_loop = v in self.targets[self.offsets[v]:self.offsets[v + 1]]
+            if len(members) > 1 or self_loop:
+                cycles.append(sorted(self.names[w] for w in members))
+        return cycles
+
+    def migration_waves(self, types: Optional[Sequence[str]] = ("P",)) -> List[List[str]]:
+        """
+        Topological migration waves.
+
+        Wave ``k`` holds objects whose dependencies all sit in earlier waves;
+        members of a cycle share a wave. Levels are computed over the whole
+        graph (so tables and views order the procedures above them) and then
+        renumbered densely over the objects of ``types``.
+
+        Args:
+            types: Object types to place in waves (None for all)
+
+        Returns:
+            Waves in migration order, each a sorted list of object names
+        """
+        wave_of = self._wave_numbers(types)
+        waves: List[List[str]] = [[] for _ in wave_of]
+        for v, name in enumerate(self.names):
+            if types is None or self.types[v] in types:
+                waves[wave_of[self.component_level[self.component[v]]]].append(name)
+        return [sorted(wave) for wave in waves]
+
+    def _wave_numbers(self, types: Optional[Sequence[str]]) -> Dict[int, int]:
+        """Dense wave number of every level that holds an object of ``types``."""
+        levels = {
+            self.component_level[self.component[v]]
+            for v in range(len(self.names))
+            if types is None or self.types[v] in types
+        }
+        return {level: wave for wave, level in enumerate(sorted(levels))}
+
+    def statistics(self) -> Dict[str, Any]:
+        """Node, edge and component counts plus build time."""
+        by_type: Dict[str, int] = {}
+        for object_type in self.types:
+            by_type[object_type] = by_type.get(object_type, 0) + 1
+        return {
+            "objects": len(self.names),
+            "objects_by_type": by_type,
+            "edges": len(self.targets),
+            "components": self.component_count,
+            "cycles": len(self.cycles()),
+            "max_wave": max(self.component_level) if self.component_count else 0,
+            "build_seconds": round(self.build_seconds, 6)
+        }
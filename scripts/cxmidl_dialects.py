@@ -0,0 +1,601 @@
+"""
+CXMIDL Orchestration Backend Dialect Adapters
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+CXMIDLOrchestrationConnector talks T-SQL to Azure SQL, but the same data path
+can run against a local SQLAlchemy backend (SQLite, DuckDB, PostgreSQL or a
+SQL Server container) for load tests and profiling. A dialect adapter holds
+everything that differs between backends: identifier quoting, catalog and
+primary key queries, pagination, staging tables and upserts, and the engine
+options. The connector and the export/sync/bulk paths build their SQL
+through ``connector.backend`` instead of hardcoding T-SQL.
+"""
+
+from typing import Any, Dict, List, Optional, Sequence
+
+# Table classification shared by every backend's tables query
+_TABLE_CATEGORY = """CASE
+                WHEN {name} LIKE '%orchestr%' OR {name} LIKE '%workflow%' OR {name} LIKE '%job%' OR {name} LIKE '%task%' THEN 'Orchestration_Core'
+                WHEN {name} LIKE '%log%' OR {name} LIKE '%audit%' OR {name} LIKE '%history%' THEN 'Logging_Audit'
+                WHEN {name} LIKE '%config%' OR {name} LIKE '%setting%' OR {name} LIKE '%param%' THEN 'Configuration'
+                ELSE 'General'
+            END"""
+
+
+def positional_placeholders(count: int, paramstyle: str) -> str:
+    """Comma-separated DBAPI placeholders for ``count`` positional parameters."""
+    if paramstyle == "qmark":
+        return ", ".join("?" for _ in range(count))
+    if paramstyle in ("format", "pyformat"):
+        return ", ".join("%s" for _ in range(count))
+    if paramstyle == "numeric":
+        return ", ".join(f":{i}" for i in range(1, count + 1))
+    if paramstyle == "numeric_dollar":
+        return ", ".join(f"${i}" for i in range(1, count + 1))
+    raise ValueError(f"Positional bulk loads are not supported for DBAPI paramstyle '{paramstyle}'")
+
+
+class DialectAdapter:
+    """
+    ANSI / INFORMATION_SCHEMA backend (PostgreSQL, DuckDB and others).
+
+    Subclasses override the queries and statements their backend spells
+    differently. Every catalog query takes ``:schema`` (and ``:table`` /
+    ``:column`` where noted) and returns the column names the connector's
+    T-SQL queries always have.
+    """
+
+    name = "ansi"
+    default_schema: Optional[str] = "public"
+    # Data types whose values are opaque, monotonically increasing row versions
+    rowversion_types: Sequence[str] = ()
+    count_expression = "COUNT(*)"
+
+    server_info_query = """
+        SELECT
+            current_database() as CurrentDatabase,
+            version() as SqlVersion,
+            CURRENT_USER as CurrentUser,
+            CURRENT_TIMESTAMP as CurrentTime
+        """
+
+    databases_query = """
+        SELECT DISTINCT catalog_name as DatabaseName
+        FROM INFORMATION_SCHEMA.SCHEMATA
+        ORDER BY catalog_name
+        """
+
+    analysis_query = """
+        SELECT
+            'Database_Metadata' as AnalysisType,
+            current_database() as DatabaseName,
+            CURRENT_USER as CurrentUser,
+            NULL as SessionId,
+            CURRENT_TIMESTAMP as AnalysisTime,
+            version() as SqlVersion
+        UNION ALL
+        SELECT 'Schema_Count', CAST(COUNT(DISTINCT SCHEMA_NAME) as VARCHAR(50)), NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.SCHEMATA
+        WHERE SCHEMA_NAME NOT IN ('information_schema', 'pg_catalog')
+        UNION ALL
+        SELECT 'Table_Count', CAST(COUNT(*) as VARCHAR(50)), NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.TABLES WHERE TABLE_TYPE = 'BASE TABLE'
+        UNION ALL
+        SELECT 'View_Count', CAST(COUNT(*) as VARCHAR(50)), NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.VIEWS
+        ORDER BY AnalysisType
+        """
+
+    tables_query = f"""
+        SELECT
+            t.TABLE_SCHEMA as SchemaName,
+            t.TABLE_NAME as TableName,
+            t.TABLE_TYPE as TableType,
+            c.COLUMN_COUNT as ColumnCount,
+            {_TABLE_CATEGORY.format(name="t.TABLE_NAME")} as TableCategory
+        FROM INFORMATION_SCHEMA.TABLES t
+        LEFT JOIN (
+            SELECT
+                TABLE_SCHEMA,
+                TABLE_NAME,
+                COUNT(*) as COLUMN_COUNT
+            FROM INFORMATION_SCHEMA.COLUMNS
+            GROUP BY TABLE_SCHEMA, TABLE_NAME
+        ) c ON t.TABLE_SCHEMA = c.TABLE_SCHEMA AND t.TABLE_NAME = c.TABLE_NAME
+        WHERE t.TABLE_SCHEMA = :schema
+        ORDER BY TableCategory, t.TABLE_NAME
+        """
+
+    columns_query = """
+        SELECT
+            TABLE_NAME as TableName,
+            COLUMN_NAME as ColumnName,
+            DATA_TYPE as DataType,
+            IS_NULLABLE as IsNullable,
+            NUMERIC_PRECISION as NumericPrecision,
+            NUMERIC_SCALE as NumericScale
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = :schema
+        ORDER BY TABLE_NAME, ORDINAL_POSITION
+        """
+
+    # :schema, :table
+    table_columns_query = """
+        SELECT
+            TABLE_NAME as TableName,
+            COLUMN_NAME as ColumnName,
+            DATA_TYPE as DataType,
+            IS_NULLABLE as IsNullable,
+            NUMERIC_PRECISION as NumericPrecision,
+            NUMERIC_SCALE as NumericScale
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = :schema AND TABLE_NAME = :table
+        ORDER BY ORDINAL_POSITION
+        """
+
+    # :schema, :table, :column
+    column_type_query = """
+        SELECT DATA_TYPE as DataType
+        FROM INFORMATION_SCHEMA.COLUMNS
+        WHERE TABLE_SCHEMA = :schema AND TABLE_NAME = :table AND COLUMN_NAME = :column
+        """
+
+    # :schema, :table
+    primary_key_query = """
+        SELECT
+            kcu.COLUMN_NAME as ColumnName,
+            c.DATA_TYPE as DataType
+        FROM INFORMATION_SCHEMA.TABLE_CONSTRAINTS tc
+        JOIN INFORMATION_SCHEMA.KEY_COLUMN_USAGE kcu
+            ON tc.CONSTRAINT_NAME = kcu.CONSTRAINT_NAME
+            AND tc.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+            AND tc.TABLE_NAME = kcu.TABLE_NAME
+        JOIN INFORMATION_SCHEMA.COLUMNS c
+            ON c.TABLE_SCHEMA = kcu.TABLE_SCHEMA
+            AND c.TABLE_NAME = kcu.TABLE_NAME
+            AND c.COLUMN_NAME = kcu.COLUMN_NAME
+        WHERE tc.CONSTRAINT_TYPE = 'PRIMARY KEY'
+            AND tc.TABLE_SCHEMA = :schema
+            AND tc.TABLE_NAME = :table
+        ORDER BY kcu.ORDINAL_POSITION
+        """
+
+    health_query = """
+        SELECT
+            1 as ActiveSessions,
+            0 as ActiveRequests,
+            1 as OnlineDatabases
+        """
+
+    def quote_identifier(self, name: str) -> str:
+        """Quote an identifier, escaping embedded quotes."""
+        return '"' + name.replace('"', '""') + '"'
+
+    def schema_name(self, schema: Optional[str]) -> Optional[str]:
+        """Map the SQL Server default schema (``dbo``) to this backend's default."""
+        return self.default_schema if schema in (None, "dbo") else schema
+
+    def qualify(self, schema: Optional[str], table: str) -> str:
+        """Quoted ``schema.table`` reference."""
+        schema = self.schema_name(schema)
+        if schema is None:
+            return self.quote_identifier(table)
+        return f"{self.quote_identifier(schema)}.{self.quote_identifier(table)}"
+
+    def paginate(self, select: str, order_by: str) -> str:
+        """Page of ``select`` in ``order_by`` order, bound via ``:offset`` and ``:limit``."""
+        return f"{select} ORDER BY {order_by} LIMIT :limit OFFSET :offset"
+
+    def stage_table_name(self, suffix: str) -> str:
+        """Session-private staging table for bulk upserts."""
+        return f"cxmidl_stage_{suffix}"
+
+    def create_stage_statement(self, target: str, stage: str, column_list: str) -> str:
+        """Create an empty staging table with the target's column types."""
+        return f"CREATE TEMPORARY TABLE {stage} AS SELECT {column_list} FROM {target} WHERE 1 = 0"
+
+    def upsert_statement(self, target: str, stage: str, columns: List[str], key_columns: List[str]) -> str:
+        """Apply a staged batch to the target by key (INSERT ... ON CONFLICT)."""
+        q = self.quote_identifier
+        column_list = ", ".join(q(column) for column in columns)
+        keys = ", ".join(q(column) for column in key_columns)
+        update_columns = [column for column in columns if column not in key_columns]
+        # "WHERE 1 = 1" keeps SQLite from reading ON CONFLICT as a join constraint
+        statement = f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {stage} WHERE 1 = 1 "
+        if update_columns:
+            assignments = ", ".join(f"{q(column)} = excluded.{q(column)}" for column in update_columns)
+            return statement + f"ON CONFLICT ({keys}) DO UPDATE SET {assignments}"
+        return statement + f"ON CONFLICT ({keys}) DO NOTHING"
+
+    def clear_stage_statement(self, stage: str) -> str:
+        return f"DELETE FROM {stage}"
+
+    def drop_stage_statement(self, stage: str) -> str:
+        return f"DROP TABLE IF EXISTS {stage}"
+
+    def watermark_kind(self, data_type: str) -> str:
+        """Sync watermark kind for a column's SQL data type."""
+        data_type = data_type.lower()
+        if data_type in self.rowversion_types:
+            return "rowversion"
+        if "date" in data_type or "time" in data_type:
+            return "datetime"
+        return "identity"
+
+    def arrow_type(self, data_type: str, precision: Optional[int] = None, scale: Optional[int] = None):
+        """
+        Arrow type the connector's Arrow batches carry for a column of SQL
+        type ``data_type``. Types without a closer match are exported as strings.
+        """
+        import pyarrow as pa
+
+        data_type = data_type.lower().split("(")[0].strip()
+        if data_type in self.rowversion_types:
+            return pa.binary()
+        if data_type in ("bit", "bool", "boolean"):
+            return pa.bool_()
+        if data_type in ("tinyint", "smallint", "int", "integer", "bigint", "hugeint"):
+            return pa.int64()
+        if data_type in ("real", "float", "double", "double precision"):
+            return pa.float64()
+        if data_type in ("decimal", "numeric"):
+            if precision and 0 < precision <= 38:
+                return pa.decimal128(precision, scale or 0)
+            return pa.decimal128(38, scale or 0)
+        if data_type == "money":
+            return pa.decimal128(19, 4)
+        if data_type == "smallmoney":
+            return pa.decimal128(10, 4)
+        if data_type == "date":
+            return pa.date32()
+        if data_type in ("datetime", "datetime2", "smalldatetime", "timestamp", "timestamp without time zone"):
+            return pa.timestamp("us")
+        if data_type == "time":
+            return pa.time64("us")
+        if data_type in ("binary", "varbinary", "image", "blob", "bytea", "geography", "geometry", "hierarchyid"):
+            return pa.binary()
+        return pa.string()
+
+    def engine_options(self, connector) -> Dict[str, Any]:
+        """``create_engine`` keyword arguments for ``connector``'s pool settings."""
+        return {
+            "pool_size": connector.pool_size,
+            "max_overflow": connector.max_overflow,
+            "pool_timeout": connector.pool_timeout,
+            "pool_recycle": connector.pool_recycle,
+            "pool_pre_ping": connector.pool_pre_ping
+        }
+
+
+class MSSQLAdapter(DialectAdapter):
+    """Azure SQL / SQL Server (T-SQL)."""
+
+    name = "mssql"
+    default_schema = "dbo"
+    rowversion_types = ("timestamp", "rowversion")
+    count_expression = "COUNT_BIG(*)"
+
+    server_info_query = """
+        SELECT
+            @@SERVERNAME as ServerName,
+            @@VERSION as SqlVersion,
+            DB_NAME() as CurrentDatabase,
+            SYSTEM_USER as CurrentUser,
+            GETDATE() as CurrentTime,
+            @@LANGUAGE as LanguageSetting,
+            'N/A' as TextSizeInfo,
+            'N/A' as LockTimeoutInfo
+        """
+
+    databases_query = """
+        SELECT
+            name as DatabaseName,
+            database_id as DatabaseId,
+            create_date as CreatedDate,
+            collation_name as Collation,
+            state_desc as State,
+            compatibility_level as CompatibilityLevel
+        FROM sys.databases
+        WHERE name NOT IN ('master', 'tempdb', 'model', 'msdb')
+        ORDER BY name
+        """
+
+    analysis_query = """
+        -- Orchestration Database Comprehensive Analysis
+        SELECT
+            'Database_Metadata' as AnalysisType,
+            DB_NAME() as DatabaseName,
+            SYSTEM_USER as CurrentUser,
+            @@SPID as SessionId,
+            GETDATE() as AnalysisTime,
+            @@VERSION as SqlVersion
+
+        UNION ALL
+
+        SELECT
+            'Schema_Count' as AnalysisType,
+            CAST(COUNT(DISTINCT SCHEMA_NAME) as VARCHAR(50)) as Value,
+            NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.SCHEMATA
+        WHERE SCHEMA_NAME NOT IN ('sys', 'INFORMATION_SCHEMA')
+
+        UNION ALL
+
+        SELECT
+            'Table_Count' as AnalysisType,
+            CAST(COUNT(*) as VARCHAR(50)) as Value,
+            NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_TYPE = 'BASE TABLE'
+
+        UNION ALL
+
+        SELECT
+            'View_Count' as AnalysisType,
+            CAST(COUNT(*) as VARCHAR(50)) as Value,
+            NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.VIEWS
+
+        UNION ALL
+
+        SELECT
+            'Stored_Procedure_Count' as AnalysisType,
+            CAST(COUNT(*) as VARCHAR(50)) as Value,
+            NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.ROUTINES
+        WHERE ROUTINE_TYPE = 'PROCEDURE'
+
+        UNION ALL
+
+        SELECT
+            'Function_Count' as AnalysisType,
+            CAST(COUNT(*) as VARCHAR(50)) as Value,
+            NULL, NULL, NULL, NULL
+        FROM INFORMATION_SCHEMA.ROUTINES
+        WHERE ROUTINE_TYPE = 'FUNCTION'
+
+        ORDER BY AnalysisType
+        """
+
+    health_query = """
+        SELECT
+            (SELECT COUNT(*) FROM sys.dm_exec_sessions WHERE is_user_process = 1) as ActiveSessions,
+            (SELECT COUNT(*) FROM sys.dm_exec_requests) as ActiveRequests,
+            (SELECT COUNT(*) FROM sys.databases WHERE state_desc = 'ONLINE') as OnlineDatabases
+        """
+
+    def quote_identifier(self, name: str) -> str:
+        """Quote a SQL Server identifier, escaping embedded closing brackets."""
+        return "[" + name.replace("]", "]]") + "]"
+
+    def schema_name(self, schema: Optional[str]) -> Optional[str]:
+        return schema or self.default_schema
+
+    def paginate(self, select: str, order_by: str) -> str:
+        return f"{select} ORDER BY {order_by} OFFSET :offset ROWS FETCH NEXT :limit ROWS ONLY"
+
+    def stage_table_name(self, suffix: str) -> str:
+        return f"#cxmidl_stage_{suffix}"
+
+    def create_stage_statement(self, target: str, stage: str, column_list: str) -> str:
+        # UNION ALL drops the IDENTITY property from the staging copy
+        return (
+            f"SELECT TOP 0 {column_list} INTO {stage} FROM {target} "
+            f"UNION ALL SELECT TOP 0 {column_list} FROM {target}"
+        )
+
+    def upsert_statement(self, target: str, stage: str, columns: List[str], key_columns: List[str]) -> str:
+        """T-SQL MERGE applying a staged batch to the target by key."""
+        q = self.quote_identifier
+        on_clause = " AND ".join(f"t.{q(column)} = s.{q(column)}" for column in key_columns)
+        update_columns = [column for column in columns if column not in key_columns]
+        column_list = ", ".join(q(column) for column in columns)
+        source_list = ", ".join(f"s.{q(column)}" for column in columns)
+
+        statement = f"MERGE {target} WITH (HOLDLOCK) AS t USING {stage} AS s ON {on_clause} "
+        if update_columns:
+            assignments = ", ".join(f"t.{q(column)} = s.{q(column)}" for column in update_columns)
+            statement += f"WHEN MATCHED THEN UPDATE SET {assignments} "
+        statement += f"WHEN NOT MATCHED BY TARGET THEN INSERT ({column_list}) VALUES ({source_list});"
+        return statement
+
+    def clear_stage_statement(self, stage: str) -> str:
+        return f"TRUNCATE TABLE {stage}"
+
+    def engine_options(self, connector) -> Dict[str, Any]:
+        options = super().engine_options(connector)
+        if connector.url is None or connector.url.get_driver_name() == "pyodbc":
+            options["connect_args"] = {
+                "timeout": connector.connection_timeout,
+                "autocommit": False
+            }
+        return options
+
+
+class SQLiteAdapter(DialectAdapter):
+    """SQLite (local files; the schema is the attached database, ``main`` by default)."""
+
+    name = "sqlite"
+    default_schema = "main"
+
+    server_info_query = """
+        SELECT
+            'sqlite' as ServerName,
+            'SQLite ' || sqlite_version() as SqlVersion,
+            'main' as CurrentDatabase,
+            NULL as CurrentUser,
+            datetime('now') as CurrentTime
+        """
+
+    databases_query = """
+        SELECT
+            name as DatabaseName,
+            seq as DatabaseId,
+            file as FilePath
+        FROM pragma_database_list
+        ORDER BY name
+        """
+
+    analysis_query = """
+        SELECT
+            'Database_Metadata' as AnalysisType,
+            'main' as DatabaseName,
+            NULL as CurrentUser,
+            NULL as SessionId,
+            datetime('now') as AnalysisTime,
+            'SQLite ' || sqlite_version() as SqlVersion
+        UNION ALL
+        SELECT 'Schema_Count', CAST(COUNT(*) as TEXT), NULL, NULL, NULL, NULL
+        FROM pragma_database_list
+        UNION ALL
+        SELECT 'Table_Count', CAST(COUNT(*) as TEXT), NULL, NULL, NULL, NULL
+        FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'
+        UNION ALL
+        SELECT 'View_Count', CAST(COUNT(*) as TEXT), NULL, NULL, NULL, NULL
+        FROM sqlite_master WHERE type = 'view'
+        ORDER BY AnalysisType
+        """
+
+    tables_query = f"""
+        SELECT
+            :schema as SchemaName,
+            m.name as TableName,
+            CASE m.type WHEN 'table' THEN 'BASE TABLE' ELSE 'VIEW' END as TableType,
+            (SELECT COUNT(*) FROM pragma_table_info(m.name)) as ColumnCount,
+            {_TABLE_CATEGORY.format(name="m.name")} as TableCategory
+        FROM sqlite_master m
+        WHERE m.type IN ('table', 'view') AND m.name NOT LIKE 'sqlite_%'
+        ORDER BY TableCategory, m.name
+        """
+
+    columns_query = """
+        SELECT
+            m.name as TableName,
+            p.name as ColumnName,
+            p.type as DataType,
+            CASE p."notnull" WHEN 1 THEN 'NO' ELSE 'YES' END as IsNullable,
+            NULL as NumericPrecision,
+            NULL as NumericScale
+        FROM sqlite_master m
+        JOIN pragma_table_info(m.name) p
+        WHERE m.type = 'table' AND m.name NOT LIKE 'sqlite_%' AND :schema IS NOT NULL
+        ORDER BY m.name, p.cid
+        """
+
+    table_columns_query = """
+        SELECT
+            :table as TableName,
+            name as ColumnName,
+            type as DataType,
+            CASE "notnull" WHEN 1 THEN 'NO' ELSE 'YES' END as IsNullable,
+            NULL as NumericPrecision,
+            NULL as NumericScale
+        FROM pragma_table_info(:table, :schema)
+        ORDER BY cid
+        """
+
+    column_type_query = """
+        SELECT type as DataType
+        FROM pragma_table_info(:table, :schema)
+        WHERE name = :column
+        """
+
+    primary_key_query = """
+        SELECT name as ColumnName, type as DataType
+        FROM pragma_table_info(:table, :schema)
+        WHERE pk > 0
+        ORDER BY pk
+        """
+
+    health_query = """
+        SELECT
+            1 as ActiveSessions,
+            0 as ActiveRequests,
+            COUNT(*) as OnlineDatabases
+        FROM pragma_database_list
+        """
+
+    def arrow_type(self, data_type: str, precision: Optional[int] = None, scale: Optional[int] = None):
+        """Arrow type by SQLite column affinity (dates are stored and read as text)."""
+        import pyarrow as pa
+
+        data_type = data_type.upper()
+        if "INT" in data_type or "BOOL" in data_type:
+            return pa.int64()
+        if any(token in data_type for token in ("CHAR", "CLOB", "TEXT", "DATE", "TIME")):
+            return pa.string()
+        if "BLOB" in data_type:
+            return pa.binary()
+        if not data_type:
+            return pa.string()
+        # REAL and NUMERIC affinity (DECIMAL, NUMERIC, DOUBLE, ...)
+        return pa.float64()
+
+    def engine_options(self, connector) -> Dict[str, Any]:
+        # In-memory databases use a single-connection pool without sizing options
+        if connector.url is not None and connector.url.database in (None, "", ":memory:"):
+            return {}
+        return super().engine_options(connector)
+
+
+class DuckDBAdapter(DialectAdapter):
+    """DuckDB (duckdb_engine)."""
+
+    name = "duckdb"
+    default_schema = "main"
+
+    def engine_options(self, connector) -> Dict[str, Any]:
+        if connector.url is not None and connector.url.database in (None, "", ":memory:"):
+            return {}
+        return super().engine_options(connector)
+
+
+_ADAPTERS = {
+    "mssql": MSSQLAdapter,
+    "sqlite": SQLiteAdapter,
+    "duckdb": DuckDBAdapter,
+    "postgresql": DialectAdapter
+}
+
+
+def get_dialect_adapter(backend_name: str) -> DialectAdapter:
+    """
+    Adapter for a SQLAlchemy backend name (``url.get_backend_name()`` or
+    ``engine.dialect.name``). Unknown backends get the ANSI adapter.
+    """
+    return _ADAPTERS.get(backend_name, DialectAdapter)()
+
+
+def table_arrow_schema(connector, table: str, schema: str = "dbo"):
+    """
+    Arrow schema of ``schema.table`` from its column metadata (ordinal order).
+
+    Writers use it instead of the first fetched batch's schema, so all-null
+    columns keep their declared type and every file of a table shares one
+    schema. Returns None when the backend reports no columns for the table.
+    """
+    import pyarrow as pa
+
+    backend = connector.backend
+    rows = connector.execute_query(
+        backend.table_columns_query,
+        params={"schema": backend.schema_name(schema), "table": table},
+        return_dataframe=False
+    )
+    fields = [
+        pa.field(row["ColumnName"], backend.arrow_type(
+            row["DataType"] or "", row.get("NumericPrecision"), row.get("NumericScale")
+        ))
+        for row in rows
+    ]
+    return pa.schema(fields) if fields else None
+
+
+def require_sql_server(connector, feature: str):
+    """Raise NotImplementedError when ``feature`` needs SQL Server catalog views."""
+    if connector.backend.name != "mssql":
+        raise NotImplementedError(
+            f"{feature} need SQL Server catalog views (sys.*), which the "
+            f"{connector.backend.name} backend does not have"
+        )
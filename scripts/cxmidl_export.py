@@ -0,0 +1,517 @@
+"""
+CXMIDL Orchestration Bulk Export Pipeline
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+This module exports Orchestration tables to Parquet for the Orchestration to
+Microsoft Fabric migration. Each table is split into key-range (or row-number)
+slices that are extracted in parallel over the connector's shared pool and
+written as row-group-sized Parquet files with a JSON manifest. A local
+directory stands in for the OneLake/ADLS ``Files/`` area.
+"""
+
+import json
+import logging
+import math
+import os
+import shutil
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from cxmidl_connector import CXMIDLOrchestrationConnector
+from cxmidl_dialects import table_arrow_schema
+
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "_manifest.json"
+DEFAULT_ROWS_PER_SLICE = 1_000_000
+DEFAULT_ROW_GROUP_SIZE = 250_000
+DEFAULT_BATCH_SIZE = 50_000
+
+
+def _table_directory(output_dir: Path, schema: str, table: str) -> Path:
+    """Directory holding one table's Parquet files and manifest."""
+    return output_dir / f"{schema}.{table}"
+
+
+def _staging_directory(output_dir: Path, schema: str, table: str) -> Path:
+    """Hidden directory a table is exported into before it replaces the previous export."""
+    return output_dir / f".{schema}.{table}.staging"
+
+
+def _publish_table_directory(staging_dir: Path, table_dir: Path):
+    """Swap a completed export into place, dropping the previous export's files."""
+    previous_dir = table_dir.with_name(f".{table_dir.name}.previous")
+    if previous_dir.exists():
+        shutil.rmtree(previous_dir)
+    if table_dir.exists():
+        os.replace(table_dir, previous_dir)
+    os.replace(staging_dir, table_dir)
+    if previous_dir.exists():
+        shutil.rmtree(previous_dir)
+
+
+def _is_unique_key(connector: CXMIDLOrchestrationConnector, qualified: str, column: str) -> bool:
+    """True when ``column`` has no NULLs and no duplicates, so key slices cover every row once."""
+    key = connector.backend.quote_identifier(column)
+    counts = connector.execute_query(
+        f"SELECT {connector.backend.count_expression} as RowCnt, COUNT({key}) as KeyCnt, "
+        f"COUNT(DISTINCT {key}) as DistinctCnt FROM {qualified}",
+        return_dataframe=False
+    )[0]
+    return counts["RowCnt"] == counts["KeyCnt"] == counts["DistinctCnt"]
+
+
+def _primary_key_columns(connector: CXMIDLOrchestrationConnector,
+                         schema: str,
+                         table: str) -> List[Dict[str, Any]]:
+    """Primary key columns (in key order) with their SQL data types."""
+    return connector.execute_query(
+        connector.backend.primary_key_query,
+        params={"schema": connector.backend.schema_name(schema), "table": table},
+        return_dataframe=False
+    )
+
+
+def plan_table_slices(connector: CXMIDLOrchestrationConnector,
+                      table: str,
+                      schema: str = "dbo",
+                      key_column: Optional[str] = None,
+                      slices: Optional[int] = None,
+                      rows_per_slice: int = DEFAULT_ROWS_PER_SLICE) -> Dict[str, Any]:
+    """
+    Split a table into independently extractable slices.
+
+    A single integer key is split into contiguous key ranges (cheap index
+    seeks). Any other key is split by row number with the backend's
+    OFFSET/FETCH (or LIMIT/OFFSET) paging over the key order. Tables without a usable key are exported as one slice.
+    A ``key_column`` override with NULL or duplicate values would drop or
+    repeat rows, so it is ignored (with a warning) in favour of the primary key.
+
+    Args:
+        connector: Connected Orchestration connector
+        table: Table name
+        schema: Schema name
+        key_column: Column to slice on (default: discovered primary key)
+        slices: Number of slices (default: row_count / rows_per_slice)
+        rows_per_slice: Target rows per slice when ``slices`` is not given
+
+    Returns:
+        Plan with slicing strategy, row count and per-slice query/params
+    """
+    backend = connector.backend
+    quote = backend.quote_identifier
+    qualified = backend.qualify(schema, table)
+
+    key_columns: List[str] = []
+    if key_column:
+        if _is_unique_key(connector, qualified, key_column):
+            key_columns = [key_column]
+        else:
+            logger.warning(
+                f"{schema}.{table}.{key_column} has NULL or duplicate values; "
+                f"slicing on the primary key instead"
+            )
+    if not key_columns:
+        key_columns = [row["ColumnName"] for row in _primary_key_columns(connector, schema, table)]
+
+    if key_columns:
+        bounds_query = (
+            f"SELECT {backend.count_expression} as RowCnt, MIN({quote(key_columns[0])}) as MinKey, "
+            f"MAX({quote(key_columns[0])}) as MaxKey FROM {qualified}"
+        )
+    else:
+        bounds_query = f"SELECT {backend.count_expression} as RowCnt, NULL as MinKey, NULL as MaxKey FROM {qualified}"
+    bounds = connector.execute_query(bounds_query, return_dataframe=False)[0]
+    row_count = int(bounds["RowCnt"] or 0)
+    min_key, max_key = bounds["MinKey"], bounds["MaxKey"]
+
+    if slices is None:
+        slices = max(1, math.ceil(row_count / max(1, rows_per_slice)))
+    slices = max(1, min(slices, max(1, row_count)))
+
+    select_all = f"SELECT * FROM {qualified}"
+    plan = {
+        "schema": schema,
+        "table": table,
+        "row_count": row_count,
+        "key_columns": key_columns,
+        "slices": []
+    }
+
+    integer_key = (
+        len(key_columns) == 1
+        and isinstance(min_key, int) and not isinstance(min_key, bool)
+        and isinstance(max_key, int)
+    )
+
+    if slices == 1 or not key_columns or row_count == 0:
+        plan["strategy"] = "single"
+        plan["slices"].append({"slice": 0, "query": select_all, "params": {}})
+
+    elif integer_key:
+        plan["strategy"] = "key_range"
+        key = quote(key_columns[0])
+        width = max(1, math.ceil((max_key - min_key + 1) / slices))
+        lower = min_key
+        index = 0
+        while lower <= max_key:
+            upper = lower + width
+            plan["slices"].append({
+                "slice": index,
+                "query": f"{select_all} WHERE {key} >= :lower AND {key} < :upper",
+                "params": {"lower": lower, "upper": upper},
+                "lower": lower,
+                "upper": upper
+            })
+            lower = upper
+            index += 1
+
+    else:
+        plan["strategy"] = "row_number"
+        order_by = ", ".join(quote(column) for column in key_columns)
+        size = math.ceil(row_count / slices)
+        for index in range(slices):
+            plan["slices"].append({
+                "slice": index,
+                "query": backend.paginate(select_all, order_by),
+                "params": {"offset": index * size, "limit": size},
+                "lower": index * size,
+                "upper": (index + 1) * size
+            })
+
+    return plan
+
+
+def _export_slice(connector: CXMIDLOrchestrationConnector,
+                  slice_plan: Dict[str, Any],
+                  path: Path,
+                  row_group_size: int,
+                  batch_size: int,
+                  compression: str,
+                  arrow_schema: Optional[pa.Schema] = None) -> Dict[str, Any]:
+    """
+    Stream one slice into a Parquet file, one row group in memory at a time.
+
+    Batches are cast to ``arrow_schema`` (the table's declared schema) so a
+    column that is all NULL in the first batch, or in a whole slice, is
+    still written with its real type; without it the first batch decides.
+    """
+    start = time.perf_counter()
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    writer = None
+    pending: List[pa.Table] = []
+    pending_rows = 0
+    rows = 0
+
+    def _flush():
+        nonlocal pending, pending_rows
+        if pending:
+            writer.write_table(pa.concat_tables(pending), row_group_size=row_group_size)
+            pending, pending_rows = [], 0
+
+    try:
+        for batch in connector.execute_query_arrow_batches(
+            slice_plan["query"], slice_plan["params"], batch_size=batch_size
+        ):
+            chunk = pa.Table.from_batches([batch])
+            if writer is None:
+                writer = pq.ParquetWriter(str(tmp_path), arrow_schema or chunk.schema, compression=compression)
+            if chunk.schema != writer.schema:
+                chunk = chunk.cast(writer.schema)
+
+            pending.append(chunk)
+            pending_rows += batch.num_rows
+            rows += batch.num_rows
+            if pending_rows >= row_group_size:
+                _flush()
+
+        if writer is not None:
+            _flush()
+            writer.close()
+            writer = None
+            os.replace(tmp_path, path)
+    finally:
+        if writer is not None:
+            writer.close()
+        if tmp_path.exists():
+            tmp_path.unlink()
+
+    return {
+        "slice": slice_plan["slice"],
+        "file": path.name,
+        "rows": rows,
+        "bytes": path.stat().st_size if path.exists() else 0,
+        "seconds": round(time.perf_counter() - start, 3),
+        "lower": slice_plan.get("lower"),
+        "upper": slice_plan.get("upper"),
+        "status": "completed"
+    }
+
+
+def export_tables(connector: CXMIDLOrchestrationConnector,
+                  output_dir: Union[str, Path],
+                  tables: Optional[List[str]] = None,
+                  schema: str = "dbo",
+                  max_workers: Optional[int] = None,
+                  rows_per_slice: int = DEFAULT_ROWS_PER_SLICE,
+                  row_group_size: int = DEFAULT_ROW_GROUP_SIZE,
+                  batch_size: int = DEFAULT_BATCH_SIZE,
+                  compression: str = "snappy",
+                  key_columns: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+    """
+    Export tables to Parquet, extracting slices of all tables in parallel.
+
+    Every slice of every table is queued on one thread pool sized to the
+    connector's connection pool, so small tables do not leave workers idle
+    while a large one finishes. Each worker holds at most one row group.
+    A table is written to a staging directory that replaces its previous
+    export only when every slice succeeded, so re-exports leave no stale
+    part files and a failed run keeps the last good export.
+
+    Args:
+        connector: Orchestration connector
+        output_dir: Local directory standing in for OneLake/ADLS
+        tables: Table names (default: all base tables in ``schema``)
+        schema: Schema name
+        max_workers: Concurrent slice extractions (default: pool capacity, max 8)
+        rows_per_slice: Target rows per slice
+        row_group_size: Rows per Parquet row group
+        batch_size: Rows fetched per round trip
+        compression: Parquet compression codec
+        key_columns: Optional ``{table: column}`` overrides for slicing keys
+
+    Returns:
+        Export summary of this run. Its table entries are merged into
+        ``output_dir/_manifest.json``, which lists every table exported to
+        the directory.
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    key_columns = key_columns or {}
+    start = time.perf_counter()
+
+    if tables is None:
+        catalog = connector.get_orchestration_tables(schema)
+        tables = [
+            row["TableName"] for row in catalog.to_dict("records")
+            if row.get("TableType") == "BASE TABLE"
+        ]
+
+    if max_workers is None:
+        max_workers = max(1, min(8, connector.pool_size + connector.max_overflow))
+
+    table_manifests: Dict[str, Dict[str, Any]] = {}
+    futures = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="cxmidl-export") as executor:
+        for table in tables:
+            manifest = {
+                "timestamp": datetime.now().isoformat(),
+                "server": connector.server,
+                "database": connector.database,
+                "schema": schema,
+                "table": table,
+                "format": "parquet",
+                "compression": compression,
+                "row_group_size": row_group_size,
+                "files": [],
+                "integration_id": connector.integration_id
+            }
+            table_manifests[table] = manifest
+
+            try:
+                plan = plan_table_slices(
+                    connector, table, schema=schema,
+                    key_column=key_columns.get(table),
+                    rows_per_slice=rows_per_slice
+                )
+                arrow_schema = table_arrow_schema(connector, table, schema)
+            except Exception as e:
+                logger.error(f"Failed to plan export of {schema}.{table}: {e}")
+                manifest.update({"status": "failed", "error": str(e)})
+                continue
+
+            # Slices land in a staging directory that replaces the previous
+            # export only once every slice succeeded (no stale part files)
+            table_dir = _staging_directory(output_dir, schema, table)
+            if table_dir.exists():
+                shutil.rmtree(table_dir)
+            table_dir.mkdir(parents=True)
+            manifest.update({
+                "strategy": plan["strategy"],
+                "key_columns": plan["key_columns"],
+                "source_row_count": plan["row_count"],
+                "started": time.perf_counter()
+            })
+
+            for slice_plan in plan["slices"]:
+                path = table_dir / f"part-{slice_plan['slice']:05d}.parquet"
+                future = executor.submit(
+                    _export_slice, connector, slice_plan, path,
+                    row_group_size, batch_size, compression, arrow_schema
+                )
+                futures[future] = (table, slice_plan)
+
+        for future in as_completed(futures):
+            table, slice_plan = futures[future]
+            try:
+                table_manifests[table]["files"].append(future.result())
+            except Exception as e:
+                logger.error(f"Export of {schema}.{table} slice {slice_plan['slice']} failed: {e}")
+                table_manifests[table]["files"].append({
+                    "slice": slice_plan["slice"],
+                    "status": "failed",
+                    "error": str(e),
+                    "lower": slice_plan.get("lower"),
+                    "upper": slice_plan.get("upper")
+                })
+
+    for table, manifest in table_manifests.items():
+        if manifest.get("status") == "failed":
+            continue
+        manifest["files"].sort(key=lambda item: item["slice"])
+        failed = [item for item in manifest["files"] if item["status"] != "completed"]
+        manifest["rows"] = sum(item.get("rows", 0) for item in manifest["files"])
+        manifest["bytes"] = sum(item.get("bytes", 0) for item in manifest["files"])
+        manifest["duration_seconds"] = round(time.perf_counter() - manifest.pop("started"), 3)
+        manifest["status"] = "failed" if failed else "completed"
+
+        staging_dir = _staging_directory(output_dir, schema, table)
+        if failed:
+            # Keep the previous export intact
+            manifest["error"] = failed[0].get("error")
+            shutil.rmtree(staging_dir)
+            logger.error(f"Export of {schema}.{table} failed; previous export left in place")
+            continue
+        with open(staging_dir / MANIFEST_NAME, "w", encoding="utf-8") as f:
+            json.dump(manifest, f, indent=2, default=str)
+        _publish_table_directory(staging_dir, _table_directory(output_dir, schema, table))
+        logger.info(
+            f"Exported {schema}.{table}: {manifest['rows']} rows, "
+            f"{len(manifest['files'])} files in {manifest['duration_seconds']:.2f}s"
+        )
+
+    duration = time.perf_counter() - start
+    summary = {
+        "timestamp": datetime.now().isoformat(),
+        "server": connector.server,
+        "database": connector.database,
+        "schema": schema,
+        "output_dir": str(output_dir),
+        "tables": {
+            table: {
+                "status": manifest.get("status"),
+                "rows": manifest.get("rows", 0),
+                "bytes": manifest.get("bytes", 0),
+                "files": len(manifest["files"]),
+                "error": manifest.get("error")
+            }
+            for table, manifest in table_manifests.items()
+        },
+        "rows": sum(manifest.get("rows", 0) for manifest in table_manifests.values()),
+        "bytes": sum(manifest.get("bytes", 0) for manifest in table_manifests.values()),
+        "duration_seconds": round(duration, 3),
+        "status": "completed" if all(
+            manifest.get("status") == "completed" for manifest in table_manifests.values()
+        ) else "failed",
+        "integration_id": connector.integration_id
+    }
+    _update_output_manifest(output_dir, summary)
+
+    logger.info(
+        f"Export completed in {duration:.2f}s: {len(tables)} tables, "
+        f"{summary['rows']} rows, {summary['bytes']} bytes"
+    )
+    return summary
+
+
+def _update_output_manifest(output_dir: Path, summary: Dict[str, Any]):
+    """
+    Merge a run's table entries into ``output_dir/_manifest.json``.
+
+    Entries are keyed by ``schema.table``, so exporting one table keeps the
+    others listed. A table that failed keeps its previous export on disk and
+    therefore its previous entry, marked failed with the new error.
+    """
+    path = output_dir / MANIFEST_NAME
+    tables: Dict[str, Dict[str, Any]] = {}
+    if path.exists():
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                previous = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Rewriting unreadable export manifest {path}: {e}")
+            previous = {}
+        for name, entry in previous.get("tables", {}).items():
+            # Manifests written before entries were schema-qualified
+            if "schema" not in entry:
+                entry = dict(entry, schema=previous.get("schema", "dbo"), table=name)
+            tables[f"{entry['schema']}.{entry['table']}"] = entry
+
+    for table, entry in summary["tables"].items():
+        key = f"{summary['schema']}.{table}"
+        if entry["status"] != "completed" and key in tables:
+            tables[key] = dict(tables[key], status=entry["status"], error=entry["error"])
+        else:
+            tables[key] = dict(entry, schema=summary["schema"], table=table, exported=summary["timestamp"])
+
+    document = {
+        "timestamp": summary["timestamp"],
+        "server": summary["server"],
+        "database": summary["database"],
+        "output_dir": summary["output_dir"],
+        "tables": dict(sorted(tables.items())),
+        "rows": sum(entry.get("rows", 0) for entry in tables.values()),
+        "bytes": sum(entry.get("bytes", 0) for entry in tables.values()),
+        "status": "completed" if all(entry.get("status") == "completed" for entry in tables.values()) else "failed",
+        "integration_id": summary["integration_id"]
+    }
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(document, f, indent=2, default=str)
+    os.replace(tmp_path, path)
+
+
+def export_table(connector: CXMIDLOrchestrationConnector,
+                 table: str,
+                 output_dir: Union[str, Path],
+                 schema: str = "dbo",
+                 key_column: Optional[str] = None,
+                 **options) -> Dict[str, Any]:
+    """
+    Export one table to Parquet files plus a manifest.
+
+    Args:
+        connector: Orchestration connector
+        table: Table name
+        output_dir: Local directory standing in for OneLake/ADLS
+        schema: Schema name
+        key_column: Column to slice on (default: discovered primary key)
+        **options: Passed through to ``export_tables``
+
+    Returns:
+        The table's manifest
+    """
+    key_columns = {table: key_column} if key_column else None
+    summary = export_tables(connector, output_dir, tables=[table], schema=schema,
+                            key_columns=key_columns, **options)
+
+    manifest_path = _table_directory(Path(output_dir), schema, table) / MANIFEST_NAME
+    if summary["tables"][table]["status"] == "completed":
+        with open(manifest_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {
+        "timestamp": datetime.now().isoformat(),
+        "schema": schema,
+        "table": table,
+        "status": "failed",
+        "error": summary["tables"][table]["error"],
+        "integration_id": connector.integration_id
+    }
@@ -0,0 +1,314 @@
+"""
+CXMIDL Orchestration Query Profiler
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+Opt-in slow-query profiling for CXMIDLOrchestrationConnector. While enabled,
+queries run with SET STATISTICS IO/TIME (and optionally STATISTICS XML for
+the actual showplan) on their pooled connection. The server messages and plan
+are parsed into logical reads, CPU time and the most expensive operators, and
+the N slowest queries over a latency threshold are kept for inspection or a
+JSON dump.
+"""
+
+import heapq
+import itertools
+import json
+import logging
+import re
+import threading
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+SHOWPLAN_NAMESPACE = "{http://schemas.microsoft.com/sqlserver/2004/07/showplan}"
+
+_IO_TABLE_PATTERN = re.compile(r"Table '(?P<table>[^']+)'\. (?P<counters>[^\n]*)")
+_IO_COUNTER_PATTERN = re.compile(r"(?P<name>[A-Za-z][A-Za-z -]*?) (?P<value>\d+)")
+_TIME_PATTERN = re.compile(r"CPU time = (?P<cpu>\d+) ms,\s*elapsed time = (?P<elapsed>\d+) ms")
+
+
+def _message_text(message: Any) -> str:
+    """Text of a pyodbc ``cursor.messages`` entry (a (state, text) tuple)."""
+    if isinstance(message, (tuple, list)):
+        return str(message[-1])
+    return str(message)
+
+
+def parse_statistics_messages(messages: Sequence[Any]) -> Dict[str, Any]:
+    """
+    Parse SET STATISTICS IO and TIME informational messages.
+
+    Args:
+        messages: Server messages collected from the cursor
+
+    Returns:
+        Totals (logical/physical/read-ahead reads, scan count, execution and
+        compile CPU/elapsed milliseconds) plus per-table IO counters
+    """
+    tables: Dict[str, Dict[str, int]] = {}
+    totals = {
+        "logical_reads": 0, "physical_reads": 0, "read_ahead_reads": 0, "scan_count": 0,
+        "cpu_time_ms": 0, "elapsed_time_ms": 0, "compile_cpu_ms": 0, "compile_elapsed_ms": 0
+    }
+    for message in messages:
+        line = _message_text(message)
+        for match in _IO_TABLE_PATTERN.finditer(line):
+            counters = tables.setdefault(match.group("table"), {})
+            for counter in _IO_COUNTER_PATTERN.finditer(match.group("counters")):
+                name = counter.group("name").strip().lower().replace(" ", "_").replace("-", "_")
+                counters[name] = counters.get(name, 0) + int(counter.group("value"))
+        timing = _TIME_PATTERN.search(line)
+        if timing:
+            prefix = "compile" if "compile" in line else None
+            cpu, elapsed = int(timing.group("cpu")), int(timing.group("elapsed"))
+            if prefix:
+                totals["compile_cpu_ms"] += cpu
+                totals["compile_elapsed_ms"] += elapsed
+            else:
+                totals["cpu_time_ms"] += cpu
+                totals["elapsed_time_ms"] += elapsed
+
+    for counters in tables.values():
+        totals["logical_reads"] += counters.get("logical_reads", 0)
+        totals["physical_reads"] += counters.get("physical_reads", 0)
+        totals["read_ahead_reads"] += counters.get("read_ahead_reads", 0)
+        totals["scan_count"] += counters.get("scan_count", 0)
+    return {**totals, "tables": tables}
+
+
+def parse_showplan(showplan_xml: str, top_n: int = 5) -> Dict[str, Any]:
+    """
+    Summarize an actual (STATISTICS XML) showplan.
+
+    Operator cost is the operator's own share: its estimated subtree cost
+    minus that of its child operators.
+
+    Args:
+        showplan_xml: ShowPlanXML document
+        top_n: Number of most expensive operators to return
+
+    Returns:
+        Statement cost, operator count and the ``top_n`` operators by own cost
+    """
+    root = ET.fromstring(showplan_xml)
+    operators = []
+    statement_cost = 0.0
+    for statement in root.iter(f"{SHOWPLAN_NAMESPACE}StmtSimple"):
+        statement_cost += float(statement.get("StatementSubTreeCost", 0) or 0)
+
+    for relop in root.iter(f"{SHOWPLAN_NAMESPACE}RelOp"):
+        subtree = float(relop.get("EstimatedTotalSubtreeCost", 0) or 0)
+        children = sum(float(child.get("EstimatedTotalSubtreeCost", 0) or 0) for child in _child_relops(relop))
+        actual_rows = None
+        counters = relop.findall(f"{SHOWPLAN_NAMESPACE}RunTimeInformation/{SHOWPLAN_NAMESPACE}RunTimeCountersPerThread")
+        if counters:
+            actual_rows = sum(int(counter.get("ActualRows", 0) or 0) for counter in counters)
+        obj = _operator_object(relop)
+        operators.append({
+            "node_id": int(relop.get("NodeId", -1)),
+            "physical_op": relop.get("PhysicalOp"),
+            "logical_op": relop.get("LogicalOp"),
+            "object": ".".join(
+                part.strip("[]") for part in (obj.get("Schema"), obj.get("Table"), obj.get("Index")) if part
+            ) if obj is not None else None,
+            "estimated_rows": float(relop.get("EstimateRows", 0) or 0),
+            "actual_rows": actual_rows,
+            "subtree_cost": round(subtree, 6),
+            "operator_cost": round(max(0.0, subtree - children), 6)
+        })
+
+    operators.sort(key=lambda op: op["operator_cost"], reverse=True)
+    return {
+        "statement_cost": round(statement_cost, 6),
+        "operator_count": len(operators),
+        "top_operators": operators[:top_n]
+    }
+
+
+def _child_relops(element: ET.Element):
+    """Direct child operators of a RelOp (nested inside its operator element)."""
+    for child in element:
+        if child.tag == f"{SHOWPLAN_NAMESPACE}RelOp":
+            yield child
+        else:
+            yield from _child_relops(child)
+
+
+def _operator_object(element: ET.Element) -> Optional[ET.Element]:
+    """The table/index an operator reads, without descending into child operators."""
+    for child in element:
+        if child.tag == f"{SHOWPLAN_NAMESPACE}Object":
+            return child
+        if child.tag != f"{SHOWPLAN_NAMESPACE}RelOp":
+            found = _operator_object(child)
+            if found is not None:
+                return found
+    return None
+
+
+class QueryProfiler:
+    """Runs queries with server statistics enabled and keeps the N slowest."""
+
+    def __init__(self,
+                 threshold_seconds: float = 1.0,
+                 capture_showplan: bool = False,
+                 max_entries: int = 50,
+                 top_operators: int = 5):
+        """
+        Args:
+            threshold_seconds: Keep queries at or above this latency
+            capture_showplan: Also collect the actual XML showplan (adds
+                server overhead to every profiled query)
+            max_entries: Size of the slowest-queries buffer
+            top_operators: Operators reported per showplan
+        """
+        self.threshold_seconds = threshold_seconds
+        self.capture_showplan = capture_showplan
+        self.max_entries = max_entries
+        self.top_operators = top_operators
+        self._lock = threading.Lock()
+        self._heap: List[Tuple[float, int, Dict[str, Any]]] = []
+        self._sequence = itertools.count()
+        self.profiled = 0
+
+    def execute(self, conn, query: str, params: Optional[Dict[str, Any]] = None):
+        """
+        Execute ``query`` on ``conn`` with statistics enabled.
+
+        The statement is compiled to the driver's positional form and run on
+        the raw DBAPI cursor so that server messages and the trailing
+        showplan result set can be read before the cursor is closed.
+
+        Returns:
+            (columns, rows, profile)
+        """
+        compiled = text(query).compile(dialect=conn.dialect)
+        positional = [(params or {}).get(name) for name in (compiled.positiontup or [])]
+        mssql = conn.dialect.name == "mssql"
+        settings = ("IO", "TIME", "XML") if self.capture_showplan else ("IO", "TIME")
+
+        cursor = conn.connection.dbapi_connection.cursor()
+        messages: List[Any] = []
+        showplans: List[str] = []
+        columns: List[str] = []
+        rows: List[Tuple] = []
+        try:
+            if mssql:
+                cursor.execute("; ".join(f"SET STATISTICS {setting} ON" for setting in settings))
+            if positional:
+                cursor.execute(str(compiled), positional)
+            else:
+                cursor.execute(str(compiled))
+            while True:
+                messages.extend(getattr(cursor, "messages", None) or [])
+                if cursor.description:
+                    names = [column[0] for column in cursor.description]
+                    if len(names) == 1 and "Showplan" in (names[0] or ""):
+                        showplans.extend(row[0] for row in cursor.fetchall())
+                    elif not columns:
+                        columns = names
+                        rows = [tuple(row) for row in cursor.fetchall()]
+                    else:
+                        cursor.fetchall()
+                if not (mssql and cursor.nextset()):
+                    break
+            messages.extend(getattr(cursor, "messages", None) or [])
+        finally:
+            try:
+                if mssql:
+                    cursor.execute("; ".join(f"SET STATISTICS {setting} OFF" for setting in settings))
+                cursor.close()
+            except Exception as e:
+                # Do not hand a connection with statistics still on back to the pool
+                logger.warning(f"Could not reset statistics on profiled connection: {e}")
+                conn.invalidate()
+
+        profile = parse_statistics_messages(messages)
+        if showplans:
+            try:
+                plans = [parse_showplan(plan, self.top_operators) for plan in showplans]
+                operators = sorted(
+                    (op for plan in plans for op in plan["top_operators"]),
+                    key=lambda op: op["operator_cost"], reverse=True
+                )
+                profile["showplan"] = {
+                    "statement_cost": round(sum(plan["statement_cost"] for plan in plans), 6),
+                    "operator_count": sum(plan["operator_count"] for plan in plans),
+                    "top_operators": operators[:self.top_operators]
+                }
+            except ET.ParseError as e:
+                logger.warning(f"Could not parse showplan: {e}")
+        return columns, rows, profile
+
+    def record(self,
+               query: str,
+               params: Optional[Dict[str, Any]],
+               latency_seconds: float,
+               rows: int,
+               profile: Dict[str, Any],
+               error: Optional[str] = None) -> bool:
+        """
+        Keep the execution if it is over the threshold and among the slowest.
+
+        Returns:
+            True when the entry was added to the buffer
+        """
+        with self._lock:
+            self.profiled += 1
+        if latency_seconds < self.threshold_seconds:
+            return False
+        entry = {
+            "timestamp": datetime.now().isoformat(),
+            "query": query,
+            "params": {key: repr(value) for key, value in (params or {}).items()},
+            "latency_seconds": round(latency_seconds, 6),
+            "rows": rows,
+            "error": error,
+            **profile
+        }
+        item = (latency_seconds, next(self._sequence), entry)
+        with self._lock:
+            if len(self._heap) < self.max_entries:
+                heapq.heappush(self._heap, item)
+            elif latency_seconds > self._heap[0][0]:
+                heapq.heapreplace(self._heap, item)
+            else:
+                return False
+        logger.info(
+            f"Slow query captured ({latency_seconds:.2f}s, {profile.get('logical_reads', 0)} logical reads, "
+            f"{profile.get('cpu_time_ms', 0)}ms CPU)"
+        )
+        return True
+
+    def slow_queries(self) -> List[Dict[str, Any]]:
+        """Captured slow queries, slowest first."""
+        with self._lock:
+            return [entry for _, _, entry in sorted(self._heap, reverse=True)]
+
+    def dump(self, path: Union[str, Path], metadata: Optional[Dict[str, Any]] = None) -> Path:
+        """Write the captured slow queries to a JSON file."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "timestamp": datetime.now().isoformat(),
+            "threshold_seconds": self.threshold_seconds,
+            "capture_showplan": self.capture_showplan,
+            "profiled_queries": self.profiled,
+            **(metadata or {}),
+            "slow_queries": self.slow_queries()
+        }
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(document, f, indent=2, default=str)
+        return path
+
+    def reset(self):
+        """Drop all captured entries."""
+        with self._lock:
+            self._heap.clear()
+            self.profiled = 0
@@ -0,0 +1,643 @@
+"""
+CXMIDL Orchestration Source-vs-Export Reconciliation
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+This module proves that an exported copy (Parquet files written by
+cxmidl_export/cxmidl_sync, or a DataFrame/Arrow table) matches its
+Orchestration source table without re-reading the table row by row. Both
+sides are reduced once to (row count, hash sum) per small key range (a leaf
+of about ``leaf_rows`` rows): the server returns them from one aggregate
+query, the export is scanned once. Larger chunks are compared from the sums
+of their leaves, top-down, and only leaves that differ are read again for a
+key-level comparison, so a matching billion-row table costs one aggregate
+scan and a mismatch a handful of range seeks.
+
+Every column value is first reduced to a canonical 64-bit integer: the value
+itself for integers and booleans, days or microseconds since the epoch for
+dates, times and timestamps, the IEEE-754 bit pattern for floats, and the
+first 8 bytes of a SHA-256 over the canonical text for strings, decimals,
+GUIDs and binary. Each integer is mixed into two 31-bit lanes with
+per-column multipliers modulo 2^31 - 1, and the lanes of a row form a 62-bit
+row hash. The arithmetic stays inside BIGINT, so T-SQL computes exactly what
+NumPy computes over whole columns locally; text is hashed once per distinct
+value. Chunk sums are exact (DECIMAL(38, 0) on the server, Python integers
+locally) and order-independent. CHECKSUM_AGG/BINARY_CHECKSUM are not used
+because their algorithm is undocumented and cannot be reproduced outside SQL
+Server.
+
+Backends without HASHBYTES (SQLite, DuckDB) fall back to streaming the
+source rows and hashing them client-side, which gives the same answers at
+the cost of reading the data.
+"""
+
+import hashlib
+import logging
+import math
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
+
+from cxmidl_connector import CXMIDLOrchestrationConnector
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ROWS_PER_CHUNK = 1_000_000
+DEFAULT_FANOUT = 16
+DEFAULT_LEAF_ROWS = 10_000
+DEFAULT_BATCH_SIZE = 65536
+# Keys listed per difference category in the summary
+DEFAULT_MAX_KEYS = 1000
+
+# Mersenne prime modulus of the hash lanes: lane products stay below 2^62
+HASH_MODULUS = 2_147_483_647
+LANE_BITS = 31
+
+_UUID_TYPES = ("uniqueidentifier",)
+_BINARY_TYPES = ("binary", "varbinary", "image", "timestamp", "rowversion")
+# Kinds reduced to an integer through a SHA-256 of their canonical text
+_TEXT_KINDS = ("decimal", "binary", "uuid", "string")
+
+
+def _column_kind(arrow_type: pa.DataType, sql_type: Optional[str]) -> str:
+    """Canonicalization kind of a column, from the export's Arrow type."""
+    if pa.types.is_dictionary(arrow_type):
+        arrow_type = arrow_type.value_type
+    sql_type = (sql_type or "").lower()
+    if pa.types.is_boolean(arrow_type):
+        return "boolean"
+    if pa.types.is_integer(arrow_type):
+        return "integer"
+    if pa.types.is_decimal(arrow_type):
+        return "decimal"
+    if pa.types.is_floating(arrow_type):
+        return "float"
+    if pa.types.is_timestamp(arrow_type):
+        return "timestamp"
+    if pa.types.is_date(arrow_type):
+        return "date"
+    if pa.types.is_time(arrow_type):
+        return "time"
+    if pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type) or pa.types.is_fixed_size_binary(arrow_type):
+        return "binary"
+    if sql_type in _UUID_TYPES:
+        return "uuid"
+    if sql_type in _BINARY_TYPES:
+        return "binary"
+    return "string"
+
+
+def _lane_constants(position: int) -> Tuple[Tuple[int, int, int, int], ...]:
+    """(low multiplier, high multiplier, offset, NULL value) of both hash lanes for a column position."""
+    digest = hashlib.sha256(f"cxmidl-reconcile:{position}".encode()).digest()
+    words = [int.from_bytes(digest[i:i + 4], "big") % (HASH_MODULUS - 1) + 1 for i in range(0, 32, 4)]
+    return tuple(words[:4]), tuple(words[4:])
+
+
+def _canonical_text(values: pa.Array, kind: str, scale: int) -> pa.Array:
+    """Canonical text of text-kind values, matching the text hashed by ``_server_expression``."""
+    if kind == "decimal":
+        return values.cast(pa.decimal128(38, scale), safe=False).cast(pa.string())
+    if kind == "binary":
+        if pa.types.is_string(values.type):
+            return values
+        return pa.array([None if value is None else value.hex().upper() for value in values.to_pylist()],
+                        pa.string())
+    values = values.cast(pa.string())
+    return pc.utf8_lower(values) if kind == "uuid" else values
+
+
+def _canonical_integers(values: Union[pa.Array, pa.ChunkedArray],
+                        kind: str,
+                        scale: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Canonical int64 of every value (0 where null) and the validity mask.
+
+    Matches ``_server_expression``. Text kinds are hashed once per distinct
+    value through a dictionary encoding; every other kind is a cast.
+    """
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if pa.types.is_dictionary(values.type):
+        values = values.dictionary_decode()
+    valid = values.is_valid().to_numpy(zero_copy_only=False)
+    if pa.types.is_null(values.type) or not valid.any():
+        return np.zeros(len(values), dtype=np.int64), valid
+
+    if kind in _TEXT_KINDS:
+        encoded = pc.dictionary_encode(values)
+        sha256 = hashlib.sha256
+        digests = b"".join(
+            sha256(text.encode("utf-16-le")).digest()[:8]
+            for text in _canonical_text(encoded.dictionary, kind, scale).to_pylist()
+        )
+        distinct = np.frombuffer(digests, dtype=">i8").astype(np.int64)
+        return distinct[encoded.indices.fill_null(0).to_numpy(zero_copy_only=False)], valid
+
+    if kind == "float":
+        floats = values.cast(pa.float64()).fill_null(0.0).to_numpy(zero_copy_only=False)
+        return floats.view(np.int64), valid
+    if kind == "timestamp":
+        if not pa.types.is_timestamp(values.type):
+            values = values.cast(pa.timestamp("us"))
+        values = values.cast(pa.timestamp("us", tz=values.type.tz), safe=False)
+    elif kind == "date":
+        values = values.cast(pa.date32()).cast(pa.int32())
+    elif kind == "time":
+        values = values.cast(pa.time64("us"), safe=False)
+    values = values.cast(pa.int64(), safe=False).fill_null(0)
+    return values.to_numpy(zero_copy_only=False), valid
+
+
+def _server_expression(column: str, kind: str, scale: int, sql_type: Optional[str] = None) -> str:
+    """T-SQL BIGINT producing the same canonical integer as ``_canonical_integers``."""
+    if kind in _TEXT_KINDS:
+        if kind == "decimal":
+            text = f"CONVERT(NVARCHAR(MAX), CAST({column} AS DECIMAL(38, {scale})))"
+        elif kind == "binary":
+            text = f"CONVERT(NVARCHAR(MAX), {column}, 2)"
+        elif kind == "uuid":
+            text = f"LOWER(CONVERT(NVARCHAR(36), {column}))"
+        else:
+            text = f"CONVERT(NVARCHAR(MAX), {column})"
+        return f"CONVERT(BIGINT, SUBSTRING(HASHBYTES('SHA2_256', {text}), 1, 8))"
+    if kind == "float":
+        # Exact IEEE-754 bits, big-endian like NumPy's int64 view of the double
+        return f"CONVERT(BIGINT, CAST(CAST({column} AS FLOAT) AS BINARY(8)))"
+    if kind == "timestamp":
+        if (sql_type or "").lower() == "datetime":
+            # Legacy datetime ticks are 1/300 s; pyodbc hands them out rounded to milliseconds
+            column = f"CAST({column} AS DATETIME2(3))"
+        return f"DATEDIFF_BIG(MICROSECOND, '19700101', {column})"
+    if kind == "date":
+        return f"CONVERT(BIGINT, DATEDIFF(DAY, '19700101', {column}))"
+    if kind == "time":
+        return f"DATEDIFF_BIG(MICROSECOND, CAST('00:00:00' AS TIME), {column})"
+    return f"CONVERT(BIGINT, {column})"
+
+
+def _server_row_hash(columns: List[Dict[str, Any]], quote) -> Tuple[str, str]:
+    """
+    T-SQL row hash over the table aliased ``t``.
+
+    Returns:
+        CROSS APPLY clauses computing each column's canonical integer and its
+        low/high 31-bit halves once, and the BIGINT row hash expression over them
+    """
+    modulus, mask, shift = HASH_MODULUS, (1 << LANE_BITS) - 1, f"CAST({1 << LANE_BITS} AS BIGINT)"
+    canonical = ", ".join(
+        _server_expression("t." + quote(column["name"]), column["kind"], column["scale"], column.get("sql_type"))
+        + f" as x{position}"
+        for position, column in enumerate(columns)
+    )
+    halves = ", ".join(
+        f"v.x{position} & {mask} as l{position}, "
+        f"(((v.x{position} - (v.x{position} & {mask})) / {shift}) % {modulus} + {modulus}) % {modulus} "
+        f"as h{position}"
+        for position in range(len(columns))
+    )
+    lanes = []
+    for lane in range(2):
+        terms = " + ".join(
+            f"ISNULL(((w.l{position} * {low}) % {modulus} + (w.h{position} * {high}) % {modulus} + {offset}) "
+            f"% {modulus}, {null_value})"
+            for position, column in enumerate(columns)
+            for low, high, offset, null_value in [column["lanes"][lane]]
+        )
+        lanes.append(f"({terms}) % {modulus}")
+    apply = f"CROSS APPLY (SELECT {canonical}) v CROSS APPLY (SELECT {halves}) w"
+    return apply, f"({lanes[0]}) * {shift} + {lanes[1]}"
+
+
+def hash_rows(data: Union[pa.Table, pa.RecordBatch], columns: List[Dict[str, Any]]) -> np.ndarray:
+    """
+    Per-row hashes of ``data``, identical to the server's ``_server_row_hash``.
+
+    Whole columns are hashed with NumPy integer arithmetic; only distinct
+    text values go through SHA-256 one by one.
+
+    Returns:
+        uint64 array of 62-bit row hashes
+    """
+    lanes = [np.zeros(data.num_rows, dtype=np.int64) for _ in range(2)]
+    if data.num_rows == 0:
+        return lanes[0].astype(np.uint64)
+    mask = (1 << LANE_BITS) - 1
+    for column in columns:
+        values, valid = _canonical_integers(data.column(column["name"]), column["kind"], column["scale"])
+        low = values & mask
+        high = ((values - low) >> LANE_BITS) % HASH_MODULUS
+        for total, (low_multiplier, high_multiplier, offset, null_value) in zip(lanes, column["lanes"]):
+            mixed = ((low * low_multiplier) % HASH_MODULUS + (high * high_multiplier) % HASH_MODULUS
+                     + offset) % HASH_MODULUS
+            total += np.where(valid, mixed, null_value)
+    return (((lanes[0] % HASH_MODULUS) << LANE_BITS) + lanes[1] % HASH_MODULUS).astype(np.uint64)
+
+
+def _chunk_checksums(keys: np.ndarray,
+                     hashes: np.ndarray,
+                     lower: int,
+                     width: int,
+                     totals: Dict[int, List[int]]):
+    """Add per-chunk row counts and exact hash sums of one batch into ``totals``."""
+    if not len(keys):
+        return
+    chunks = (keys.astype(np.int64) - lower) // width
+    order = np.argsort(chunks, kind="stable")
+    chunks, hashes = chunks[order], hashes[order]
+    ids, starts = np.unique(chunks, return_index=True)
+    counts = np.diff(np.append(starts, len(chunks)))
+    # Split the 62-bit hashes so uint64 sums cannot overflow
+    low = np.add.reduceat(hashes & np.uint64((1 << LANE_BITS) - 1), starts)
+    high = np.add.reduceat(hashes >> np.uint64(LANE_BITS), starts)
+    for chunk, count, high_sum, low_sum in zip(ids.tolist(), counts.tolist(), high.tolist(), low.tolist()):
+        entry = totals.setdefault(chunk, [0, 0])
+        entry[0] += count
+        entry[1] += (high_sum << LANE_BITS) + low_sum
+
+
+def _roll_up(leaves: Dict[int, List[int]], span: int) -> Dict[int, List[int]]:
+    """Sums of ``span`` consecutive leaves: the checksums of the next level up."""
+    if span == 1:
+        return leaves
+    totals: Dict[int, List[int]] = {}
+    for leaf, (count, hash_sum) in leaves.items():
+        entry = totals.setdefault(leaf // span, [0, 0])
+        entry[0] += count
+        entry[1] += hash_sum
+    return totals
+
+
+class _ExportSide:
+    """Exported copy of a table (Parquet files or in-memory data) scanned by key range."""
+
+    def __init__(self, export: Any, schema: str, table: str, batch_size: int):
+        if isinstance(export, (str, Path)):
+            path = Path(export)
+            table_dir = path / f"{schema}.{table}"
+            if table_dir.is_dir():
+                path = table_dir
+            files = sorted(str(file) for file in path.glob("*.parquet")) if path.is_dir() else [str(path)]
+            if not files:
+                raise FileNotFoundError(f"No Parquet files found for {schema}.{table} under {export}")
+            self.dataset = ds.dataset(files, format="parquet")
+            self.source = str(path)
+        else:
+            if not isinstance(export, (pa.Table, pa.RecordBatch)):
+                export = pa.Table.from_pandas(export, preserve_index=False)
+            self.dataset = ds.dataset(export)
+            self.source = type(export).__name__
+        self.schema = self.dataset.schema
+        self.batch_size = batch_size
+
+    def bounds(self, key: str) -> Tuple[int, Optional[int], Optional[int]]:
+        """Row count and key range of the export."""
+        rows, low, high = 0, None, None
+        for batch in self.dataset.to_batches(columns=[key], batch_size=self.batch_size):
+            if not batch.num_rows:
+                continue
+            rows += batch.num_rows
+            extremes = pc.min_max(batch.column(0)).as_py()
+            if extremes["min"] is not None:
+                low = extremes["min"] if low is None else min(low, extremes["min"])
+                high = extremes["max"] if high is None else max(high, extremes["max"])
+        return rows, low, high
+
+    def batches(self, key: str, columns: List[str], lower: int, upper: int) -> Iterator[pa.RecordBatch]:
+        """Batches of the rows with ``lower <= key < upper`` (pushed down to row-group statistics)."""
+        condition = (ds.field(key) >= lower) & (ds.field(key) < upper)
+        return iter(self.dataset.to_batches(columns=columns, filter=condition, batch_size=self.batch_size))
+
+
+class _Reconciliation:
+    """State of one table's reconciliation: columns, query counter and differences."""
+
+    def __init__(self,
+                 connector: CXMIDLOrchestrationConnector,
+                 export: _ExportSide,
+                 schema: str,
+                 table: str,
+                 key: str,
+                 columns: List[Dict[str, Any]],
+                 batch_size: int,
+                 server_side: bool):
+        self.connector = connector
+        self.export = export
+        self.key = key
+        self.columns = columns
+        self.batch_size = batch_size
+        self.server_side = server_side
+        self.queries = 0
+        backend = connector.backend
+        self.qualified = backend.qualify(schema, table)
+        self.quoted_key = backend.quote_identifier(key)
+        self.column_names = [column["name"] for column in columns]
+        if key not in self.column_names:
+            self.column_names.append(key)
+        if server_side:
+            self.hash_apply, self.row_hash = _server_row_hash(columns, backend.quote_identifier)
+
+    def source_chunks(self, lower: int, upper: int, width: int) -> Dict[int, List[int]]:
+        """Per-chunk (row count, hash sum) of the source rows in ``[lower, upper)``."""
+        params = {"lower": lower, "upper": upper, "width": width}
+        self.queries += 1
+        if self.server_side:
+            rows = self.connector.execute_query(
+                f"SELECT Chunk, COUNT_BIG(*) as RowCnt, SUM(CAST(RowHash AS DECIMAL(38, 0))) as HashSum "
+                f"FROM (SELECT (t.{self.quoted_key} - :lower) / :width as Chunk, {self.row_hash} as RowHash "
+                f"FROM {self.qualified} t {self.hash_apply} "
+                f"WHERE t.{self.quoted_key} >= :lower AND t.{self.quoted_key} < :upper) h "
+                f"GROUP BY Chunk",
+                params=params,
+                return_dataframe=False
+            )
+            return {int(row["Chunk"]): [int(row["RowCnt"]), int(row["HashSum"])] for row in rows}
+
+        totals: Dict[int, List[int]] = {}
+        for batch in self._source_batches(lower, upper):
+            _chunk_checksums(self._keys(batch), hash_rows(batch, self.columns), lower, width, totals)
+        return totals
+
+    def export_chunks(self, lower: int, upper: int, width: int) -> Dict[int, List[int]]:
+        """Per-chunk (row count, hash sum) of the exported rows in ``[lower, upper)``."""
+        totals: Dict[int, List[int]] = {}
+        for batch in self.export.batches(self.key, self.column_names, lower, upper):
+            _chunk_checksums(self._keys(batch), hash_rows(batch, self.columns), lower, width, totals)
+        return totals
+
+    def source_row_hashes(self, lower: int, upper: int) -> Dict[int, int]:
+        """``{key: row hash}`` of the source rows in ``[lower, upper)``."""
+        self.queries += 1
+        if self.server_side:
+            rows = self.connector.execute_query(
+                f"SELECT t.{self.quoted_key} as RowKey, {self.row_hash} as RowHash "
+                f"FROM {self.qualified} t {self.hash_apply} "
+                f"WHERE t.{self.quoted_key} >= :lower AND t.{self.quoted_key} < :upper",
+                params={"lower": lower, "upper": upper},
+                return_dataframe=False
+            )
+            return {int(row["RowKey"]): int(row["RowHash"]) for row in rows}
+        hashes: Dict[int, int] = {}
+        for batch in self._source_batches(lower, upper):
+            hashes.update(zip(self._keys(batch).tolist(), hash_rows(batch, self.columns).tolist()))
+        return hashes
+
+    def export_row_hashes(self, lower: int, upper: int) -> Tuple[Dict[int, int], List[int]]:
+        """``{key: row hash}`` of the exported rows in ``[lower, upper)`` plus duplicated keys."""
+        hashes: Dict[int, int] = {}
+        duplicates: List[int] = []
+        for batch in self.export.batches(self.key, self.column_names, lower, upper):
+            for key, row_hash in zip(self._keys(batch).tolist(), hash_rows(batch, self.columns).tolist()):
+                if key in hashes:
+                    duplicates.append(key)
+                hashes[key] = row_hash
+        return hashes, duplicates
+
+    def _source_batches(self, lower: int, upper: int) -> Iterator[pa.RecordBatch]:
+        quote = self.connector.backend.quote_identifier
+        select = ", ".join(quote(name) for name in self.column_names)
+        return self.connector.execute_query_arrow_batches(
+            f"SELECT {select} FROM {self.qualified} "
+            f"WHERE {self.quoted_key} >= :lower AND {self.quoted_key} < :upper",
+            {"lower": lower, "upper": upper},
+            batch_size=self.batch_size
+        )
+
+    def _keys(self, batch: pa.RecordBatch) -> np.ndarray:
+        return batch.column(batch.schema.get_field_index(self.key)).to_numpy(zero_copy_only=False)
+
+
+def _source_columns(connector: CXMIDLOrchestrationConnector, schema: str, table: str) -> Dict[str, str]:
+    """``{column: SQL data type}`` of the source table, in ordinal order."""
+    rows = connector.execute_query(
+        connector.backend.table_columns_query,
+        params={"schema": connector.backend.schema_name(schema), "table": table},
+        return_dataframe=False
+    )
+    return {row["ColumnName"]: row["DataType"] for row in rows}
+
+
+def reconcile_table(connector: CXMIDLOrchestrationConnector,
+                    table: str,
+                    export: Any,
+                    schema: str = "dbo",
+                    key_column: Optional[str] = None,
+                    columns: Optional[List[str]] = None,
+                    rows_per_chunk: int = DEFAULT_ROWS_PER_CHUNK,
+                    fanout: int = DEFAULT_FANOUT,
+                    leaf_rows: int = DEFAULT_LEAF_ROWS,
+                    batch_size: int = DEFAULT_BATCH_SIZE,
+                    max_keys: int = DEFAULT_MAX_KEYS,
+                    server_side: Optional[bool] = None) -> Dict[str, Any]:
+    """
+    Compare a source table with its exported copy by chunked checksums.
+
+    Both sides are summed once per leaf key range of about ``leaf_rows``
+    rows. Top-level chunks of about ``rows_per_chunk`` rows are compared from
+    their leaves' (row count, hash sum); a differing chunk is compared again
+    as ``fanout`` sub-chunks, down to the leaves, where keys and row hashes
+    are read again and compared directly to list missing, extra and changed
+    rows.
+
+    Args:
+        connector: Orchestration connector
+        table: Table name
+        export: Export directory (``output_dir`` or its ``<schema>.<table>``
+            folder), a Parquet file, a pyarrow Table or a pandas DataFrame
+        schema: Schema name
+        key_column: Integer key to chunk on (default: single-column primary key)
+        columns: Columns to compare (default: every source column present
+            in the export)
+        rows_per_chunk: Target rows per top-level chunk
+        fanout: Sub-chunks per differing chunk
+        leaf_rows: Rows per leaf range, the unit summed by the single pass
+            over each side and compared key by key when it differs
+        batch_size: Rows per local/streamed batch
+        max_keys: Keys listed per difference category
+        server_side: Hash on the server with HASHBYTES (default: SQL Server only)
+
+    Returns:
+        Reconciliation summary with row counts, chunk statistics, differing
+        keys and the number of source queries
+    """
+    table_key = f"{schema}.{table}"
+    start = time.perf_counter()
+
+    try:
+        if fanout < 2:
+            raise ValueError("fanout must be at least 2")
+        backend = connector.backend
+        if server_side is None:
+            server_side = backend.name == "mssql"
+        elif server_side and backend.name != "mssql":
+            raise NotImplementedError(
+                f"Server-side checksums need SQL Server HASHBYTES, which the {backend.name} backend does not have"
+            )
+
+        export_side = _ExportSide(export, schema, table, batch_size)
+        source_types = _source_columns(connector, schema, table)
+        if not source_types:
+            raise ValueError(f"Table {table_key} not found")
+
+        if key_column is None:
+            keys = connector.execute_query(
+                backend.primary_key_query,
+                params={"schema": backend.schema_name(schema), "table": table},
+                return_dataframe=False
+            )
+            if len(keys) != 1:
+                raise ValueError(f"{table_key} has no single-column primary key; pass key_column")
+            key_column = keys[0]["ColumnName"]
+        if key_column not in export_side.schema.names:
+            raise ValueError(f"Key column {key_column} is missing from the export")
+        if not pa.types.is_integer(export_side.schema.field(key_column).type):
+            raise ValueError(f"Key column {key_column} must be an integer column to chunk by key range")
+
+        missing_columns = [name for name in source_types if name not in export_side.schema.names]
+        extra_columns = [name for name in export_side.schema.names if name not in source_types]
+        if columns is None:
+            columns = [name for name in source_types if name in export_side.schema.names]
+        unknown = [name for name in columns if name not in source_types or name not in export_side.schema.names]
+        if unknown:
+            raise ValueError(f"Columns not present on both sides: {', '.join(unknown)}")
+
+        compared = []
+        for position, name in enumerate(columns):
+            arrow_type = export_side.schema.field(name).type
+            # Only SQL Server type names (uniqueidentifier, rowversion, datetime) refine the Arrow type
+            sql_type = source_types[name] if backend.name == "mssql" else None
+            kind = _column_kind(arrow_type, sql_type)
+            compared.append({
+                "name": name,
+                "kind": kind,
+                "scale": arrow_type.scale if kind == "decimal" else 0,
+                "sql_type": sql_type,
+                "lanes": _lane_constants(position)
+            })
+
+        run = _Reconciliation(connector, export_side, schema, table, key_column,
+                              compared, batch_size, server_side)
+
+        quoted_key = backend.quote_identifier(key_column)
+        run.queries += 1
+        bounds = connector.execute_query(
+            f"SELECT {backend.count_expression} as RowCnt, MIN({quoted_key}) as MinKey, "
+            f"MAX({quoted_key}) as MaxKey FROM {run.qualified}",
+            return_dataframe=False
+        )[0]
+        source_rows = int(bounds["RowCnt"] or 0)
+        export_rows, export_min, export_max = export_side.bounds(key_column)
+        lows = [value for value in (bounds["MinKey"], export_min) if value is not None]
+        highs = [value for value in (bounds["MaxKey"], export_max) if value is not None]
+
+        summary = {
+            "timestamp": datetime.now().isoformat(),
+            "schema": schema,
+            "table": table,
+            "export": export_side.source,
+            "key_column": key_column,
+            "columns": [column["name"] for column in compared],
+            "columns_missing_in_export": missing_columns,
+            "columns_extra_in_export": extra_columns,
+            "strategy": "server_checksum" if server_side else "client_checksum",
+            "source_rows": source_rows,
+            "export_rows": export_rows,
+            "missing_in_export": [],
+            "extra_in_export": [],
+            "changed": [],
+            "duplicate_keys_in_export": [],
+            "integration_id": connector.integration_id
+        }
+        differences = {"missing_in_export": 0, "extra_in_export": 0, "changed": 0, "duplicate_keys_in_export": 0}
+        chunks_compared = chunks_differing = levels = 0
+
+        if lows:
+            lower, upper = int(min(lows)), int(max(highs)) + 1
+            leaf_count = max(1, math.ceil(max(source_rows, export_rows) / max(1, leaf_rows)))
+            leaf_width = max(1, math.ceil((upper - lower) / leaf_count))
+            # One pass per side; every coarser level is summed from these leaves
+            source_leaves = run.source_chunks(lower, upper, leaf_width)
+            export_leaves = run.export_chunks(lower, upper, leaf_width)
+
+            span = 1
+            while span < math.ceil(max(1, rows_per_chunk) / max(1, leaf_rows)):
+                span *= fanout
+            pending = None
+            while span and (pending is None or pending):
+                levels += 1
+                source, exported = _roll_up(source_leaves, span), _roll_up(export_leaves, span)
+                nodes = sorted(set(source) | set(exported)) if pending is None else pending
+                next_level = []
+                for node in nodes:
+                    source_entry, export_entry = source.get(node, [0, 0]), exported.get(node, [0, 0])
+                    if not source_entry[0] and not export_entry[0]:
+                        continue
+                    chunks_compared += 1
+                    if source_entry == export_entry:
+                        continue
+                    chunks_differing += 1
+                    if span == 1:
+                        leaf_lower = lower + node * leaf_width
+                        _compare_rows(run, leaf_lower, min(leaf_lower + leaf_width, upper),
+                                      summary, differences, max_keys)
+                    else:
+                        next_level.extend(range(node * fanout, (node + 1) * fanout))
+                pending = next_level
+                span //= fanout
+
+        duration = time.perf_counter() - start
+        summary.update({
+            "differences": differences,
+            "match": not any(differences.values()) and not missing_columns,
+            "chunks_compared": chunks_compared,
+            "chunks_differing": chunks_differing,
+            "levels": levels,
+            "source_queries": run.queries,
+            "duration_seconds": round(duration, 3),
+            "status": "completed"
+        })
+        logger.info(
+            f"Reconciled {table_key}: {'match' if summary['match'] else 'MISMATCH'} "
+            f"({source_rows} source / {export_rows} export rows, {chunks_differing} of {chunks_compared} "
+            f"chunks differ, {run.queries} source queries) in {duration:.2f}s"
+        )
+        return summary
+
+    except Exception as e:
+        logger.error(f"Reconciliation of {table_key} failed: {e}")
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "schema": schema,
+            "table": table,
+            "status": "failed",
+            "error": str(e),
+            "integration_id": connector.integration_id
+        }
+
+
+def _compare_rows(run: _Reconciliation,
+                  lower: int,
+                  upper: int,
+                  summary: Dict[str, Any],
+                  differences: Dict[str, int],
+                  max_keys: int):
+    """Key-by-key comparison of one leaf chunk, recorded into ``summary``."""
+    source = run.source_row_hashes(lower, upper)
+    exported, duplicates = run.export_row_hashes(lower, upper)
+    found = {
+        "missing_in_export": sorted(set(source) - set(exported)),
+        "extra_in_export": sorted(set(exported) - set(source)),
+        "changed": sorted(key for key in set(source) & set(exported) if source[key] != exported[key]),
+        "duplicate_keys_in_export": sorted(set(duplicates))
+    }
+    for category, keys in found.items():
+        differences[category] += len(keys)
+        room = max_keys - len(summary[category])
+        if room > 0:
+            summary[category].extend(keys[:room])
@@ -0,0 +1,496 @@
+"""
+CXMIDL Orchestration Stored Procedure Analyzer
+Alex Taylor Finch Cognitive Architecture - Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+Batch technical analysis of every stored procedure in the Orchestration
+database. Definitions, parameters and dependencies are pulled in three bulk
+catalog queries, each definition is tokenized and measured across a process
+pool, and a Phase 1 Technical Analysis report
+(``StoredProcedure-TechnicalAnalysis-TEMPLATE.md`` layout) is rendered per
+procedure. Incremental runs skip procedures whose definition hash is
+unchanged since the last run.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from cxmidl_connector import CXMIDLOrchestrationConnector
+from cxmidl_dialects import require_sql_server
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_VERSION = "1.0.0"
+STATE_FILE_NAME = "_analysis_state.json"
+REPORT_SUFFIX = "-TechnicalAnalysis.md"
+# Below this many procedures the process pool costs more than it saves
+MIN_PARALLEL_PROCEDURES = 16
+
+PROCEDURES_QUERY = """
+SELECT
+    p.object_id,
+    SCHEMA_NAME(p.schema_id) as schema_name,
+    p.name,
+    p.type_desc,
+    p.create_date,
+    p.modify_date,
+    m.definition
+FROM sys.procedures p
+JOIN sys.sql_modules m ON m.object_id = p.object_id
+WHERE p.is_ms_shipped = 0
+"""
+
+PARAMETERS_QUERY = """
+SELECT
+    pr.object_id,
+    pr.parameter_id,
+    pr.name,
+    TYPE_NAME(pr.user_type_id) as type_name,
+    pr.max_length,
+    pr.precision,
+    pr.scale,
+    pr.is_output,
+    pr.has_default_value,
+    pr.default_value,
+    pr.is_nullable
+FROM sys.parameters pr
+JOIN sys.procedures p ON p.object_id = pr.object_id
+WHERE p.is_ms_shipped = 0
+"""
+
+DEPENDENCIES_QUERY = """
+SELECT
+    d.referencing_id,
+    COALESCE(d.referenced_schema_name, SCHEMA_NAME(o.schema_id)) as referenced_schema,
+    d.referenced_entity_name as referenced_entity,
+    d.referenced_database_name as referenced_database,
+    o.type_desc as referenced_type
+FROM sys.sql_expression_dependencies d
+JOIN sys.procedures p ON p.object_id = d.referencing_id
+LEFT JOIN sys.objects o ON o.object_id = d.referenced_id
+WHERE p.is_ms_shipped = 0
+"""
+
+_TOKEN_PATTERN = re.compile(
+    r"(?P<block>/\*.*?(?:\*/|\Z))"
+    r"|(?P<line>--[^\n]*)"
+    r"|(?P<string>N?'(?:[^']|'')*(?:'|\Z))"
+    r"|(?P<ident>\[(?:[^\]]|\]\])*\]|\"[^\"]*\"|[@#]{0,2}[A-Za-z_][\w@#$]*)"
+    r"|(?P<number>\d+(?:\.\d+)?)"
+    r"|(?P<newline>\n)"
+    r"|(?P<space>[ \t\r]+)"
+    r"|(?P<other>.)",
+    re.DOTALL
+)
+
+_STATEMENT_KEYWORDS = frozenset({
+    "SELECT", "INSERT", "UPDATE", "DELETE", "MERGE", "EXEC", "EXECUTE", "SET",
+    "DECLARE", "TRUNCATE", "CREATE", "DROP", "ALTER", "RETURN", "RAISERROR",
+    "THROW", "PRINT", "OPEN", "FETCH", "CLOSE", "DEALLOCATE", "COMMIT", "ROLLBACK",
+    "WAITFOR", "BREAK", "CONTINUE", "GOTO",
+})
+# Keywords preceded by these continue a statement (subquery, UNION, INSERT ... EXEC, FOR UPDATE)
+_NOT_STATEMENT_START = frozenset({"(", "UNION", "ALL", "EXCEPT", "INTERSECT", "INSERT", "FOR", "THEN"})
+_BRANCH_KEYWORDS = frozenset({"IF", "CASE", "WHILE"})
+_OBJECT_KEYWORDS = frozenset({"FROM", "JOIN", "INTO", "UPDATE", "MERGE", "EXEC", "EXECUTE", "TABLE"})
+# Words that follow FROM/INTO/... without naming an object
+_NOT_OBJECTS = frozenset({"SELECT", "VALUES", "DEFAULT", "OPENJSON", "OPENQUERY", "STRING_SPLIT", "SP_EXECUTESQL"})
+
+
+def _strip_identifier(token: str) -> str:
+    if token.startswith("[") and token.endswith("]"):
+        return token[1:-1].replace("]]", "]")
+    return token.strip('"')
+
+
+def tokenize(definition: str) -> List[Tuple[str, str, int]]:
+    """Split T-SQL into (kind, text, line) tokens, dropping whitespace."""
+    tokens = []
+    line = 1
+    for match in _TOKEN_PATTERN.finditer(definition):
+        kind, text = match.lastgroup, match.group()
+        if kind not in ("space", "newline"):
+            tokens.append((kind, text, line))
+        line += text.count("\n")
+    return tokens
+
+
+def analyze_definition(item: Tuple[str, str]) -> Dict[str, Any]:
+    """
+    Code metrics and referenced objects for one procedure definition.
+
+    Runs in a worker process, so it takes and returns plain data.
+
+    Args:
+        item: (procedure key, definition)
+
+    Returns:
+        Metrics, referenced names and the line numbers of transaction,
+        error-handling and dynamic SQL statements
+    """
+    key, definition = item
+    definition = definition or ""
+    tokens = tokenize(definition)
+    lines = definition.splitlines()
+
+    code_lines = set()
+    comment_lines = set()
+    statements = branches = 0
+    temp_tables = set()
+    referenced = set()
+    transaction_lines = set()
+    error_lines = set()
+    dynamic_lines = set()
+    previous = last_statement = ""
+
+    for position, (kind, text, line) in enumerate(tokens):
+        if kind in ("block", "line"):
+            comment_lines.update(range(line, line + text.count("\n") + 1))
+            continue
+        code_lines.update(range(line, line + text.count("\n") + 1))
+        upper = text.upper() if kind == "ident" else ""
+
+        if upper in _STATEMENT_KEYWORDS and previous not in _NOT_STATEMENT_START \
+                and not (upper == "SET" and last_statement in ("UPDATE", "MERGE")):
+            statements += 1
+            last_statement = upper
+        if upper in _BRANCH_KEYWORDS:
+            branches += 1
+        if upper in ("TRAN", "TRANSACTION") or (upper in ("COMMIT", "ROLLBACK") and previous != "ON"):
+            transaction_lines.add(line)
+        if upper in ("TRY", "CATCH", "RAISERROR", "THROW") or upper.startswith("ERROR_"):
+            error_lines.add(line)
+        if upper == "SP_EXECUTESQL" or (upper in ("EXEC", "EXECUTE") and position + 1 < len(tokens)
+                                        and tokens[position + 1][1] == "("):
+            dynamic_lines.add(line)
+        if kind == "ident" and text.startswith("#"):
+            temp_tables.add(text)
+
+        if previous in _OBJECT_KEYWORDS and kind == "ident" and upper not in _NOT_OBJECTS \
+                and not text.startswith(("@", "#")):
+            # Collect a dotted multi-part name: [db].[schema].[object]
+            parts = [_strip_identifier(text)]
+            cursor = position + 1
+            while cursor + 1 < len(tokens) and tokens[cursor][1] == "." and tokens[cursor + 1][0] == "ident":
+                parts.append(_strip_identifier(tokens[cursor + 1][1]))
+                cursor += 2
+            referenced.add(".".join(parts))
+
+        if kind == "ident":
+            previous = upper
+        elif text not in (".",):
+            previous = text
+
+    comment_only = comment_lines - code_lines
+    return {
+        "key": key,
+        "definition_hash": hashlib.sha256(definition.encode("utf-8")).hexdigest(),
+        "total_lines": len(lines),
+        "blank_lines": sum(1 for text in lines if not text.strip()),
+        "code_lines": len(code_lines),
+        "comment_lines": len(comment_only),
+        "executable_statements": statements,
+        "branching_statements": branches,
+        "token_count": len(tokens),
+        "temp_tables": sorted(temp_tables),
+        "referenced_names": sorted(referenced),
+        "transaction_lines": sorted(transaction_lines),
+        "error_handling_lines": sorted(error_lines),
+        "dynamic_sql_lines": sorted(dynamic_lines),
+    }
+
+
+def _timestamp(value: Any) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def _excerpt(definition: str, line_numbers: List[int]) -> str:
+    """Source lines at ``line_numbers`` (1-based), prefixed with their numbers."""
+    lines = definition.splitlines()
+    return "\n".join(f"{n:>5}: {lines[n - 1].rstrip()}" for n in line_numbers if 0 < n <= len(lines))
+
+
+def report_file_name(procedure: Dict[str, Any]) -> str:
+    """Report file for a procedure, schema-qualified so same-named procedures do not collide."""
+    return f"{procedure['schema_name']}.{procedure['name']}{REPORT_SUFFIX}"
+
+
+def render_report(procedure: Dict[str, Any],
+                  metrics: Dict[str, Any],
+                  parameters: List[Dict[str, Any]],
+                  dependencies: List[Dict[str, Any]],
+                  server: str,
+                  database: str,
+                  connection_id: str) -> str:
+    """Render the Phase 1 Technical Analysis markdown for one procedure."""
+    name = procedure["name"]
+    definition = procedure["definition"] or ""
+    out = [
+        f"# PHASE 1: Technical Analysis - {name}",
+        "",
+        "## 📊 DOCUMENT METADATA",
+        "",
+        f"**Procedure Name**: {procedure['schema_name']}.{name}",
+        f"**Database**: {database}",
+        f"**Server**: {server}",
+        f"**Analysis Date**: {datetime.now().strftime('%B %d, %Y')}",
+        "**Technical Analyst**: cxmidl_sp_analyzer (automated batch extraction)",
+        f"**Connection ID**: {connection_id}",
+        f"**Template Version**: {TEMPLATE_VERSION}",
+        f"**Definition Hash**: `{metrics['definition_hash'][:16]}`",
+        "**Phase**: Technical Data Collection (Phase 1 of 2)",
+        "**Next Phase**: Business Analysis (requires this document as input)",
+        "",
+        "---",
+        "",
+        "## 1️⃣ SOURCE CODE EXTRACTION (Technical Facts Only)",
+        "",
+        "### Raw Procedure Source Code",
+        "```sql",
+        definition.rstrip(),
+        "```",
+        "",
+        "### Technical Code Metrics",
+        f"- **Total Lines**: {metrics['total_lines']}",
+        f"- **Code Lines**: {metrics['code_lines']}",
+        f"- **Comment Lines**: {metrics['comment_lines']}",
+        f"- **Blank Lines**: {metrics['blank_lines']}",
+        f"- **Executable Statements**: {metrics['executable_statements']}",
+        f"- **Branching Statements**: {metrics['branching_statements']}",
+        f"- **Temporary Tables**: {', '.join(metrics['temp_tables']) or 'None'}",
+        "",
+        "---",
+        "",
+        "## 2️⃣ PARAMETER SPECIFICATION (Database Schema Facts)",
+        "",
+        "### Parameter Technical Specifications",
+        "| Parameter Name | Data Type | Max Length | Default Value | Is Output | Is Nullable |",
+        "|----------------|-----------|------------|---------------|-----------|-------------|",
+    ]
+    for parameter in parameters:
+        default = parameter["default_value"] if parameter["has_default_value"] else ""
+        out.append(
+            f"| {parameter['name']} | {parameter['type_name']} | {parameter['max_length']} | "
+            f"{default if default is not None else 'NULL'} | {'Yes' if parameter['is_output'] else 'No'} | "
+            f"{'Yes' if parameter['is_nullable'] else 'No'} |"
+        )
+    if not parameters:
+        out.append("| (none) | | | | | |")
+
+    out += ["", "---", "", "## 3. Dependency Analysis", ""]
+    sections = [
+        ("Referenced Tables", ("USER_TABLE",)),
+        ("Referenced Views", ("VIEW",)),
+        ("Referenced Procedures", ("SQL_STORED_PROCEDURE",)),
+        ("Referenced Functions", ("SQL_SCALAR_FUNCTION", "SQL_INLINE_TABLE_VALUED_FUNCTION",
+                                  "SQL_TABLE_VALUED_FUNCTION")),
+    ]
+    listed = set()
+    for title, types in sections:
+        rows = [d for d in dependencies if d["referenced_type"] in types]
+        out += [f"### {title}", "| Schema | Object Name | Object Type |", "|--------|-------------|-------------|"]
+        for row in sorted(rows, key=lambda d: (d["referenced_schema"] or "", d["referenced_entity"])):
+            out.append(f"| {row['referenced_schema'] or ''} | {row['referenced_entity']} | {row['referenced_type']} |")
+            listed.add(id(row))
+        if not rows:
+            out.append("| (none) | | |")
+        out.append("")
+    unresolved = [d for d in dependencies if id(d) not in listed]
+    if unresolved:
+        out += ["### Unresolved or External References", "| Database | Schema | Name |", "|----------|--------|------|"]
+        for row in unresolved:
+            out.append(f"| {row['referenced_database'] or ''} | {row['referenced_schema'] or ''} | "
+                       f"{row['referenced_entity']} |")
+        out.append("")
+    out += [
+        "### Names Referenced in Source (token scan)",
+        ", ".join(f"`{name}`" for name in metrics["referenced_names"]) or "None",
+        "",
+        "---",
+        "",
+        "## 8. System Catalog Analysis",
+        "",
+        "### Object Information",
+        f"- **Object ID**: {procedure['object_id']}",
+        f"- **Type**: {procedure['type_desc']}",
+        f"- **Created**: {_timestamp(procedure['create_date'])}",
+        f"- **Modified**: {_timestamp(procedure['modify_date'])}",
+        "",
+        "---",
+        "",
+        "## 10. Error Handling Analysis",
+        "",
+        "### Error Handling Statements",
+        "```sql",
+        _excerpt(definition, metrics["error_handling_lines"]) or "-- none",
+        "```",
+        "",
+        "### Transaction Management",
+        "```sql",
+        _excerpt(definition, metrics["transaction_lines"]) or "-- none",
+        "```",
+        "",
+        "---",
+        "",
+        "## 12. Security Analysis",
+        "",
+        "### Dynamic SQL Analysis",
+        "```sql",
+        _excerpt(definition, metrics["dynamic_sql_lines"]) or "-- none",
+        "```",
+        "",
+        "---",
+        "",
+        "## 🔄 HANDOFF TO BUSINESS ANALYSIS PHASE",
+        "",
+        f"- **Saved as**: `{report_file_name(procedure)}`",
+        "- **Status**: Ready for Business Analysis Phase (Phase 2)",
+        "- **Next Template**: `StoredProcedure-BusinessAnalysis-TEMPLATE.md`",
+        "",
+    ]
+    return "\n".join(out)
+
+
+def _load_state(path: Path) -> Dict[str, str]:
+    if path.exists():
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    return {}
+
+
+def _write_state(path: Path, state: Dict[str, str]):
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def analyze_procedures(connector: CXMIDLOrchestrationConnector,
+                       output_dir: Union[str, Path],
+                       procedures: Optional[List[str]] = None,
+                       incremental: bool = True,
+                       max_workers: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Analyze stored procedures and write one Technical Analysis report each
+    (``<schema>.<name>-TechnicalAnalysis.md``).
+
+    Args:
+        connector: Orchestration connector
+        output_dir: Directory for the reports and the hash state file
+        procedures: Procedure names (``name`` or ``schema.name``); default all
+        incremental: Skip procedures whose definition hash matches the last
+            run and whose report still exists
+        max_workers: Worker processes for tokenizing (default: CPU count)
+
+    Returns:
+        Run summary with analyzed/skipped counts, per-procedure metrics and timing
+    """
+    require_sql_server(connector, "Stored procedure analysis")
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    state_path = output_dir / STATE_FILE_NAME
+    start = time.perf_counter()
+
+    try:
+        results = connector.execute_many(
+            [PROCEDURES_QUERY, PARAMETERS_QUERY, DEPENDENCIES_QUERY], return_dataframe=False
+        )
+        failures = [item["error"] for item in results if not item["success"]]
+        if failures:
+            raise RuntimeError(f"Catalog extraction failed: {failures[0]}")
+        rows, parameter_rows, dependency_rows = (item["result"] for item in results)
+        fetch_seconds = time.perf_counter() - start
+
+        if procedures:
+            wanted = {name.lower() for name in procedures}
+            rows = [row for row in rows
+                    if row["name"].lower() in wanted or f"{row['schema_name']}.{row['name']}".lower() in wanted]
+
+        state = _load_state(state_path) if incremental else {}
+        pending = []
+        skipped = []
+        for row in rows:
+            key = f"{row['schema_name']}.{row['name']}"
+            digest = hashlib.sha256((row["definition"] or "").encode("utf-8")).hexdigest()
+            if incremental and state.get(key) == digest and (output_dir / report_file_name(row)).exists():
+                skipped.append(key)
+            else:
+                pending.append((key, row))
+
+        items = [(key, row["definition"]) for key, row in pending]
+        if len(items) >= MIN_PARALLEL_PROCEDURES and max_workers != 1:
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                chunksize = max(1, len(items) // ((max_workers or os.cpu_count() or 1) * 4))
+                metrics = list(executor.map(analyze_definition, items, chunksize=chunksize))
+        else:
+            metrics = [analyze_definition(item) for item in items]
+
+        parameters_by_id: Dict[int, List[Dict[str, Any]]] = {}
+        for parameter in sorted(parameter_rows, key=lambda p: p["parameter_id"]):
+            parameters_by_id.setdefault(parameter["object_id"], []).append(parameter)
+        dependencies_by_id: Dict[int, List[Dict[str, Any]]] = {}
+        for dependency in dependency_rows:
+            dependencies_by_id.setdefault(dependency["referencing_id"], []).append(dependency)
+
+        connection_id = getattr(connector, "integration_id", "")
+        analyzed = []
+        for (key, row), result in zip(pending, metrics):
+            report = render_report(
+                row, result,
+                parameters_by_id.get(row["object_id"], []),
+                dependencies_by_id.get(row["object_id"], []),
+                connector.server, connector.database, connection_id
+            )
+            report_path = output_dir / report_file_name(row)
+            with open(report_path, "w", encoding="utf-8") as f:
+                f.write(report)
+            state[key] = result["definition_hash"]
+            analyzed.append({
+                "procedure": key,
+                "report": str(report_path),
+                **{name: result[name] for name in (
+                    "total_lines", "code_lines", "comment_lines",
+                    "executable_statements", "branching_statements")},
+                "referenced_objects": len(dependencies_by_id.get(row["object_id"], []))
+            })
+
+        if rows:
+            current = {f"{row['schema_name']}.{row['name']}" for row in rows}
+            if not procedures:
+                state = {key: digest for key, digest in state.items() if key in current}
+            _write_state(state_path, state)
+
+        duration = time.perf_counter() - start
+        logger.info(
+            f"Analyzed {len(analyzed)} procedures ({len(skipped)} unchanged) in {duration:.2f}s "
+            f"(catalog fetch {fetch_seconds:.2f}s)"
+        )
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "output_dir": str(output_dir),
+            "procedures": len(rows),
+            "analyzed": analyzed,
+            "skipped": skipped,
+            "fetch_seconds": round(fetch_seconds, 3),
+            "duration_seconds": round(duration, 3),
+            "status": "completed",
+            "integration_id": connector.integration_id
+        }
+
+    except Exception as e:
+        logger.error(f"Stored procedure analysis failed: {e}")
+        return {
+            "timestamp": datetime.now().isoformat(),
+            "output_dir": str(output_dir),
+            "status": "failed",
+            "error": str(e),
+            "integration_id": connector.integration_id
+        }
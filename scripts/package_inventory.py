@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+"""
+Installed Package Inventory
+Alex Taylor Finch Cognitive Architecture - Azure Enterprise Data Platform
+Version: 1.0.0 UNNILNILIUM
+
+Shared by verify_python_env.py and resolve-conflicts.py. Installed
+distributions are read in-process from importlib.metadata in a single pass
+(no ``pip show`` per package), and import smoke tests run in parallel, one
+fresh interpreter per module, with per-import timing. Both results are
+cached under ~/.cache/fishbowl-poc/ keyed by a fingerprint of the
+environment's site-packages, so repeat runs on an unchanged environment
+return almost instantly.
+"""
+
+import hashlib
+import json
+import os
+import re
+import subprocess
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "fishbowl-poc"
+CACHE_FILE = "package-inventory.json"
+CACHE_VERSION = 1
+IMPORT_TIMEOUT_SECONDS = 120
+
+_METADATA_SUFFIXES = (".dist-info", ".egg-info", ".egg-link", ".pth")
+
+_IMPORT_PROBE = """
+import importlib, json, sys, time
+start = time.perf_counter()
+module = importlib.import_module(sys.argv[1])
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed, "version": str(getattr(module, "__version__", "Unknown"))}))
+"""
+
+
+def normalize_name(name: str) -> str:
+    """PEP 503 normalized distribution name (``Python_Dotenv`` -> ``python-dotenv``)."""
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def site_packages_fingerprint() -> str:
+    """
+    Hash of the interpreter and the package metadata entries on ``sys.path``.
+
+    Installing, upgrading or removing a distribution adds, renames or
+    deletes its ``name-version.dist-info`` directory, which changes the
+    fingerprint; listing the directories is far cheaper than reading the
+    metadata itself.
+    """
+    digest = hashlib.sha256()
+    digest.update(f"{sys.executable}|{sys.version}".encode("utf-8"))
+    for entry in sys.path:
+        path = Path(entry or ".")
+        try:
+            names = sorted(name for name in os.listdir(path) if name.endswith(_METADATA_SUFFIXES))
+        except OSError:
+            continue
+        if names:
+            digest.update(str(path.resolve()).encode("utf-8"))
+            digest.update("\0".join(names).encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PackageInventory:
+    """Installed distributions and import smoke test results for one environment."""
+
+    def __init__(self, use_cache: bool = True, cache_dir: Optional[Path] = None):
+        """
+        Args:
+            use_cache: Reuse results cached for the same site-packages fingerprint
+            cache_dir: Cache directory (default: ~/.cache/fishbowl-poc)
+        """
+        self.cache_path = Path(cache_dir or CACHE_DIR) / CACHE_FILE
+        self.fingerprint = site_packages_fingerprint()
+        self.from_cache = False
+        self._document: Dict[str, Any] = {}
+        if use_cache:
+            self._document = self._load()
+            self.from_cache = bool(self._document)
+        if not self._document:
+            self._document = {
+                "cache_version": CACHE_VERSION,
+                "fingerprint": self.fingerprint,
+                "python": sys.version.split()[0],
+                "distributions": self._scan(),
+                "imports": {}
+            }
+            self._save()
+
+    def _load(self) -> Dict[str, Any]:
+        try:
+            with open(self.cache_path, "r", encoding="utf-8") as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if document.get("cache_version") != CACHE_VERSION or document.get("fingerprint") != self.fingerprint:
+            return {}
+        return document
+
+    def _save(self):
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = self.cache_path.with_suffix(".tmp")
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._document, f, indent=2)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            # A read-only home directory only costs the next run its cache
+            pass
+
+    @staticmethod
+    def _scan() -> Dict[str, Dict[str, Any]]:
+        """One pass over every installed distribution's metadata."""
+        distributions: Dict[str, Dict[str, Any]] = {}
+        for dist in metadata.distributions():
+            name = dist.metadata["Name"]
+            if not name:
+                continue
+            key = normalize_name(name)
+            # First entry on sys.path wins, as it does for imports
+            if key not in distributions:
+                distributions[key] = {
+                    "name": name,
+                    "version": dist.version,
+                    "requires": list(dist.requires or [])
+                }
+        return distributions
+
+    @property
+    def distributions(self) -> Dict[str, Dict[str, Any]]:
+        """Installed distributions keyed by normalized name."""
+        return self._document["distributions"]
+
+    def version(self, distribution: str) -> Optional[str]:
+        """Installed version of ``distribution`` (None when not installed)."""
+        entry = self.distributions.get(normalize_name(distribution))
+        return entry["version"] if entry else None
+
+    def versions(self, distributions: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Installed versions for several distributions."""
+        return {name: self.version(name) for name in distributions}
+
+    def smoke_test_imports(self,
+                           modules: Iterable[str],
+                           max_workers: Optional[int] = None,
+                           timeout: float = IMPORT_TIMEOUT_SECONDS) -> Dict[str, Dict[str, Any]]:
+        """
+        Import each module in its own fresh interpreter, in parallel.
+
+        A separate process per module gives honest per-import timings (no
+        shared, already-imported dependencies), isolates crashes in native
+        extensions, and lets a hung import be killed at ``timeout``.
+
+        Returns:
+            ``{module: {"ok", "ms", "version" | "error"}}``; results for
+            modules already tested in this environment come from the cache
+        """
+        modules = list(dict.fromkeys(modules))
+        cached = self._document["imports"]
+        pending = [module for module in modules if module not in cached]
+        if pending:
+            workers = max_workers or min(len(pending), os.cpu_count() or 1)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for module, result in zip(pending, executor.map(lambda m: _import_module(m, timeout), pending)):
+                    cached[module] = result
+            self._save()
+        return {module: cached[module] for module in modules}
+
+
+def _import_module(module: str, timeout: float) -> Dict[str, Any]:
+    """Import ``module`` in a child interpreter and report the outcome."""
+    start = time.perf_counter()
+    try:
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE, module],
+            capture_output=True, text=True, timeout=timeout
+        )
+    except subprocess.TimeoutExpired:
+        return {"ok": False, "ms": round(timeout * 1000, 1), "error": f"Import timed out after {timeout:.0f}s"}
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return {
+            "ok": False,
+            "ms": round((time.perf_counter() - start) * 1000, 1),
+            "error": lines[-1] if lines else f"exit code {result.returncode}"
+        }
+    probe = json.loads(result.stdout.strip().splitlines()[-1])
+    return {"ok": True, "ms": round(probe["ms"], 1), "version": probe["version"]}
+
+
+def load_inventory(refresh: bool = False) -> PackageInventory:
+    """Inventory for the running interpreter (``refresh`` ignores the cache)."""
+    return PackageInventory(use_cache=not refresh)
+
+
+if __name__ == "__main__":
+    inventory = load_inventory(refresh="--refresh" in sys.argv[1:])
+    source = "cache" if inventory.from_cache else "metadata scan"
+    print(f"{len(inventory.distributions)} distributions ({source}), fingerprint {inventory.fingerprint[:12]}")
+    for key in sorted(inventory.distributions):
+        entry = inventory.distributions[key]
+        print(f"  {entry['name']}=={entry['version']}")
@@ -8,8 +8,23 @@ import subprocess
 import sys
 import os
 from pathlib import Path
+import functools
 import json
 import re
+import time
+import zipfile
+
+try:
+    from packaging.requirements import InvalidRequirement, Requirement
+    from packaging.specifiers import Specifier, SpecifierSet
+    from packaging.version import InvalidVersion, Version
+except ImportError:
+    # pip always ships a vendored copy
+    from pip._vendor.packaging.requirements import InvalidRequirement, Requirement
+    from pip._vendor.packaging.specifiers import Specifier, SpecifierSet
+    from pip._vendor.packaging.version import InvalidVersion, Version
+
+from package_inventory import load_inventory, normalize_name
 
 def run_command(cmd, capture_output=True):
     """Run a command and return the result"""
@@ -40,8 +55,313 @@ def check_pip_check():
                 print(f"   - {conflict}")
         return False, conflicts
 
-def analyze_requirements_files():
-    """Analyze requirements files for potential conflicts"""
+# Constraints that package metadata does not declare but that hold in practice:
+# {package: [(requirement, reason)]}
+KNOWN_CONSTRAINTS = {
+    "koalas": [
+        ("pyspark<3.2", "Koalas was folded into PySpark 3.2 as pyspark.pandas; import pyspark.pandas instead"),
+    ],
+}
+
+
+def _parse_requirement_line(line):
+    """Strip comments and options from a requirements line (None when nothing is left)."""
+    line = re.split(r"\s+#", line.strip(), maxsplit=1)[0].strip()
+    if not line or line.startswith('#'):
+        return None
+    return line
+
+
+def read_requirements(path, seen=None):
+    """
+    Parse a requirements file (following ``-r``/``-c`` includes) into
+    ``(Requirement, source, is_constraint)`` tuples. Lines whose environment
+    markers do not apply to this interpreter are skipped.
+    """
+    path = Path(path)
+    seen = seen if seen is not None else set()
+    resolved = path.resolve()
+    if resolved in seen:
+        return [], []
+    seen.add(resolved)
+
+    entries, errors = [], []
+    with open(path, 'r', encoding='utf-8') as f:
+        for number, raw in enumerate(f, start=1):
+            line = _parse_requirement_line(raw)
+            if line is None:
+                continue
+            source = f"{path.name}:{number}"
+            include = re.match(r"^(-r|--requirement|-c|--constraint)\s*=?\s*(\S+)", line)
+            if include:
+                nested, nested_errors = read_requirements(path.parent / include.group(2), seen)
+                constraint = include.group(1) in ("-c", "--constraint")
+                entries.extend((req, src, is_constraint or constraint) for req, src, is_constraint in nested)
+                errors.extend(nested_errors)
+                continue
+            if line.startswith('-'):
+                continue
+            try:
+                requirement = Requirement(line)
+            except InvalidRequirement as e:
+                errors.append(f"{source}: {e}")
+                continue
+            if requirement.marker is not None and not requirement.marker.evaluate():
+                continue
+            entries.append((requirement, source, False))
+    return entries, errors
+
+
+def _bump(release, length):
+    """Smallest version above every ``release[:length]`` prefix match (``1.4`` -> ``1.5``)."""
+    prefix = list(release[:length]) + [0] * max(0, length - len(release))
+    prefix[-1] += 1
+    return Version(".".join(str(part) for part in prefix))
+
+
+@functools.lru_cache(maxsize=None)
+def version_range(specifiers):
+    """
+    Intersect a frozenset of specifier strings into one version interval.
+
+    Returns:
+        ``(low, low_inclusive, high, high_inclusive, excluded)`` with None for
+        an open bound, or None when no version can satisfy every specifier
+    """
+    low = high = None
+    low_inclusive = high_inclusive = True
+    excluded = set()
+
+    def raise_low(version, inclusive):
+        nonlocal low, low_inclusive
+        if low is None or version > low or (version == low and not inclusive):
+            low, low_inclusive = version, inclusive
+
+    def lower_high(version, inclusive):
+        nonlocal high, high_inclusive
+        if high is None or version < high or (version == high and not inclusive):
+            high, high_inclusive = version, inclusive
+
+    for text in specifiers:
+        spec = Specifier(text)
+        operator, value = spec.operator, spec.version
+        if operator == "===":
+            continue
+        wildcard = value.endswith(".*")
+        try:
+            version = Version(value[:-2] if wildcard else value)
+        except InvalidVersion:
+            continue
+        if operator == ">=":
+            raise_low(version, True)
+        elif operator == ">":
+            raise_low(version, False)
+        elif operator == "<=":
+            lower_high(version, True)
+        elif operator == "<":
+            lower_high(version, False)
+        elif operator == "~=":
+            raise_low(version, True)
+            lower_high(_bump(version.release, len(version.release) - 1), False)
+        elif operator == "==" and wildcard:
+            raise_low(version, True)
+            lower_high(_bump(version.release, len(version.release)), False)
+        elif operator == "==":
+            raise_low(version, True)
+            lower_high(version, True)
+        elif operator == "!=" and not wildcard:
+            excluded.add(version)
+
+    if low is not None and high is not None:
+        if low > high or (low == high and not (low_inclusive and high_inclusive)):
+            return None
+        if low == high and low in excluded:
+            return None
+    return (low, low_inclusive, high, high_inclusive, frozenset(excluded))
+
+
+def _describe_range(bounds):
+    low, low_inclusive, high, high_inclusive, _ = bounds
+    parts = []
+    if low is not None:
+        parts.append(f"{'>=' if low_inclusive else '>'}{low}")
+    if high is not None:
+        parts.append(f"{'<=' if high_inclusive else '<'}{high}")
+    return ",".join(parts) or "any"
+
+
+def _specifier_key(rules):
+    """Frozenset of the individual specifiers in ``[(specifier_set, source)]`` (the cache key)."""
+    return frozenset(str(spec) for text, _ in rules for spec in SpecifierSet(text))
+
+
+class OfflineResolver:
+    """
+    Offline constraint check over requirements files.
+
+    Packages are nodes of a constraint graph. Edges come from the top-level
+    requirements, from the ``Requires-Dist`` metadata of the installed
+    distributions and of wheels in a local wheel cache, and from
+    ``KNOWN_CONSTRAINTS``. Each package's constraints are intersected
+    (memoized on the specifier set) to find unsatisfiable combinations; no
+    index or network access is needed.
+    """
+
+    def __init__(self, inventory=None, wheel_dirs=()):
+        """
+        Args:
+            inventory: PackageInventory of the running environment
+            wheel_dirs: Directories searched (recursively) for ``*.whl`` files
+        """
+        self.inventory = inventory
+        self.wheels = {}
+        for wheel_dir in wheel_dirs:
+            for wheel in Path(wheel_dir).rglob("*.whl"):
+                parts = wheel.name[:-4].split("-")
+                if len(parts) < 5:
+                    continue
+                try:
+                    version = Version(parts[1])
+                except InvalidVersion:
+                    continue
+                self.wheels.setdefault(normalize_name(parts[0]), {})[version] = wheel
+
+    def candidates(self, name):
+        """Locally available versions of ``name``, newest first."""
+        versions = set(self.wheels.get(name, {}))
+        installed = self.inventory.version(name) if self.inventory else None
+        if installed:
+            try:
+                versions.add(Version(installed))
+            except InvalidVersion:
+                pass
+        return sorted(versions, reverse=True)
+
+    @functools.lru_cache(maxsize=None)
+    def requires(self, name, version):
+        """``Requires-Dist`` strings of a locally available distribution version."""
+        if self.inventory and self.inventory.version(name) == str(version):
+            return tuple(self.inventory.distributions[name]["requires"])
+        wheel = self.wheels.get(name, {}).get(version)
+        if wheel is None:
+            return ()
+        with zipfile.ZipFile(wheel) as archive:
+            metadata_name = next((item for item in archive.namelist() if item.endswith(".dist-info/METADATA")), None)
+            if metadata_name is None:
+                return ()
+            text = archive.read(metadata_name).decode("utf-8", errors="replace")
+        return tuple(line.split(":", 1)[1].strip() for line in text.splitlines() if line.startswith("Requires-Dist:"))
+
+    def check(self, entries):
+        """
+        Check parsed requirement entries.
+
+        Returns:
+            Report with duplicates, conflicts (unsatisfiable constraint sets),
+            installed versions violating a constraint, unresolvable packages
+            and the timing
+        """
+        start = time.perf_counter()
+        constraints = {}
+        extras = {}
+        duplicates = []
+        top_level = {}
+
+        for requirement, source, _ in entries:
+            name = normalize_name(requirement.name)
+            if name in top_level:
+                first_requirement, first_source = top_level[name]
+                kind = "identical" if str(first_requirement) == str(requirement) else "differing"
+                duplicates.append({
+                    "package": name, "kind": kind,
+                    "first": f"{first_requirement} ({first_source})",
+                    "duplicate": f"{requirement} ({source})"
+                })
+            else:
+                top_level[name] = (requirement, source)
+            constraints.setdefault(name, []).append((str(requirement.specifier), source))
+            extras.setdefault(name, set()).update(requirement.extras)
+
+        for name, rules in KNOWN_CONSTRAINTS.items():
+            if name in top_level:
+                for text, reason in rules:
+                    requirement = Requirement(text)
+                    constraints.setdefault(normalize_name(requirement.name), []).append(
+                        (str(requirement.specifier), f"known constraint from {name}: {reason}")
+                    )
+
+        # Walk dependencies of the chosen local candidates to a fixpoint
+        chosen = {}
+        pending = list(top_level)
+        visited = set()
+        while pending:
+            name = pending.pop()
+            bounds = version_range(_specifier_key(constraints.get(name, [])))
+            candidate = next((version for version in self.candidates(name)
+                              if bounds is not None and self._allows(bounds, version)), None)
+            if candidate is None or chosen.get(name) == candidate:
+                continue
+            chosen[name] = candidate
+            requested = extras.get(name, set())
+            for text in self.requires(name, candidate):
+                try:
+                    dependency = Requirement(text)
+                except InvalidRequirement:
+                    continue
+                if dependency.marker is not None and not any(
+                    dependency.marker.evaluate({"extra": extra}) for extra in (requested | {""})
+                ):
+                    continue
+                target = normalize_name(dependency.name)
+                edge = (target, str(dependency.specifier), f"{name}=={candidate}")
+                if edge in visited:
+                    continue
+                visited.add(edge)
+                constraints.setdefault(target, []).append((edge[1], edge[2]))
+                extras.setdefault(target, set()).update(dependency.extras)
+                pending.append(target)
+                if target in chosen:
+                    # New constraint: the earlier choice may no longer fit
+                    chosen.pop(target)
+
+        conflicts, installed_mismatches, unresolved = [], [], []
+        for name, rules in sorted(constraints.items()):
+            specs = _specifier_key(rules)
+            bounds = version_range(specs)
+            sources = [f"{spec or 'any'} ({source})" for spec, source in rules]
+            if bounds is None:
+                conflicts.append({"package": name, "constraints": sources})
+                continue
+            installed = self.inventory.version(name) if self.inventory else None
+            if installed and not SpecifierSet(",".join(sorted(specs))).contains(installed, prereleases=True):
+                installed_mismatches.append({"package": name, "installed": installed,
+                                             "required": _describe_range(bounds), "constraints": sources})
+            if name in top_level and name not in chosen:
+                unresolved.append({"package": name, "required": _describe_range(bounds)})
+
+        return {
+            "requirements": len(entries),
+            "packages": len(top_level),
+            "graph_packages": len(constraints),
+            "duplicates": duplicates,
+            "conflicts": conflicts,
+            "installed_mismatches": installed_mismatches,
+            "unresolved_offline": unresolved,
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)
+        }
+
+    @staticmethod
+    def _allows(bounds, version):
+        low, low_inclusive, high, high_inclusive, excluded = bounds
+        if low is not None and (version < low or (version == low and not low_inclusive)):
+            return False
+        if high is not None and (version > high or (version == high and not high_inclusive)):
+            return False
+        return version not in excluded
+
+
+def analyze_requirements_files(wheel_dirs=None, refresh=False):
+    """Resolve requirements files offline and report duplicate and conflicting constraints"""
     print("\n📋 Analyzing requirements files...")
     
     base_file = Path("requirements.txt")
@@ -49,41 +369,39 @@ def analyze_requirements_files():
     
     if not base_file.exists():
         print("❌ requirements.txt not found")
-        return
+        return None
     
-    if not dev_file.exists():
-        print("❌ requirements-dev.txt not found")
-        return
+    # requirements-dev.txt includes requirements.txt via -r
+    entries, errors = read_requirements(dev_file if dev_file.exists() else base_file)
+    for error in errors:
+        print(f"   ❌ Invalid requirement {error}")
+    
+    if wheel_dirs is None:
+        wheel_dirs = [path for path in (Path(".pip-cache"), Path("wheels")) if path.is_dir()]
+    resolver = OfflineResolver(load_inventory(refresh=refresh), wheel_dirs)
+    report = resolver.check(entries)
     
-    # Parse base requirements
-    base_deps = {}
-    with open(base_file, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if line and not line.startswith('#') and not line.startswith('-'):
-                if '>=' in line:
-                    name, version = line.split('>=', 1)
-                    base_deps[name.strip()] = version.strip()
-                elif '==' in line:
-                    name, version = line.split('==', 1)
-                    base_deps[name.strip()] = version.strip()
-                else:
-                    base_deps[line.strip()] = "any"
-    
-    print(f"📦 Found {len(base_deps)} base dependencies")
-    
-    # Check for common conflict patterns
-    conflict_patterns = {
-        'azure-core': 'Azure SDK conflicts',
-        'pyspark': 'Spark version conflicts',
-        'pandas': 'Data processing conflicts',
-        'numpy': 'Numerical library conflicts',
-        'jupyter': 'Jupyter ecosystem conflicts'
-    }
-    
-    for package, description in conflict_patterns.items():
-        if package in base_deps:
-            print(f"   ⚠️ Watch for {description} with {package}>={base_deps[package]}")
+    print(f"📦 {report['requirements']} requirements, {report['packages']} packages, "
+          f"{report['graph_packages']} in the constraint graph (checked in {report['elapsed_ms']:.1f}ms)")
+    
+    for duplicate in report["duplicates"]:
+        print(f"   ⚠️ Duplicate ({duplicate['kind']}) {duplicate['package']}: "
+              f"{duplicate['first']} and {duplicate['duplicate']}")
+    for conflict in report["conflicts"]:
+        print(f"   ❌ Unsatisfiable constraints on {conflict['package']}:")
+        for constraint in conflict["constraints"]:
+            print(f"      - {constraint}")
+    for mismatch in report["installed_mismatches"]:
+        print(f"   ⚠️ Installed {mismatch['package']} {mismatch['installed']} "
+              f"does not satisfy {mismatch['required']}")
+    if report["unresolved_offline"]:
+        names = [item["package"] for item in report["unresolved_offline"]]
+        more = f" and {len(names) - 10} more" if len(names) > 10 else ""
+        print(f"   ℹ️ No local candidate (installed or cached wheel) for {len(names)} packages: "
+              f"{', '.join(names[:10])}{more}")
+    if not report["duplicates"] and not report["conflicts"]:
+        print("   ✅ No duplicate or conflicting constraints")
+    return report
 
 def suggest_fixes():
     """Suggest fixes for common dependency issues"""
@@ -155,8 +473,8 @@ def create_clean_environment():
     for step in steps:
         print(step)
 
-def check_package_versions():
-    """Check versions of key packages"""
+def check_package_versions(refresh=False):
+    """Check versions of key packages (one in-process metadata pass, cached per environment)"""
     print("\n📦 Key Package Versions:")
     print("=" * 60)
     
@@ -165,16 +483,10 @@ def check_package_versions():
         'pyspark', 'jupyter', 'notebook', 'python-dotenv'
     ]
     
-    for package in key_packages:
-        success, stdout, stderr = run_command(f"pip show {package}")
-        if success:
-            lines = stdout.split('\n')
-            version_line = [l for l in lines if l.startswith('Version:')]
-            if version_line:
-                version = version_line[0].split(':', 1)[1].strip()
-                print(f"✅ {package}: {version}")
-            else:
-                print(f"⚠️ {package}: Version not found")
+    inventory = load_inventory(refresh=refresh)
+    for package, version in inventory.versions(key_packages).items():
+        if version:
+            print(f"✅ {package}: {version}")
         else:
             print(f"❌ {package}: Not installed")
 
@@ -185,6 +497,12 @@ def main():
     print("Fishbowl POC Environment Diagnostics")
     print()
     
+    refresh = '--refresh' in sys.argv[1:]
+    
+    # Requirements analysis is offline and needs no virtual environment
+    report = analyze_requirements_files(refresh=refresh)
+    requirement_conflicts = bool(report and (report["conflicts"] or report["duplicates"]))
+    
     # Check current environment
     if not os.path.exists('.venv'):
         print("⚠️ Virtual environment not found. Run setup-environment.ps1 first.")
@@ -195,11 +513,8 @@ def main():
     # Check for conflicts
     has_conflicts, conflicts = check_pip_check()
     
-    # Analyze requirements files
-    analyze_requirements_files()
-    
     # Show package versions
-    check_package_versions()
+    check_package_versions(refresh=refresh)
     
     # Provide suggestions
     if has_conflicts:
@@ -215,7 +530,8 @@ def main():
     
     print(f"\n📋 Summary:")
     print(f"   Conflicts detected: {'Yes' if has_conflicts else 'No'}")
-    print(f"   Environment: {'Needs attention' if has_conflicts else 'Healthy'}")
+    print(f"   Requirements issues: {'Yes' if requirement_conflicts else 'No'}")
+    print(f"   Environment: {'Needs attention' if has_conflicts or requirement_conflicts else 'Healthy'}")
 
 if __name__ == "__main__":
     main()
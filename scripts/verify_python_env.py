@@ -10,10 +10,27 @@ and can be imported successfully.
 """
 
 import sys
-import importlib
-from typing import List, Tuple
+import json
+import subprocess
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 
+from package_inventory import PackageInventory, load_inventory
+
+# Import + connection string budget for cxmidl_connector (CLI wrappers, health probes)
+CONNECTOR_IMPORT_BUDGET_MS = 100
+HEAVY_MODULES = ('sqlalchemy', 'pyodbc', 'pandas', 'numpy', 'pyarrow', 'azure.identity')
+
+_IMPORT_PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import cxmidl_connector
+cxmidl_connector.CXMIDLOrchestrationConnector().connection_string
+elapsed = (time.perf_counter() - start) * 1000
+print(json.dumps({"ms": elapsed, "heavy": [m for m in %r if m in sys.modules]}))
+"""
+
 def check_python_version() -> bool:
     """Check if Python version is 3.8 or higher."""
     if sys.version_info >= (3, 8):
@@ -23,14 +40,62 @@ def check_python_version() -> bool:
         print(f"❌ Python {sys.version.split()[0]} (Requires 3.8+)")
         return False
 
-def check_package(package_name: str) -> Tuple[bool, str]:
-    """Check if a package can be imported."""
-    try:
-        module = importlib.import_module(package_name)
-        version = getattr(module, '__version__', 'Unknown')
-        return True, version
-    except ImportError as e:
-        return False, str(e)
+def check_packages(inventory: PackageInventory,
+                   packages: List[Tuple[str, str]],
+                   smoke_tests: Optional[Dict[str, Dict]] = None) -> Dict[str, Tuple[bool, str]]:
+    """
+    Check that packages are installed (and, with smoke tests, importable).
+    
+    Args:
+        inventory: Installed distribution inventory
+        packages: (import name, distribution name) pairs
+        smoke_tests: Import results from ``inventory.smoke_test_imports``
+        
+    Returns:
+        ``{import name: (ok, version or error)}``
+    """
+    results = {}
+    for module, distribution in packages:
+        version = inventory.version(distribution)
+        if version is None:
+            results[module] = (False, "Not installed")
+            continue
+        outcome = (smoke_tests or {}).get(module)
+        if outcome is None:
+            results[module] = (True, version)
+        elif outcome["ok"]:
+            results[module] = (True, f"{version}, import {outcome['ms']:.0f}ms")
+        else:
+            results[module] = (False, f"installed {version} but import failed: {outcome['error']}")
+    return results
+
+def check_connector_import_time(budget_ms: float = CONNECTOR_IMPORT_BUDGET_MS, runs: int = 3) -> bool:
+    """Check that importing cxmidl_connector and building a connection string stays within budget."""
+    scripts_dir = Path(__file__).resolve().parent
+    timings = []
+    heavy: List[str] = []
+    for _ in range(runs):
+        # Fresh interpreter per run so nothing is already imported
+        result = subprocess.run(
+            [sys.executable, "-c", _IMPORT_PROBE % (HEAVY_MODULES,)],
+            cwd=scripts_dir, capture_output=True, text=True, timeout=60
+        )
+        if result.returncode != 0:
+            error = result.stderr.strip().splitlines()[-1] if result.stderr.strip() else "unknown error"
+            print(f"  ❌ cxmidl_connector import failed - {error}")
+            return False
+        probe = json.loads(result.stdout.strip().splitlines()[-1])
+        timings.append(probe["ms"])
+        heavy = probe["heavy"]
+    best = min(timings)
+    if heavy:
+        print(f"  ❌ cxmidl_connector import loads heavy modules eagerly: {', '.join(heavy)}")
+        return False
+    if best > budget_ms:
+        print(f"  ❌ cxmidl_connector import {best:.1f}ms (budget {budget_ms:.0f}ms)")
+        return False
+    print(f"  ✅ cxmidl_connector import {best:.1f}ms (budget {budget_ms:.0f}ms)")
+    return True
 
 def main():
     """Main verification function."""
@@ -45,35 +110,46 @@ def main():
     
     print("\n📦 Package Verification:")
     
-    # Core packages to verify
+    # Core packages to verify: (import name, distribution)
     core_packages = [
-        'azure.core',
-        'azure.identity',
-        'pyodbc',
-        'sqlalchemy',
-        'pandas',
-        'numpy',
-        'jupyter',
-        'matplotlib'
+        ('azure.core', 'azure-core'),
+        ('azure.identity', 'azure-identity'),
+        ('pyodbc', 'pyodbc'),
+        ('sqlalchemy', 'SQLAlchemy'),
+        ('pandas', 'pandas'),
+        ('numpy', 'numpy'),
+        ('jupyter', 'jupyter'),
+        ('matplotlib', 'matplotlib')
     ]
     
     # Optional packages to verify
     optional_packages = [
-        'azure.mgmt.sql',
-        'azure.mgmt.synapse', 
-        'pytest',
-        'black',
-        'plotly',
-        'requests'
+        ('azure.mgmt.sql', 'azure-mgmt-sql'),
+        ('azure.mgmt.synapse', 'azure-mgmt-synapse'),
+        ('pytest', 'pytest'),
+        ('black', 'black'),
+        ('plotly', 'plotly'),
+        ('requests', 'requests')
     ]
     
+    # --refresh ignores cached results; --no-import-tests only reads metadata
+    inventory = load_inventory(refresh='--refresh' in sys.argv[1:])
+    source = "cached" if inventory.from_cache else "scanned"
+    print(f"  {len(inventory.distributions)} installed distributions ({source}, "
+          f"environment {inventory.fingerprint[:12]})")
+    
+    smoke_tests = None
+    if '--no-import-tests' not in sys.argv[1:]:
+        installed = [module for module, distribution in core_packages + optional_packages
+                     if inventory.version(distribution) is not None]
+        smoke_tests = inventory.smoke_test_imports(installed)
+    
     failed_core = []
     failed_optional = []
     
     # Check core packages
     print("\nCore Packages:")
-    for package in core_packages:
-        success, info = check_package(package)
+    for package, (success, info) in check_packages(inventory, core_packages, smoke_tests).items():
         if success:
             print(f"  ✅ {package} ({info})")
         else:
@@ -82,14 +158,17 @@ def main():
     
     # Check optional packages
     print("\nOptional Packages:")
-    for package in optional_packages:
-        success, info = check_package(package)
+    for package, (success, info) in check_packages(inventory, optional_packages, smoke_tests).items():
         if success:
             print(f"  ✅ {package} ({info})")
         else:
-            print(f"  ⚠️ {package} - Not installed")
+            print(f"  ⚠️ {package} - {info}")
             failed_optional.append(package)
     
+    # Startup budget for the connector module
+    print("\nStartup Budget:")
+    startup_ok = check_connector_import_time()
+    
     # Summary
     print("\n" + "=" * 60)
     print("📊 Verification Summary:")
@@ -100,6 +179,9 @@ def main():
         print(f"❌ Missing core packages: {', '.join(failed_core)}")
         print("Run: pip install -r requirements.txt")
     
+    if not startup_ok:
+        print("❌ cxmidl_connector exceeds its import-time budget (keep heavy imports lazy)")
+    
     if failed_optional:
         print(f"⚠️ Missing optional packages: {', '.join(failed_optional)}")
         print("Run: pip install -r requirements-dev.txt")
@@ -110,7 +192,7 @@ def main():
     print("  Azure CLI Login: az login")
     
     # Exit with appropriate code
-    sys.exit(1 if failed_core else 0)
+    sys.exit(1 if failed_core or not startup_ok else 0)
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,47 @@
+"""
+Shared pytest setup: the connector modules live in scripts/ and import each
+other as top-level modules, so that directory goes on sys.path.
+"""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+if str(SCRIPTS_DIR) not in sys.path:
+    sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture
+def sqlite_db(tmp_path):
+    """Path of an empty SQLite database file standing in for Orchestration."""
+    return tmp_path / "orchestration.db"
+
+
+@pytest.fixture
+def connector_factory(sqlite_db):
+    """Build SQLite-backed connectors and dispose their pools afterwards."""
+    from cxmidl_connector import CXMIDLOrchestrationConnector, dispose_connection_pools
+
+    created = []
+
+    def _create(**options):
+        options.setdefault("url", f"sqlite:///{sqlite_db}")
+        connector = CXMIDLOrchestrationConnector(**options)
+        created.append(connector)
+        return connector
+
+    yield _create
+    for connector in created:
+        connector.close()
+    dispose_connection_pools()
+
+
+def create_table(path, ddl, rows=(), insert=None):
+    """Create a table in the SQLite file and load ``rows``."""
+    with sqlite3.connect(path) as db:
+        db.execute(ddl)
+        if rows:
+            db.executemany(insert, rows)
@@ -0,0 +1,42 @@
+"""Tests for AsyncCXMIDLOrchestrationConnector queries and its factory."""
+
+import asyncio
+import json
+import sqlite3
+import subprocess
+import sys
+from pathlib import Path
+
+from conftest import create_table
+from cxmidl_async import create_async_cxmidl_connector
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+
+def test_import_loads_neither_pandas_nor_pyarrow():
+    probe = "import json, sys, cxmidl_async; print(json.dumps([m for m in ('pandas', 'pyarrow') if m in sys.modules]))"
+    result = subprocess.run([sys.executable, "-c", probe], cwd=SCRIPTS_DIR,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert json.loads(result.stdout.strip().splitlines()[-1]) == []
+
+
+def test_factory_passes_options_and_queries_use_the_result_cache(sqlite_db, tmp_path):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(1, "load"), (2, "export")], "INSERT INTO jobs VALUES (?, ?)")
+    query = "SELECT id, name FROM jobs ORDER BY id"
+
+    async def scenario():
+        async with create_async_cxmidl_connector(url=f"sqlite:///{sqlite_db}", result_cache=True,
+                                                 cache_path=tmp_path / "results.db", max_workers=2) as connector:
+            assert connector.max_workers == 2
+            first = await connector.execute_query(query, return_dataframe=False, cache_ttl=60, retry=False)
+            with sqlite3.connect(sqlite_db) as db:
+                db.execute("INSERT INTO jobs VALUES (3, 'sync')")
+            cached = await connector.execute_query(query, return_dataframe=False, cache_ttl=60)
+            fresh = await connector.execute_query(query, return_dataframe=False)
+            return first, cached, fresh
+
+    first, cached, fresh = asyncio.run(scenario())
+    assert cached == first
+    assert [row["id"] for row in fresh] == [1, 2, 3]
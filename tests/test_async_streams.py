@@ -0,0 +1,60 @@
+"""Tests for closing and cancelling AsyncCXMIDLOrchestrationConnector streams."""
+
+import asyncio
+import threading
+import time
+
+import pytest
+
+from conftest import create_table
+from cxmidl_async import AsyncCXMIDLOrchestrationConnector
+
+
+def test_cancel_during_next_closes_the_iterator(connector_factory):
+    started = threading.Event()
+    closed = []
+
+    def slow():
+        try:
+            yield 1
+            started.set()
+            time.sleep(0.3)
+            yield 2
+        finally:
+            closed.append(True)
+
+    async def scenario():
+        async_connector = AsyncCXMIDLOrchestrationConnector(connector=connector_factory())
+        stream = async_connector._iterate(slow())
+
+        async def consume():
+            async for _ in stream:
+                pass
+
+        task = asyncio.ensure_future(consume())
+        await asyncio.get_running_loop().run_in_executor(None, started.wait)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await async_connector.close()
+
+    asyncio.run(scenario())
+    assert closed == [True]
+
+
+def test_aclose_after_break_returns_the_connection(sqlite_db, connector_factory):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(i, f"job-{i}") for i in range(50)], "INSERT INTO jobs VALUES (?, ?)")
+    connector = connector_factory(pool_size=2, max_overflow=0)
+
+    async def scenario():
+        async_connector = AsyncCXMIDLOrchestrationConnector(connector=connector)
+        stream = async_connector.stream_arrow_batches("SELECT id, name FROM jobs", batch_size=10)
+        async for _ in stream:
+            break
+        assert connector.pool_statistics()["checked_out"] == 1
+        await stream.aclose()
+        assert connector.pool_statistics()["checked_out"] == 0
+        await async_connector.close()
+
+    asyncio.run(scenario())
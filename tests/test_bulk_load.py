@@ -0,0 +1,76 @@
+"""Tests for bulk_insert/bulk_upsert against a SQLite backend."""
+
+import sqlite3
+
+import pyarrow as pa
+import pytest
+
+from conftest import create_table
+
+
+@pytest.fixture
+def jobs(sqlite_db, connector_factory):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT NOT NULL)",
+                 [(1, "load"), (2, "export")], "INSERT INTO jobs VALUES (?, ?)")
+    # One pooled connection, so temp staging tables are visible to later queries
+    connector = connector_factory(pool_size=1, max_overflow=0)
+    assert connector.connect()
+    return connector
+
+
+def _rows(sqlite_db):
+    with sqlite3.connect(sqlite_db) as db:
+        return db.execute("SELECT id, name FROM jobs ORDER BY id").fetchall()
+
+
+def _stages(connector):
+    return connector.execute_query(
+        "SELECT name FROM sqlite_temp_master WHERE type = 'table'", return_dataframe=False
+    )
+
+
+def test_bulk_insert_loads_in_batches(jobs, sqlite_db):
+    data = pa.table({"id": list(range(3, 13)), "name": [f"job-{i}" for i in range(3, 13)]})
+
+    summary = jobs.bulk_insert("jobs", data, batch_size=4)
+
+    assert summary["status"] == "completed"
+    assert (summary["rows"], summary["batches"]) == (10, 3)
+    assert len(_rows(sqlite_db)) == 12
+
+
+def test_bulk_upsert_updates_and_inserts_by_key(jobs, sqlite_db):
+    data = pa.table({"id": [2, 3, 4], "name": ["export-v2", "sync", "reconcile"]})
+
+    summary = jobs.bulk_upsert("jobs", data, key_columns=["id"], batch_size=2)
+
+    assert summary["operation"] == "upsert"
+    assert _rows(sqlite_db) == [(1, "load"), (2, "export-v2"), (3, "sync"), (4, "reconcile")]
+    assert _stages(jobs) == []
+
+
+def test_failed_batch_rolls_back_and_drops_the_stage(jobs, sqlite_db):
+    data = pa.table({"id": [3, 4, 5, 6], "name": ["a", "b", None, "d"]})
+
+    with pytest.raises(sqlite3.IntegrityError):
+        jobs.bulk_upsert("jobs", data, key_columns=["id"], batch_size=2)
+
+    # The first batch committed on its own; the failing one left nothing behind
+    assert [row[0] for row in _rows(sqlite_db)] == [1, 2, 3, 4]
+    assert _stages(jobs) == []
+
+
+def test_bulk_load_joins_a_pinned_transaction(jobs, sqlite_db):
+    with pytest.raises(RuntimeError):
+        with jobs.transaction() as tx:
+            tx.bulk_insert("jobs", pa.table({"id": [3, 4], "name": ["a", "b"]}), batch_size=1)
+            tx.bulk_upsert("jobs", pa.table({"id": [1], "name": ["load-v2"]}), key_columns=["id"])
+            assert len(tx.execute_query("SELECT id FROM jobs", return_dataframe=False)) == 4
+            raise RuntimeError("consumer failed")
+
+    assert _rows(sqlite_db) == [(1, "load"), (2, "export")]
+
+    with jobs.transaction() as tx:
+        tx.bulk_upsert("jobs", pa.table({"id": [2, 3], "name": ["export-v2", "sync"]}), key_columns=["id"])
+    assert _rows(sqlite_db) == [(1, "load"), (2, "export-v2"), (3, "sync")]
+    assert jobs.pool_statistics()["checked_out"] == 0
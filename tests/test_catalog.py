@@ -0,0 +1,77 @@
+"""Catalog snapshot refresh against a scripted SQL Server catalog."""
+
+from datetime import datetime
+
+from cxmidl_dialects import get_dialect_adapter
+
+import cxmidl_catalog
+from cxmidl_catalog import CatalogSnapshot
+
+
+class FakeCatalogConnector:
+    """Answers the catalog queries from in-memory sys.* rows."""
+
+    backend = get_dialect_adapter("mssql")
+    server = "fake"
+    database = "Orchestration"
+    integration_id = "test"
+
+    def __init__(self, count):
+        self.modified = {object_id: datetime(2024, 1, 1) for object_id in range(1, count + 1)}
+
+    def execute_query(self, query, params=None, return_dataframe=True):
+        return [
+            {"object_id": object_id, "schema_name": "dbo", "name": f"p{object_id}", "type": "P",
+             "type_desc": "SQL_STORED_PROCEDURE", "parent_object_id": 0,
+             "create_date": datetime(2024, 1, 1), "modify_date": modified}
+            for object_id, modified in self.modified.items()
+        ]
+
+    def execute_many(self, batch, return_dataframe=True):
+        results = []
+        for query, _ in batch:
+            if "sys.sql_expression_dependencies" in query:
+                rows = [{"referencing_id": object_id, "referenced_id": 1000 + object_id,
+                         "referenced_schema": "dbo", "referenced_entity": f"t{object_id}",
+                         "referenced_database": None, "is_ambiguous": False}
+                        for object_id in self.modified]
+            elif "sys.sql_modules" in query:
+                rows = [{"object_id": object_id, "definition": f"CREATE PROCEDURE p{object_id}"}
+                        for object_id in self.modified]
+            else:
+                rows = []
+            results.append({"success": True, "result": rows, "error": None})
+        return results
+
+
+def test_partial_refresh_above_threshold_does_not_duplicate_dependencies(monkeypatch):
+    monkeypatch.setattr(cxmidl_catalog, "FULL_REFRESH_THRESHOLD", 2)
+    connector = FakeCatalogConnector(10)
+    snapshot = CatalogSnapshot()
+    snapshot.refresh(connector)
+    assert snapshot.statistics()["dependencies"] == 10
+
+    for object_id in (3, 5, 7):
+        connector.modified[object_id] = datetime(2024, 2, 1)
+    summary = snapshot.refresh(connector)
+
+    assert summary["changed"] == 3
+    assert snapshot.statistics()["dependencies"] == 10
+    assert len(snapshot.get_dependencies("p5")) == 1
+    snapshot.close()
+
+
+def test_reopening_deduplicates_existing_dependency_rows(tmp_path):
+    path = tmp_path / "catalog.db"
+    snapshot = CatalogSnapshot(path)
+    snapshot.refresh(FakeCatalogConnector(3))
+    snapshot.close()
+
+    import sqlite3
+    with sqlite3.connect(path) as db:
+        db.execute("DROP INDEX ux_dependencies")
+        db.execute("INSERT INTO dependencies SELECT * FROM dependencies")
+
+    snapshot = CatalogSnapshot(path)
+    assert snapshot.statistics()["dependencies"] == 3
+    snapshot.close()
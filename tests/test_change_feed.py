@@ -0,0 +1,83 @@
+"""Change Tracking feed against a scripted SQL Server connector."""
+
+from contextlib import contextmanager
+
+import pyarrow as pa
+
+from cxmidl_change_feed import ChangeFeed
+from cxmidl_dialects import get_dialect_adapter
+
+
+class FakeChangeTrackingConnector:
+    """Answers the Change Tracking queries and records which transaction ran them."""
+
+    backend = get_dialect_adapter("mssql")
+    server = "fake"
+    database = "Orchestration"
+    integration_id = "test"
+
+    def __init__(self, current, min_valid, rows):
+        self.current = current
+        self.min_valid = min_valid
+        self.rows = rows
+        self.transactions = []
+        self.calls = []
+        self._active = None
+
+    @contextmanager
+    def transaction(self, isolation_level=None):
+        self._active = isolation_level
+        self.transactions.append(isolation_level)
+        try:
+            yield self
+        finally:
+            self._active = None
+
+    def execute_query(self, query, params=None, return_dataframe=True):
+        self.calls.append(("query", query, self._active))
+        if "CHANGE_TRACKING_CURRENT_VERSION" in query:
+            return [{"CurrentVersion": self.current, "MinValidVersion": self.min_valid}]
+        if "PRIMARY KEY" in query:
+            return [{"ColumnName": "id", "DataType": "int"}]
+        return [{"TableName": "jobs", "ColumnName": "id"}, {"TableName": "jobs", "ColumnName": "status"}]
+
+    def execute_query_arrow_batches(self, query, params=None, batch_size=10000):
+        self.calls.append(("changes", query, self._active))
+        operation = "U" if "CHANGETABLE" in query else "R"
+        yield pa.RecordBatch.from_pydict({
+            "_change_version": pa.array([params["to_version"]] * len(self.rows), pa.int64()),
+            "_change_operation": [operation] * len(self.rows),
+            "id": [row[0] for row in self.rows],
+            "status": [row[1] for row in self.rows]
+        })
+
+
+def test_bounds_and_changes_are_read_in_one_snapshot(tmp_path):
+    connector = FakeChangeTrackingConnector(current=12, min_valid=5, rows=[(1, "done")])
+    feed = ChangeFeed(connector, ["jobs"], tmp_path)
+    feed.state_store.set("dbo.jobs", {"mode": "change_tracking", "version": 10})
+
+    batches = list(feed.poll())
+
+    assert connector.transactions == ["SNAPSHOT"]
+    assert all(active == "SNAPSHOT" for _, _, active in connector.calls)
+    assert [batch.column("_change_operation").to_pylist() for batch in batches] == [["update"]]
+    assert batches[0].schema.metadata[b"cxmidl.resync"] == b"false"
+    assert feed.state_store.get("dbo.jobs")["version"] == 12
+
+
+def test_expired_version_forces_a_full_resync(tmp_path):
+    connector = FakeChangeTrackingConnector(current=40, min_valid=30, rows=[(1, "done"), (2, "queued")])
+    feed = ChangeFeed(connector, ["jobs"], tmp_path)
+    feed.state_store.set("dbo.jobs", {"mode": "change_tracking", "version": 10})
+
+    batches = list(feed.poll())
+
+    assert feed.errors == {}
+    assert not any("CHANGETABLE" in query for kind, query, _ in connector.calls if kind == "changes")
+    assert len(batches) == 1
+    assert batches[0].column("_change_operation").to_pylist() == ["resync", "resync"]
+    assert batches[0].schema.metadata[b"cxmidl.resync"] == b"true"
+    state = feed.state_store.get("dbo.jobs")
+    assert state["version"] == 40
+    assert "last_resync" in state
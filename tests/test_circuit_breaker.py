@@ -0,0 +1,60 @@
+"""Half-open circuit breaker trials are always released."""
+
+import time
+
+import pytest
+
+from conftest import create_table
+
+
+@pytest.fixture
+def half_open(connector_factory, sqlite_db):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(i, f"job{i}") for i in range(1, 51)], "INSERT INTO jobs VALUES (?, ?)")
+    connector = connector_factory(circuit_breaker_reset=30.0)
+    assert connector.connect()
+    breaker = connector._circuit_breaker
+
+    def _trip():
+        with breaker._lock:
+            breaker._failures = breaker.failure_threshold
+            breaker._opened_at = time.monotonic() - breaker.reset_timeout - 1
+            breaker._trial_in_flight = False
+
+    yield connector, breaker, _trip
+    breaker.record_success()
+
+
+def test_stream_closed_early_releases_trial(half_open):
+    connector, breaker, trip = half_open
+    trip()
+    stream = connector.execute_query_stream("SELECT * FROM jobs", chunk_size=10)
+    next(stream)
+    stream.close()
+
+    assert breaker.state == "closed"
+    assert connector.execute_query("SELECT 1 AS one", return_dataframe=False) == [{"one": 1}]
+
+
+def test_base_exception_during_call_counts_as_failure(half_open):
+    connector, breaker, trip = half_open
+    trip()
+
+    def _interrupted():
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        connector._with_retries(_interrupted, "query")
+    assert breaker.statistics()["state"] == "open"
+    assert not breaker._trial_in_flight
+
+
+def test_base_exception_during_stream_counts_as_failure(half_open):
+    connector, breaker, trip = half_open
+    trip()
+    stream = connector.execute_query_stream("SELECT * FROM jobs", chunk_size=10)
+    next(stream)
+    with pytest.raises(KeyboardInterrupt):
+        stream.throw(KeyboardInterrupt)
+    assert breaker.statistics()["state"] == "open"
+    assert not breaker._trial_in_flight
@@ -0,0 +1,89 @@
+"""Tests for compact_dtypes DataFrames built by _ColumnarFrameBuilder."""
+
+from datetime import datetime
+from decimal import Decimal
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from conftest import create_table
+from cxmidl_connector import _ColumnarFrameBuilder
+
+QUERY = "SELECT * FROM jobs ORDER BY id"
+
+
+@pytest.fixture
+def jobs(sqlite_db):
+    statuses = ["Succeeded", "Failed", "Running"]
+    create_table(
+        sqlite_db,
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY, retries INTEGER, rows_processed INTEGER, "
+        "status TEXT, note TEXT, duration REAL, error TEXT)",
+        [(i, None if i % 7 == 0 else i % 4, i * 100_000, statuses[i % 3], f"run {i}",
+          None if i % 5 == 0 else i / 8, None) for i in range(1, 41)],
+        "INSERT INTO jobs VALUES (?, ?, ?, ?, ?, ?, ?)"
+    )
+
+
+def _plain(frame):
+    """Frame values as Python objects with every missing value as None."""
+    return frame.astype(object).where(frame.notna(), None).values.tolist()
+
+
+def test_compact_dtypes(jobs, connector_factory):
+    frame = connector_factory().execute_query(QUERY, compact_dtypes=True)
+
+    assert frame["id"].dtype == pd.Int8Dtype()
+    assert frame["retries"].dtype == pd.Int8Dtype()
+    assert frame["retries"].isna().sum() == 5
+    assert frame["rows_processed"].dtype == pd.Int32Dtype()
+    assert isinstance(frame["status"].dtype, pd.CategoricalDtype)
+    assert list(frame["status"].cat.categories) == ["Failed", "Running", "Succeeded"]
+    assert not isinstance(frame["note"].dtype, pd.CategoricalDtype)
+    assert frame["duration"].dtype == np.float64
+    assert frame["error"].dtype == object
+    assert frame["error"].isna().all()
+
+
+def test_compact_frame_matches_default_output(jobs, connector_factory):
+    connector = connector_factory()
+    default = connector.execute_query(QUERY)
+    compact = connector.execute_query(QUERY, compact_dtypes=True)
+
+    assert list(compact.columns) == list(default.columns)
+    assert _plain(compact) == _plain(default)
+    assert compact.memory_usage(deep=True).sum() < default.memory_usage(deep=True).sum()
+
+
+def test_empty_result(jobs, connector_factory):
+    frame = connector_factory().execute_query("SELECT * FROM jobs WHERE id < 0", compact_dtypes=True)
+
+    assert frame.empty
+    assert list(frame.columns) == ["id", "retries", "rows_processed", "status", "note", "duration", "error"]
+
+
+def test_typed_description_and_batches():
+    description = [("id", int), ("ok", bool), ("amount", Decimal), ("started", datetime), ("label", str),
+                   ("late", None), ("mixed", None)]
+    builder = _ColumnarFrameBuilder([column for column, _ in description], description, capacity=2)
+    builder.append([(1, True, Decimal("1.5"), datetime(2025, 8, 7, 12), "a", None, 1),
+                    (2, None, None, None, None, None, 2)])
+    builder.append([(None, False, Decimal("2"), datetime(2025, 8, 7, 13), "a", 70_000, "three")])
+
+    frame = builder.build()
+
+    assert frame["id"].dtype == pd.Int8Dtype()
+    assert frame["ok"].dtype == pd.BooleanDtype()
+    assert frame["amount"].dtype == np.float64
+    assert frame["started"].dtype == "datetime64[us]"
+    assert isinstance(frame["label"].dtype, pd.CategoricalDtype)
+    # A column that is NULL in early batches gets its leading nulls back-filled
+    assert frame["late"].dtype == pd.Int32Dtype()
+    # Values that do not fit the inferred kind demote the column to objects
+    assert frame["mixed"].dtype == object
+    assert _plain(frame) == [
+        [1, True, 1.5, pd.Timestamp("2025-08-07 12:00"), "a", None, 1],
+        [2, None, None, None, None, None, 2],
+        [None, False, 2.0, pd.Timestamp("2025-08-07 13:00"), "a", 70_000, "three"]
+    ]
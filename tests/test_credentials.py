@@ -0,0 +1,96 @@
+"""Tests for access token caching and credential-aware connection pools."""
+
+import struct
+import time
+from collections import namedtuple
+
+import pytest
+
+import cxmidl_connector
+from cxmidl_connector import CXMIDLOrchestrationConnector, _AccessTokenCache
+from cxmidl_dialects import get_dialect_adapter
+
+AccessToken = namedtuple("AccessToken", ["token", "expires_on"])
+
+
+class FakeCredential:
+    """Stands in for an azure-identity credential."""
+
+    def __init__(self, name, lifetime=3600):
+        self.name = name
+        self.lifetime = lifetime
+        self.scopes = []
+
+    def get_token(self, scope):
+        self.scopes.append(scope)
+        return AccessToken(f"{self.name}-{len(self.scopes)}", time.time() + self.lifetime)
+
+
+@pytest.fixture(autouse=True)
+def _no_token_timers(monkeypatch):
+    """Keep token caches from arming background refresh timers."""
+    monkeypatch.setattr(_AccessTokenCache, "_schedule_refresh", lambda self: None)
+
+
+def test_token_cache_reuses_token_until_refresh_margin():
+    credential = FakeCredential("svc")
+    cache = _AccessTokenCache(lambda: credential, refresh_margin=300, background_refresh=False)
+
+    assert cache.get_token() == "svc-1"
+    assert cache.get_token() == "svc-1"
+    assert cache.acquisitions == 1
+    assert credential.scopes == [cxmidl_connector.AZURE_SQL_TOKEN_SCOPE]
+
+    cache._expires_on = time.time() + 60
+    assert cache.get_token() == "svc-2"
+
+
+def test_token_struct_is_length_prefixed_utf16():
+    cache = _AccessTokenCache(lambda: FakeCredential("svc"), background_refresh=False)
+    packed = cache.token_struct()
+    (length,) = struct.unpack("<I", packed[:4])
+    assert packed[4:].decode("utf-16-le") == "svc-1"
+    assert length == len(packed) - 4
+
+
+def test_connector_uses_given_credential():
+    credential = FakeCredential("svc")
+    connector = CXMIDLOrchestrationConnector(credential=credential)
+    assert connector._token_cache.get_token() == "svc-1"
+    assert connector._get_credential() is credential
+
+
+def test_pool_key_includes_credential_identity():
+    first, second = FakeCredential("a"), FakeCredential("b")
+    default = CXMIDLOrchestrationConnector()
+
+    assert (CXMIDLOrchestrationConnector(credential=first).pool_key
+            == CXMIDLOrchestrationConnector(credential=first).pool_key)
+    assert (CXMIDLOrchestrationConnector(credential=first).pool_key
+            != CXMIDLOrchestrationConnector(credential=second).pool_key)
+    assert CXMIDLOrchestrationConnector(credential=first).pool_key != default.pool_key
+
+
+def test_different_credentials_get_separate_pools(monkeypatch, sqlite_db):
+    # Serve the "Azure" pools from SQLite and record which token cache each pool injects
+    monkeypatch.setattr(CXMIDLOrchestrationConnector, "sqlalchemy_url",
+                        property(lambda self: f"sqlite:///{sqlite_db}"))
+    injected = {}
+    monkeypatch.setattr(CXMIDLOrchestrationConnector, "_register_token_provider",
+                        lambda self, engine: injected.__setitem__(id(engine), self._token_cache))
+
+    connectors = []
+    for credential in (FakeCredential("a"), FakeCredential("b")):
+        connector = CXMIDLOrchestrationConnector(credential=credential)
+        connector.backend = get_dialect_adapter("sqlite")
+        assert connector.connect()
+        connectors.append(connector)
+    try:
+        first, second = (connector._sqlalchemy_engine for connector in connectors)
+        assert first is not second
+        assert injected[id(first)] is connectors[0]._token_cache
+        assert injected[id(second)] is connectors[1]._token_cache
+    finally:
+        for connector in connectors:
+            connector.close()
+        cxmidl_connector.dispose_connection_pools()
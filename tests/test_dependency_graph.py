@@ -0,0 +1,61 @@
+"""Cycles, closures, migration waves and impact sets of the dependency graph."""
+
+import pytest
+
+from cxmidl_dependency_graph import DependencyGraph
+
+OBJECTS = [
+    (1, "jobs", "U"), (2, "runs", "U"), (3, "v_jobs", "V"), (4, "load", "P"),
+    (5, "report", "P"), (6, "a", "P"), (7, "b", "P"), (8, "retry", "P")
+]
+EDGES = [
+    (3, 1), (4, 1), (5, 3), (5, 2),
+    (6, 7), (7, 6), (6, 5),
+    (8, 8), (8, 2),
+    # Reference to an object outside the graph
+    (4, 99)
+]
+
+
+@pytest.fixture
+def graph():
+    nodes = [{"object_id": object_id, "schema_name": "dbo", "name": name, "type": object_type}
+             for object_id, name, object_type in OBJECTS]
+    return DependencyGraph(nodes, EDGES)
+
+
+def test_cycles_and_self_references_form_components(graph):
+    assert graph.cycles() == [["dbo.a", "dbo.b"], ["dbo.retry"]]
+    assert graph.component_count == len(OBJECTS) - 1
+    assert graph.statistics()["edges"] == len(EDGES) - 1
+
+
+def test_transitive_closures(graph):
+    assert graph.dependencies("a") == ["dbo.b", "dbo.jobs", "dbo.report", "dbo.runs", "dbo.v_jobs"]
+    assert graph.dependencies("dbo.report", transitive=False) == ["dbo.runs", "dbo.v_jobs"]
+    assert graph.impact_set("[dbo].[runs]") == ["dbo.a", "dbo.b", "dbo.report", "dbo.retry"]
+    assert graph.impact_set("runs", transitive=False) == ["dbo.report", "dbo.retry"]
+    assert graph.impact_set("jobs", types=("V",)) == ["dbo.v_jobs"]
+    with pytest.raises(KeyError):
+        graph.node("missing")
+
+
+def test_migration_waves_order_dependencies_first(graph):
+    assert graph.migration_waves() == [["dbo.load", "dbo.retry"], ["dbo.report"], ["dbo.a", "dbo.b"]]
+    assert graph.migration_waves(types=None) == [
+        ["dbo.jobs", "dbo.runs"], ["dbo.load", "dbo.retry", "dbo.v_jobs"], ["dbo.report"], ["dbo.a", "dbo.b"]
+    ]
+
+
+def test_impact_waves_use_migration_wave_numbers(graph):
+    impact = graph.impact_analysis(["dbo.jobs"], types=("P",))
+
+    assert impact["impacted"] == ["dbo.a", "dbo.b", "dbo.load", "dbo.report"]
+    assert impact["impact"]["dbo.jobs"] == impact["impacted"]
+    waves = graph.migration_waves(types=("P",))
+    assert impact["waves"] == [0, 1, 2]
+    assert {name for wave in impact["waves"] for name in waves[wave]} >= set(impact["impacted"])
+
+    views = graph.impact_analysis(["jobs"], types=("V",))
+    assert views["waves"] == [0]
+    assert graph.migration_waves(types=("V",))[0] == ["dbo.v_jobs"]
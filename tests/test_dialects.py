@@ -0,0 +1,179 @@
+"""
+Dialect adapters driven through connectors built on an injected engine.
+
+SQLite runs its own adapter. The ANSI adapter runs against the same SQLite
+file with an INFORMATION_SCHEMA database attached (filled from the SQLite
+catalog) and the file attached again as ``public``, its default schema.
+"""
+
+import re
+import sqlite3
+
+import pyarrow as pa
+import pytest
+import sqlalchemy as sa
+
+from conftest import create_table
+from cxmidl_dependency_graph import DependencyGraph
+from cxmidl_dialects import DialectAdapter, get_dialect_adapter, require_sql_server, table_arrow_schema
+from cxmidl_export import _primary_key_columns
+from cxmidl_sp_analyzer import analyze_procedures
+from cxmidl_sync import detect_watermark_kind
+
+INFORMATION_SCHEMA_DDL = """
+CREATE TABLE SCHEMATA (CATALOG_NAME TEXT, SCHEMA_NAME TEXT);
+CREATE TABLE TABLES (TABLE_SCHEMA TEXT, TABLE_NAME TEXT, TABLE_TYPE TEXT);
+CREATE TABLE VIEWS (TABLE_SCHEMA TEXT, TABLE_NAME TEXT);
+CREATE TABLE COLUMNS (TABLE_SCHEMA TEXT, TABLE_NAME TEXT, COLUMN_NAME TEXT, ORDINAL_POSITION INTEGER,
+                      DATA_TYPE TEXT, IS_NULLABLE TEXT, NUMERIC_PRECISION INTEGER, NUMERIC_SCALE INTEGER);
+CREATE TABLE TABLE_CONSTRAINTS (CONSTRAINT_NAME TEXT, TABLE_SCHEMA TEXT, TABLE_NAME TEXT, CONSTRAINT_TYPE TEXT);
+CREATE TABLE KEY_COLUMN_USAGE (CONSTRAINT_NAME TEXT, TABLE_SCHEMA TEXT, TABLE_NAME TEXT, COLUMN_NAME TEXT,
+                               ORDINAL_POSITION INTEGER);
+"""
+
+
+@pytest.fixture
+def orchestration(sqlite_db):
+    create_table(
+        sqlite_db,
+        "CREATE TABLE workflow_runs (run_id INTEGER NOT NULL, attempt INTEGER NOT NULL, "
+        "cost NUMERIC(10,2), started_at TIMESTAMP, PRIMARY KEY (run_id, attempt))",
+        [(1, 1, 2.5, "2025-08-07 12:00:00")], "INSERT INTO workflow_runs VALUES (?, ?, ?, ?)"
+    )
+    create_table(sqlite_db, "CREATE TABLE settings (name TEXT PRIMARY KEY, value TEXT)")
+    return sqlite_db
+
+
+def _information_schema(database, path):
+    """INFORMATION_SCHEMA tables describing ``database``'s tables as schema ``public``."""
+    with sqlite3.connect(database) as source, sqlite3.connect(path) as target:
+        target.executescript(INFORMATION_SCHEMA_DDL)
+        target.execute("INSERT INTO SCHEMATA VALUES ('orchestration', 'public')")
+        tables = [row[0] for row in source.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' AND name NOT LIKE 'sqlite_%'"
+        )]
+        for table in tables:
+            target.execute("INSERT INTO TABLES VALUES ('public', ?, 'BASE TABLE')", (table,))
+            keys = []
+            for cid, name, declared, notnull, _, pk in source.execute(f"PRAGMA table_info({table})"):
+                match = re.match(r"(\w+)(?:\((\d+),\s*(\d+)\))?", declared)
+                precision, scale = (int(match[2]), int(match[3])) if match[2] else (None, None)
+                target.execute(
+                    "INSERT INTO COLUMNS VALUES ('public', ?, ?, ?, ?, ?, ?, ?)",
+                    (table, name, cid + 1, match[1].lower(), "NO" if notnull or pk else "YES", precision, scale)
+                )
+                if pk:
+                    keys.append((pk, name))
+            target.execute("INSERT INTO TABLE_CONSTRAINTS VALUES (?, 'public', ?, 'PRIMARY KEY')",
+                           (f"pk_{table}", table))
+            for position, name in sorted(keys):
+                target.execute("INSERT INTO KEY_COLUMN_USAGE VALUES (?, 'public', ?, ?, ?)",
+                               (f"pk_{table}", table, name, position))
+
+
+@pytest.fixture(params=["sqlite", "ansi"])
+def connector(request, orchestration, tmp_path, connector_factory):
+    engine = sa.create_engine(f"sqlite:///{orchestration}")
+    if request.param == "ansi":
+        _information_schema(orchestration, tmp_path / "information_schema.db")
+
+        @sa.event.listens_for(engine, "connect")
+        def _attach(dbapi_connection, _):
+            dbapi_connection.execute("ATTACH DATABASE ? AS information_schema",
+                                     (str(tmp_path / "information_schema.db"),))
+            dbapi_connection.execute("ATTACH DATABASE ? AS public", (str(orchestration),))
+
+    connector = connector_factory(engine=engine)
+    if request.param == "ansi":
+        # Adapters are picked by backend name; this engine speaks SQLite
+        connector.backend = DialectAdapter()
+    assert connector.connect()
+    yield connector
+    connector.close()
+    engine.dispose()
+
+
+def test_backend_is_chosen_from_the_injected_engine(orchestration, connector_factory):
+    engine = sa.create_engine(f"sqlite:///{orchestration}")
+    connector = connector_factory(engine=engine, url="mssql+pyodbc://ignored/db")
+
+    assert connector.backend.name == "sqlite"
+    assert connector.server == "sqlite"
+    assert get_dialect_adapter("postgresql").name == "ansi"
+    assert get_dialect_adapter("oracle").name == "ansi"
+    engine.dispose()
+
+
+def test_schema_name_and_qualify(connector):
+    backend = connector.backend
+    default = {"sqlite": "main", "ansi": "public"}[backend.name]
+
+    assert backend.schema_name("dbo") == backend.schema_name(None) == default
+    assert backend.schema_name("staging") == "staging"
+    assert backend.qualify("dbo", "workflow_runs") == f'"{default}"."workflow_runs"'
+    assert backend.qualify("odd", 'x"y') == '"odd"."x""y"'
+    rows = connector.execute_query(f"SELECT COUNT(*) AS n FROM {backend.qualify('dbo', 'workflow_runs')}",
+                                   return_dataframe=False)
+    assert rows == [{"n": 1}]
+
+    mssql = get_dialect_adapter("mssql")
+    assert (mssql.schema_name(None), mssql.schema_name("etl")) == ("dbo", "etl")
+    assert mssql.qualify(None, "a]b") == "[dbo].[a]]b]"
+
+
+def test_require_sql_server(connector, tmp_path):
+    with pytest.raises(NotImplementedError, match=f"Dependency graphs need .* {connector.backend.name} backend"):
+        require_sql_server(connector, "Dependency graphs")
+    with pytest.raises(NotImplementedError):
+        DependencyGraph.from_connector(connector)
+    with pytest.raises(NotImplementedError):
+        analyze_procedures(connector, tmp_path / "reports")
+
+    class SqlServer:
+        backend = get_dialect_adapter("mssql")
+
+    require_sql_server(SqlServer(), "Dependency graphs")
+
+
+def test_tables_query(connector):
+    tables = connector.get_orchestration_tables()
+
+    assert list(tables["TableName"]) == ["settings", "workflow_runs"]
+    assert list(tables["TableCategory"]) == ["Configuration", "Orchestration_Core"]
+    assert list(tables["ColumnCount"]) == [2, 4]
+    assert set(tables["TableType"]) == {"BASE TABLE"}
+    assert set(tables["SchemaName"]) == {connector.backend.schema_name("dbo")}
+
+
+def test_column_and_primary_key_queries(connector):
+    backend = connector.backend
+    params = {"schema": backend.schema_name("dbo")}
+
+    columns = connector.execute_query(backend.columns_query, params, return_dataframe=False)
+    assert [(row["TableName"], row["ColumnName"]) for row in columns][:2] == [("settings", "name"), ("settings", "value")]
+    table_columns = connector.execute_query(backend.table_columns_query, dict(params, table="workflow_runs"),
+                                            return_dataframe=False)
+    assert [row["ColumnName"] for row in table_columns] == ["run_id", "attempt", "cost", "started_at"]
+    assert {row["TableName"] for row in table_columns} == {"workflow_runs"}
+    assert [row["IsNullable"] for row in table_columns] == ["NO", "NO", "YES", "YES"]
+
+    assert [row["ColumnName"] for row in _primary_key_columns(connector, "dbo", "workflow_runs")] == ["run_id", "attempt"]
+    assert detect_watermark_kind(connector, "workflow_runs", "started_at") == "datetime"
+    assert detect_watermark_kind(connector, "workflow_runs", "run_id") == "identity"
+    with pytest.raises(ValueError):
+        detect_watermark_kind(connector, "workflow_runs", "missing")
+
+
+def test_table_arrow_schema(connector):
+    schema = table_arrow_schema(connector, "workflow_runs")
+    cost = {"sqlite": pa.float64(), "ansi": pa.decimal128(10, 2)}[connector.backend.name]
+    started = {"sqlite": pa.string(), "ansi": pa.timestamp("us")}[connector.backend.name]
+
+    assert schema == pa.schema([("run_id", pa.int64()), ("attempt", pa.int64()), ("cost", cost),
+                                ("started_at", started)])
+    assert table_arrow_schema(connector, "missing") is None
+
+
+def test_databases_and_health_queries(connector):
+    assert len(connector.get_databases()) >= 1
+    assert connector.execute_query(connector.backend.health_query, return_dataframe=False)[0]["ActiveRequests"] == 0
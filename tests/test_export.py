@@ -0,0 +1,95 @@
+"""Tests for the Parquet export pipeline against a SQLite backend."""
+
+import json
+import sqlite3
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from conftest import create_table
+from cxmidl_dialects import table_arrow_schema
+from cxmidl_export import export_table
+
+
+def _task_history(path, rows=1000):
+    create_table(
+        path,
+        "CREATE TABLE task_history (id INTEGER PRIMARY KEY, note TEXT, duration REAL)",
+        [(i, None if i < 500 else f"note-{i}", None if i < 500 else i / 10) for i in range(rows)],
+        "INSERT INTO task_history VALUES (?, ?, ?)"
+    )
+
+
+def test_null_leading_columns_keep_declared_types(sqlite_db, connector_factory, tmp_path):
+    _task_history(sqlite_db)
+    manifest = export_table(connector_factory(), "task_history", tmp_path / "out",
+                            rows_per_slice=250, batch_size=100)
+
+    assert manifest["status"] == "completed"
+    assert len(manifest["files"]) == 4
+    table_dir = tmp_path / "out" / "dbo.task_history"
+    schemas = {str(pq.read_schema(table_dir / item["file"])) for item in manifest["files"]}
+    assert len(schemas) == 1
+    exported = pq.read_table(table_dir)
+    assert exported.schema.field("note").type == pa.string()
+    assert exported.schema.field("duration").type == pa.float64()
+    assert exported.num_rows == 1000
+    assert exported.column("note").null_count == 500
+
+
+def test_reexport_replaces_previous_part_files(sqlite_db, connector_factory, tmp_path):
+    _task_history(sqlite_db)
+    connector = connector_factory()
+    export_table(connector, "task_history", tmp_path / "out", rows_per_slice=250)
+
+    with sqlite3.connect(sqlite_db) as db:
+        db.execute("DELETE FROM task_history WHERE id >= 300")
+    manifest = export_table(connector, "task_history", tmp_path / "out", rows_per_slice=250)
+
+    table_dir = tmp_path / "out" / "dbo.task_history"
+    assert manifest["status"] == "completed"
+    assert sorted(path.name for path in table_dir.glob("part-*.parquet")) == [
+        item["file"] for item in manifest["files"]
+    ]
+    assert pq.read_table(table_dir).num_rows == 300
+    assert not list((tmp_path / "out").glob(".*"))
+
+
+def test_key_column_with_nulls_falls_back_to_primary_key(sqlite_db, connector_factory, tmp_path):
+    _task_history(sqlite_db)
+    with sqlite3.connect(sqlite_db) as db:
+        db.execute("ALTER TABLE task_history ADD COLUMN batch_id INTEGER")
+        db.execute("UPDATE task_history SET batch_id = id WHERE id % 10 <> 0")
+
+    manifest = export_table(connector_factory(), "task_history", tmp_path / "out",
+                            key_column="batch_id", rows_per_slice=250)
+
+    assert manifest["status"] == "completed"
+    assert manifest["key_columns"] == ["id"]
+    assert manifest["rows"] == 1000
+    assert pq.read_table(tmp_path / "out" / "dbo.task_history").num_rows == 1000
+
+
+def test_output_manifest_lists_every_exported_table(sqlite_db, connector_factory, tmp_path):
+    _task_history(sqlite_db)
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(1, "load"), (2, "export")], "INSERT INTO jobs VALUES (?, ?)")
+    connector = connector_factory()
+    assert table_arrow_schema(connector, "jobs").names == ["id", "name"]
+
+    export_table(connector, "task_history", tmp_path / "out")
+    export_table(connector, "jobs", tmp_path / "out")
+    with sqlite3.connect(sqlite_db) as db:
+        db.execute("DROP TABLE jobs")
+    failed = export_table(connector, "jobs", tmp_path / "out")
+
+    with open(tmp_path / "out" / "_manifest.json", encoding="utf-8") as f:
+        manifest = json.load(f)
+    assert failed["status"] == "failed"
+    assert sorted(manifest["tables"]) == ["dbo.jobs", "dbo.task_history"]
+    assert manifest["tables"]["dbo.task_history"]["status"] == "completed"
+    # The failed re-export keeps the previous files and their counts
+    assert manifest["tables"]["dbo.jobs"]["status"] == "failed"
+    assert manifest["tables"]["dbo.jobs"]["rows"] == 2
+    assert manifest["rows"] == 1002
+    assert pq.read_table(tmp_path / "out" / "dbo.jobs").num_rows == 2
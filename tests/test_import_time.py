@@ -0,0 +1,28 @@
+"""Import-time budget of cxmidl_connector, measured in fresh interpreters."""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from verify_python_env import _IMPORT_PROBE, CONNECTOR_IMPORT_BUDGET_MS, HEAVY_MODULES
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "scripts"
+
+
+def _probe():
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE % (HEAVY_MODULES,)],
+        cwd=SCRIPTS_DIR, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_connector_import_loads_no_heavy_modules():
+    assert _probe()["heavy"] == []
+
+
+def test_connector_import_within_budget():
+    best = min(_probe()["ms"] for _ in range(3))
+    assert best <= CONNECTOR_IMPORT_BUDGET_MS, f"{best:.1f}ms > {CONNECTOR_IMPORT_BUDGET_MS}ms"
@@ -0,0 +1,109 @@
+"""Tests for per-query latency histograms and the Prometheus exporter."""
+
+import re
+
+import pytest
+import sqlalchemy as sa
+
+from conftest import create_table
+from cxmidl_connector import _LATENCY_BUCKETS, _query_fingerprint
+
+SAMPLE = re.compile(r'^(?P<name>[a-z_]+)\{(?P<labels>[^}]*)\} (?P<value>\S+)$')
+
+
+@pytest.fixture
+def jobs(sqlite_db):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(i, f"job-{i}") for i in range(1, 6)], "INSERT INTO jobs VALUES (?, ?)")
+
+
+def _samples(text):
+    """Parse exposition lines into ``(name, labels) -> value``."""
+    samples = {}
+    for line in text.splitlines():
+        if line.startswith("#"):
+            continue
+        match = SAMPLE.match(line)
+        assert match, f"not a Prometheus sample: {line!r}"
+        labels = tuple(sorted(re.findall(r'(\w+)="([^"]*)"', match["labels"])))
+        samples[(match["name"], labels)] = float(match["value"])
+    return samples
+
+
+def _series(samples, name, **labels):
+    return {
+        dict(key).get("le"): value for (sample, key), value in samples.items()
+        if sample == name and all(dict(key).get(k) == v for k, v in labels.items())
+    }
+
+
+def test_executions_errors_and_rows_are_counted_per_query_shape(jobs, connector_factory):
+    connector = connector_factory()
+    connector.execute_query("SELECT id FROM jobs WHERE id <= 2", return_dataframe=False)
+    connector.execute_query("SELECT id FROM jobs WHERE id <= 4", return_dataframe=False)
+    with pytest.raises(sa.exc.OperationalError):
+        connector.execute_query("SELECT id FROM missing_jobs WHERE id <= 1", return_dataframe=False)
+
+    queries = connector.metrics()["queries"]
+    shape = queries[_query_fingerprint("SELECT id FROM jobs WHERE id <= 2")]
+    failed = queries[_query_fingerprint("SELECT id FROM missing_jobs WHERE id <= 1")]
+
+    assert shape["query"] == "SELECT id FROM jobs WHERE id <= ?"
+    assert (shape["executions"], shape["errors"], shape["rows"]) == (2, 0, 6)
+    assert shape["total"]["count"] == shape["phases"]["execute"]["count"] == 2
+    assert (failed["executions"], failed["errors"], failed["rows"]) == (1, 1, 0)
+    assert failed["phases"]["fetch"]["count"] == 0
+
+
+def test_histogram_buckets_and_percentiles(connector_factory):
+    connector = connector_factory()
+    for seconds in (0.0004, 0.003, 0.003, 0.2, 45.0):
+        connector._metrics.record("SELECT 1", {"execute": seconds})
+
+    execute = connector.metrics()["queries"][_query_fingerprint("SELECT 1")]["phases"]["execute"]
+    assert execute["count"] == 5
+    assert execute["max_seconds"] == 45.0
+    assert 0.0025 < execute["p50_seconds"] <= 0.005
+    assert 30.0 < execute["p99_seconds"] <= 45.0
+
+    buckets = _series(_samples(connector.metrics_prometheus()), "cxmidl_query_phase_seconds_bucket",
+                      phase="execute")
+    assert len(buckets) == len(_LATENCY_BUCKETS)
+    assert (buckets["0.0005"], buckets["0.0025"], buckets["0.005"], buckets["0.25"]) == (1, 1, 3, 4)
+    assert (buckets["30.0"], buckets["60.0"], buckets["+Inf"]) == (4, 5, 5)
+
+
+def test_prometheus_exposition_format(jobs, connector_factory):
+    connector = connector_factory()
+    connector.execute_query("SELECT id FROM jobs", return_dataframe=False)
+    text = connector.metrics_prometheus()
+    fingerprint = _query_fingerprint("SELECT id FROM jobs")
+
+    assert text.endswith("\n")
+    assert "# TYPE cxmidl_query_phase_seconds histogram" in text
+    for counter in ("executions", "errors", "rows", "bytes"):
+        assert f"# TYPE cxmidl_query_{counter}_total counter" in text
+    samples = _samples(text)
+    base = {"server": connector.server, "database": connector.database, "fingerprint": fingerprint}
+    assert samples[("cxmidl_query_rows_total", tuple(sorted(base.items())))] == 5
+    assert samples[("cxmidl_query_errors_total", tuple(sorted(base.items())))] == 0
+
+    for phase in ("acquire", "execute", "fetch"):
+        buckets = _series(samples, "cxmidl_query_phase_seconds_bucket", fingerprint=fingerprint, phase=phase)
+        values = [buckets["+Inf" if bound == float("inf") else repr(bound)] for bound in _LATENCY_BUCKETS]
+        assert values == sorted(values)
+        count = samples[("cxmidl_query_phase_seconds_count", tuple(sorted({**base, "phase": phase}.items())))]
+        assert values[-1] == count == 1
+
+
+def test_disabled_and_reset_metrics(jobs, connector_factory):
+    disabled = connector_factory(collect_metrics=False)
+    disabled.execute_query("SELECT id FROM jobs", return_dataframe=False)
+    assert disabled.metrics()["enabled"] is False
+    assert disabled.metrics_prometheus() == ""
+
+    connector = connector_factory()
+    connector.execute_query("SELECT id FROM jobs", return_dataframe=False)
+    connector.reset_metrics()
+    assert connector.metrics()["queries"] == {}
+    assert _samples(connector.metrics_prometheus()) == {}
@@ -0,0 +1,135 @@
+"""Tests for prepare-threshold counting and the sp_prepare/sp_execute path."""
+
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy.dialects import mssql
+
+import cxmidl_connector
+
+QUERY = "SELECT id, name FROM dbo.jobs WHERE id > :low AND started >= :since AND note <> '?'"
+
+
+def _connection(dialect_name="mssql", cursor=None):
+    """Stand-in for a pooled SQLAlchemy connection of the named dialect."""
+    dialect = mssql.dialect(paramstyle="qmark") if dialect_name == "mssql" else SimpleNamespace(name=dialect_name)
+    raw = SimpleNamespace(info={}, dbapi_connection=SimpleNamespace(cursor=lambda: cursor))
+    return SimpleNamespace(dialect=dialect, connection=raw)
+
+
+class _SqlServerCursor:
+    """Scripted pyodbc cursor answering sp_prepare and sp_execute."""
+
+    def __init__(self, lose_handle_once=False):
+        self.executed = []
+        self.next_handle = 1
+        self.lose_handle_once = lose_handle_once
+        self.description = None
+        self.closed = False
+        self._result = []
+
+    def execute(self, sql, values):
+        self.executed.append((sql, list(values)))
+        if "sp_prepare" in sql:
+            self.description = [("prepared_handle",)]
+            self._result = [(self.next_handle,)]
+            self.next_handle += 1
+            return
+        if self.lose_handle_once:
+            self.lose_handle_once = False
+            raise RuntimeError("[42000] Could not find prepared statement with handle 1. (8179)")
+        self.description = [("id",), ("name",)]
+        self._result = [(values[1] + 1, "load"), (values[1] + 2, "export")]
+
+    def fetchone(self):
+        return self._result[0]
+
+    def fetchall(self):
+        return self._result
+
+    def nextset(self):
+        return False
+
+    def close(self):
+        self.closed = True
+
+
+def test_queries_are_prepared_from_the_threshold_on(connector_factory):
+    connector = connector_factory(prepare_threshold=3)
+    conn = _connection()
+
+    assert [connector._should_prepare(conn, QUERY) for _ in range(4)] == [False, False, True, True]
+    assert connector.statement_cache_statistics()["repeated_statements"] == 1
+
+
+def test_counting_is_limited_to_sql_server(connector_factory):
+    connector = connector_factory(prepare_threshold=1)
+    disabled = connector_factory()
+
+    assert not connector._should_prepare(_connection("sqlite"), QUERY)
+    assert not disabled._should_prepare(_connection(), QUERY)
+    assert connector.statement_cache_statistics()["tracked_statements"] == 0
+    assert disabled.statement_cache_statistics()["tracked_statements"] == 0
+
+
+def test_one_off_statements_are_forgotten_at_the_tracking_limit(connector_factory, monkeypatch):
+    monkeypatch.setattr(cxmidl_connector, "_MAX_TRACKED_STATEMENTS", 4)
+    connector = connector_factory(prepare_threshold=3)
+    conn = _connection()
+    for query in [QUERY, QUERY, "SELECT 1", "SELECT 2", "SELECT 3"]:
+        connector._should_prepare(conn, query)
+
+    # Tracking a fifth text drops the one-off texts but keeps the repeated one
+    assert not connector._should_prepare(conn, "SELECT 4")
+    assert connector._statement_counts == {QUERY: 2, "SELECT 4": 1}
+    assert connector._should_prepare(conn, QUERY)
+
+
+def test_prepared_handle_is_reused_per_connection(connector_factory):
+    connector = connector_factory(prepare_threshold=1)
+    cursor = _SqlServerCursor()
+    conn = _connection(cursor=cursor)
+    params = {"low": 10, "since": date(2025, 8, 7)}
+
+    first = connector._execute_prepared(conn, QUERY, params)
+    second = connector._execute_prepared(conn, QUERY, dict(params, low=20))
+
+    assert first == (["id", "name"], [(11, "load"), (12, "export")])
+    assert second[1][0] == (21, "load")
+    prepare, *executes = cursor.executed
+    assert prepare[1] == ["@P1 bigint, @P2 date",
+                          "SELECT id, name FROM dbo.jobs WHERE id > @P1 AND started >= @P2 AND note <> '?'"]
+    assert executes == [("EXEC sp_execute ?, ?, ?", [1, 10, date(2025, 8, 7)]),
+                        ("EXEC sp_execute ?, ?, ?", [1, 20, date(2025, 8, 7)])]
+    assert cursor.closed
+    stats = connector.statement_cache_statistics()
+    assert (stats["prepares"], stats["prepared_executions"], stats["reprepares"]) == (1, 2, 0)
+
+
+def test_lost_handle_is_prepared_again_once(connector_factory):
+    connector = connector_factory(prepare_threshold=1)
+    cursor = _SqlServerCursor(lose_handle_once=True)
+    conn = _connection(cursor=cursor)
+
+    columns, rows = connector._execute_prepared(conn, QUERY, {"low": 0, "since": date(2025, 8, 7)})
+
+    assert rows == [(1, "load"), (2, "export")]
+    assert [values[0] for sql, values in cursor.executed if "sp_execute" in sql] == [1, 2]
+    assert connector.statement_cache_statistics()["reprepares"] == 1
+
+
+class _FailingCursor(_SqlServerCursor):
+    def execute(self, sql, values):
+        if "sp_execute" in sql:
+            raise RuntimeError("Invalid object name 'dbo.jobs'. (208)")
+        super().execute(sql, values)
+
+
+def test_other_execute_errors_are_not_retried(connector_factory):
+    connector = connector_factory(prepare_threshold=1)
+    cursor = _FailingCursor()
+
+    with pytest.raises(RuntimeError, match="208"):
+        connector._execute_prepared(_connection(cursor=cursor), "SELECT 1", {})
+    assert cursor.closed
@@ -0,0 +1,124 @@
+"""Tests for statistics/showplan parsing and the slow-query buffer."""
+
+import json
+
+from conftest import create_table
+from cxmidl_profiler import QueryProfiler, parse_showplan, parse_statistics_messages
+
+DRIVER = "[Microsoft][ODBC Driver 18 for SQL Server][SQL Server]"
+
+STATISTICS_MESSAGES = [
+    ("[01000] (0)", DRIVER + "SQL Server parse and compile time: \n   CPU time = 16 ms, elapsed time = 21 ms."),
+    ("[01000] (3615)", DRIVER + "Table 'ExecutionLog'. Scan count 1, logical reads 1204, physical reads 3, "
+                                "page server reads 0, read-ahead reads 1180, lob logical reads 0."),
+    ("[01000] (3615)", DRIVER + "Table 'Worktable'. Scan count 0, logical reads 0, physical reads 0, "
+                                "read-ahead reads 0."),
+    ("[01000] (3612)", DRIVER + " SQL Server Execution Times:\n   CPU time = 250 ms,  elapsed time = 1312 ms."),
+    ("[01000] (3615)", DRIVER + "Table 'ExecutionLog'. Scan count 2, logical reads 6, physical reads 0, "
+                                "read-ahead reads 0."),
+    ("[01000] (3612)", DRIVER + " SQL Server Execution Times:\n   CPU time = 0 ms,  elapsed time = 2 ms.")
+]
+
+SHOWPLAN = """<?xml version="1.0" encoding="utf-16"?>
+<ShowPlanXML xmlns="http://schemas.microsoft.com/sqlserver/2004/07/showplan" Version="1.564">
+  <BatchSequence><Batch><Statements>
+    <StmtSimple StatementText="SELECT ..." StatementSubTreeCost="13">
+      <QueryPlan>
+        <RelOp NodeId="0" PhysicalOp="Sort" LogicalOp="Sort" EstimateRows="100" EstimatedTotalSubtreeCost="13">
+          <RunTimeInformation>
+            <RunTimeCountersPerThread Thread="0" ActualRows="60" />
+            <RunTimeCountersPerThread Thread="1" ActualRows="40" />
+          </RunTimeInformation>
+          <Sort Distinct="0">
+            <RelOp NodeId="1" PhysicalOp="Hash Match" LogicalOp="Inner Join" EstimateRows="100"
+                   EstimatedTotalSubtreeCost="9.5">
+              <Hash>
+                <RelOp NodeId="2" PhysicalOp="Clustered Index Scan" LogicalOp="Clustered Index Scan"
+                       EstimateRows="5000" EstimatedTotalSubtreeCost="6">
+                  <IndexScan>
+                    <Object Database="[Orchestration]" Schema="[dbo]" Table="[ExecutionLog]"
+                            Index="[PK_ExecutionLog]" />
+                  </IndexScan>
+                </RelOp>
+                <RelOp NodeId="3" PhysicalOp="Index Seek" LogicalOp="Index Seek" EstimateRows="50"
+                       EstimatedTotalSubtreeCost="0.5">
+                  <IndexScan>
+                    <Object Database="[Orchestration]" Schema="[dbo]" Table="[Workflow]" Index="[IX_Name]" />
+                  </IndexScan>
+                </RelOp>
+              </Hash>
+            </RelOp>
+          </Sort>
+        </RelOp>
+      </QueryPlan>
+    </StmtSimple>
+  </Statements></Batch></BatchSequence>
+</ShowPlanXML>"""
+
+
+def test_statistics_messages_are_totalled_per_table_and_phase():
+    stats = parse_statistics_messages(STATISTICS_MESSAGES)
+
+    assert stats["tables"]["ExecutionLog"] == {
+        "scan_count": 3, "logical_reads": 1210, "physical_reads": 3, "page_server_reads": 0,
+        "read_ahead_reads": 1180, "lob_logical_reads": 0
+    }
+    assert (stats["logical_reads"], stats["physical_reads"], stats["read_ahead_reads"], stats["scan_count"]) \
+        == (1210, 3, 1180, 3)
+    assert (stats["cpu_time_ms"], stats["elapsed_time_ms"]) == (250, 1314)
+    assert (stats["compile_cpu_ms"], stats["compile_elapsed_ms"]) == (16, 21)
+
+
+def test_no_messages_gives_zero_totals():
+    stats = parse_statistics_messages([])
+    assert stats["tables"] == {}
+    assert stats["logical_reads"] == stats["cpu_time_ms"] == 0
+
+
+def test_showplan_operators_are_ranked_by_own_cost():
+    plan = parse_showplan(SHOWPLAN, top_n=3)
+
+    assert plan["statement_cost"] == 13.0
+    assert plan["operator_count"] == 4
+    assert [(op["node_id"], op["operator_cost"]) for op in plan["top_operators"]] == [(2, 6.0), (0, 3.5), (1, 3.0)]
+    scan, sort, join = plan["top_operators"]
+    assert scan["object"] == "dbo.ExecutionLog.PK_ExecutionLog"
+    assert scan["actual_rows"] is None
+    assert join["object"] is None
+    assert (sort["physical_op"], sort["estimated_rows"], sort["actual_rows"]) == ("Sort", 100.0, 100)
+
+
+def _record(profiler, query, latency):
+    return profiler.record(query, {"id": 1}, latency, rows=1, profile={"logical_reads": 10})
+
+
+def test_record_keeps_the_slowest_entries_over_the_threshold():
+    profiler = QueryProfiler(threshold_seconds=1.0, max_entries=3)
+
+    kept = [_record(profiler, f"q{i}", latency) for i, latency in enumerate([0.5, 1.0, 3.0, 2.0, 1.5, 4.0, 1.2])]
+
+    assert kept == [False, True, True, True, True, True, False]
+    assert [(entry["query"], entry["latency_seconds"]) for entry in profiler.slow_queries()] \
+        == [("q5", 4.0), ("q2", 3.0), ("q3", 2.0)]
+    assert profiler.slow_queries()[0]["params"] == {"id": "1"}
+    assert profiler.slow_queries()[0]["logical_reads"] == 10
+    assert profiler.profiled == 7
+
+    profiler.reset()
+    assert (profiler.slow_queries(), profiler.profiled) == ([], 0)
+
+
+def test_connector_profiles_and_dumps_slow_queries(sqlite_db, connector_factory, tmp_path):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(1, "load"), (2, "export")], "INSERT INTO jobs VALUES (?, ?)")
+    connector = connector_factory()
+    connector.enable_profiling(threshold_seconds=0.0, max_entries=1)
+
+    rows = connector.execute_query("SELECT name FROM jobs WHERE id = :id", {"id": 2}, return_dataframe=False)
+
+    assert rows == [{"name": "export"}]
+    (entry,) = connector.slow_queries()
+    assert (entry["rows"], entry["params"], entry["tables"]) == (1, {"id": "2"}, {})
+    document = json.loads(connector.dump_slow_queries(tmp_path / "slow.json").read_text(encoding="utf-8"))
+    assert document["profiled_queries"] == 1
+    assert document["slow_queries"][0]["query"] == "SELECT name FROM jobs WHERE id = :id"
@@ -0,0 +1,77 @@
+"""Tests for the on-disk query result cache encoding."""
+
+import decimal
+import pickle
+import sqlite3
+import uuid
+from datetime import date, datetime, time
+
+import pandas as pd
+
+from conftest import create_table
+from cxmidl_connector import _QueryResultCache
+
+
+def test_dataframes_round_trip_through_arrow(tmp_path):
+    path = tmp_path / "cache.db"
+    frame = pd.DataFrame({
+        "JobName": ["load", "export", "load"],
+        "Status": pd.Categorical(["ok", "failed", "ok"]),
+        "Rows": [10, 20, 30]
+    })
+    _QueryResultCache(path=path).put("k", frame, ttl=60, query="SELECT 1")
+
+    cached = _QueryResultCache(path=path).get("k")
+    pd.testing.assert_frame_equal(cached, frame)
+    with sqlite3.connect(path) as db:
+        assert db.execute("SELECT encoding FROM query_results").fetchall() == [("arrow",)]
+
+
+def test_rows_round_trip_through_json(tmp_path):
+    path = tmp_path / "cache.db"
+    rows = [{
+        "id": 1,
+        "name": "job",
+        "started": datetime(2025, 8, 7, 12, 30, 1, 250),
+        "run_date": date(2025, 8, 7),
+        "at": time(9, 15),
+        "cost": decimal.Decimal("12.3400"),
+        "run_id": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+        "payload": b"\x00\x01",
+        "note": None
+    }]
+    _QueryResultCache(path=path).put("k", rows, ttl=60)
+
+    assert _QueryResultCache(path=path).get("k") == rows
+    with sqlite3.connect(path) as db:
+        encoding, payload = db.execute("SELECT encoding, value FROM query_results").fetchone()
+    assert encoding == "json"
+    assert b"12.3400" in payload
+
+
+def test_legacy_pickled_entries_are_never_loaded(tmp_path):
+    path = tmp_path / "cache.db"
+    with sqlite3.connect(path) as db:
+        db.execute("CREATE TABLE query_cache (cache_key TEXT PRIMARY KEY, query TEXT, expires_at REAL, value BLOB)")
+        db.execute("INSERT INTO query_cache VALUES ('k', '', 9e18, ?)", (pickle.dumps([{"id": 1}]),))
+
+    cache = _QueryResultCache(path=path)
+    assert cache.get("k") is None
+    with sqlite3.connect(path) as db:
+        tables = {row[0] for row in db.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+    assert "query_cache" not in tables
+
+
+def test_connector_serves_cached_query_across_instances(sqlite_db, connector_factory, tmp_path):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(1, "load"), (2, "export")], "INSERT INTO jobs VALUES (?, ?)")
+    cache_path = tmp_path / "results.db"
+    query = "SELECT id, name FROM jobs ORDER BY id"
+
+    first = connector_factory(result_cache=True, cache_path=cache_path)
+    expected = first.execute_query(query, return_dataframe=False, cache_ttl=60)
+    with sqlite3.connect(sqlite_db) as db:
+        db.execute("DELETE FROM jobs")
+
+    second = connector_factory(result_cache=True, cache_path=cache_path)
+    assert second.execute_query(query, return_dataframe=False, cache_ttl=60) == expected
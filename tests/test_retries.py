@@ -0,0 +1,123 @@
+"""Transient-error retries, backoff and circuit breaker accounting."""
+
+import sqlite3
+
+import pytest
+import sqlalchemy as sa
+
+import cxmidl_connector
+from cxmidl_connector import CircuitBreakerOpenError, _is_transient_error, _server_answered
+
+
+def _operational(message):
+    return sa.exc.OperationalError("SELECT 1", {}, sqlite3.OperationalError(message))
+
+
+class _Script:
+    """Operation raising the given errors in turn, then returning ``"ok"``."""
+
+    def __init__(self, *errors):
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+@pytest.fixture
+def retrying(connector_factory, monkeypatch):
+    # Settings unique to this module, so the shared breaker starts clean
+    connector = connector_factory(max_retries=3, retry_backoff=0.5, retry_max_backoff=2.0,
+                                  circuit_breaker_threshold=4, circuit_breaker_reset=11.0)
+    sleeps = []
+    monkeypatch.setattr(cxmidl_connector.time, "sleep", sleeps.append)
+    monkeypatch.setattr(cxmidl_connector.random, "uniform", lambda low, high: high)
+    yield connector, sleeps
+    connector._circuit_breaker.record_success()
+
+
+def test_transient_error_numbers_and_sqlstates():
+    assert _is_transient_error(_operational("Database is not currently available (40613)"))
+    assert _is_transient_error(_operational("Transaction was deadlocked (1205)"))
+    assert _is_transient_error(sa.exc.OperationalError("SELECT 1", {}, sqlite3.OperationalError("08S01", "link")))
+    assert not _is_transient_error(_operational("Invalid object name 'jobs' (208)"))
+    assert not _is_transient_error(CircuitBreakerOpenError("open"))
+
+
+def test_transient_errors_are_retried_with_capped_exponential_backoff(retrying):
+    connector, sleeps = retrying
+    operation = _Script(_operational("(40501)"), _operational("(40501)"), _operational("(40501)"))
+
+    assert connector._with_retries(operation, "query") == "ok"
+    assert operation.calls == 4
+    assert sleeps == [0.5, 1.0, 2.0]
+    assert connector._circuit_breaker.statistics()["consecutive_failures"] == 0
+
+
+def test_exhausted_retries_open_the_breaker(retrying):
+    connector, sleeps = retrying
+    operation = _Script(*[_operational("(40613)")] * 5)
+
+    with pytest.raises(sa.exc.OperationalError):
+        connector._with_retries(operation, "query")
+    assert operation.calls == 4
+    assert connector._circuit_breaker.state == "open"
+
+    with pytest.raises(CircuitBreakerOpenError):
+        connector._with_retries(operation, "query")
+    assert operation.calls == 4
+
+
+def test_no_retry_when_disabled(retrying):
+    connector, sleeps = retrying
+    operation = _Script(_operational("(40613)"))
+
+    with pytest.raises(sa.exc.OperationalError):
+        connector._with_retries(operation, "write", retry=False)
+    assert (operation.calls, sleeps) == (1, [])
+
+
+def test_only_server_errors_count_as_success(retrying):
+    connector, _ = retrying
+    breaker = connector._circuit_breaker
+    breaker.record_failure()
+
+    with pytest.raises(ValueError):
+        connector._with_retries(_Script(ValueError("bad row")), "query")
+    assert breaker.statistics()["consecutive_failures"] == 1
+
+    with pytest.raises(sa.exc.OperationalError):
+        connector.execute_query("SELEC 1", return_dataframe=False)
+    assert breaker.statistics()["consecutive_failures"] == 0
+
+    assert _server_answered(sa.exc.ProgrammingError("SELECT", {}, sqlite3.ProgrammingError("no such table")))
+    assert not _server_answered(sa.exc.InterfaceError("SELECT", {}, sqlite3.InterfaceError("driver")))
+    assert not _server_answered(sa.exc.OperationalError("SELECT", {}, sqlite3.OperationalError("HYT00", "timeout")))
+    assert not _server_answered(ConnectionError("refused"))
+
+
+def test_client_side_error_releases_a_half_open_trial(retrying):
+    connector, _ = retrying
+    breaker = connector._circuit_breaker
+    for _ in range(breaker.failure_threshold):
+        breaker.record_failure()
+    breaker._opened_at -= breaker.reset_timeout
+
+    with pytest.raises(ValueError):
+        connector._with_retries(_Script(ValueError("bad row")), "query")
+    assert breaker.state == "half_open"
+    assert connector._with_retries(_Script(), "query") == "ok"
+    assert breaker.state == "closed"
+
+
+def test_breakers_are_shared_per_server_and_settings(connector_factory):
+    first = connector_factory(circuit_breaker_threshold=2, circuit_breaker_reset=5)
+    same = connector_factory(circuit_breaker_threshold=2, circuit_breaker_reset=5.0)
+    other = connector_factory(circuit_breaker_threshold=9, circuit_breaker_reset=5.0)
+
+    assert first._circuit_breaker is same._circuit_breaker
+    assert other._circuit_breaker is not first._circuit_breaker
+    assert other._circuit_breaker.failure_threshold == 9
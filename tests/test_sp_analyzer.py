@@ -0,0 +1,45 @@
+"""Stored procedure analysis against a scripted SQL Server catalog."""
+
+from datetime import datetime
+
+from cxmidl_dialects import get_dialect_adapter
+from cxmidl_sp_analyzer import analyze_procedures
+
+
+class FakeProcedureConnector:
+    """Answers the procedure, parameter and dependency queries from memory."""
+
+    backend = get_dialect_adapter("mssql")
+    server = "fake"
+    database = "Orchestration"
+    integration_id = "test"
+
+    def __init__(self, procedures):
+        self.procedures = procedures
+
+    def execute_many(self, queries, return_dataframe=True):
+        procedures = [
+            {"object_id": object_id, "schema_name": schema, "name": name,
+             "type_desc": "SQL_STORED_PROCEDURE", "create_date": datetime(2024, 1, 1),
+             "modify_date": datetime(2024, 1, 1), "definition": definition}
+            for object_id, (schema, name, definition) in enumerate(self.procedures, start=1)
+        ]
+        return [{"success": True, "result": rows, "error": None} for rows in (procedures, [], [])]
+
+
+def test_same_named_procedures_in_different_schemas_get_separate_reports(tmp_path):
+    connector = FakeProcedureConnector([
+        ("dbo", "usp_Load", "CREATE PROCEDURE dbo.usp_Load AS SELECT 1"),
+        ("etl", "usp_Load", "CREATE PROCEDURE etl.usp_Load AS SELECT 2")
+    ])
+    summary = analyze_procedures(connector, tmp_path, max_workers=1)
+
+    assert summary["status"] == "completed"
+    assert len(summary["analyzed"]) == 2
+    for schema in ("dbo", "etl"):
+        report = (tmp_path / f"{schema}.usp_Load-TechnicalAnalysis.md").read_text(encoding="utf-8")
+        assert f"**Procedure Name**: {schema}.usp_Load" in report
+        assert f"`{schema}.usp_Load-TechnicalAnalysis.md`" in report
+
+    rerun = analyze_procedures(connector, tmp_path, max_workers=1)
+    assert sorted(rerun["skipped"]) == ["dbo.usp_Load", "etl.usp_Load"]
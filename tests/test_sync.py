@@ -0,0 +1,122 @@
+"""Tests for incremental table sync against a SQLite backend."""
+
+import os
+import sqlite3
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+import cxmidl_sync
+from conftest import create_table
+from cxmidl_sync import STATE_FILE_NAME, SyncStateStore, sync_table
+
+
+def test_all_null_delta_merges_into_typed_copy(sqlite_db, connector_factory, tmp_path):
+    create_table(
+        sqlite_db,
+        "CREATE TABLE task_history (id INTEGER PRIMARY KEY, note TEXT)",
+        [(i, f"note-{i}") for i in range(1, 11)],
+        "INSERT INTO task_history VALUES (?, ?)"
+    )
+    connector = connector_factory()
+    first = sync_table(connector, "task_history", tmp_path, "id", key_columns=["id"])
+    assert first["status"] == "completed"
+
+    with sqlite3.connect(sqlite_db) as db:
+        db.executemany("INSERT INTO task_history VALUES (?, NULL)", [(i,) for i in range(11, 16)])
+    second = sync_table(connector, "task_history", tmp_path, "id", key_columns=["id"])
+
+    assert second["status"] == "completed", second.get("error")
+    assert second["rows_inserted"] == 5
+    data = pq.read_table(tmp_path / "dbo.task_history" / "data.parquet")
+    assert data.schema.field("note").type == pa.string()
+    assert data.num_rows == 15
+
+
+def _jobs(path, ids):
+    create_table(
+        path,
+        "CREATE TABLE jobs (id INTEGER PRIMARY KEY, status TEXT, updated_at TEXT)",
+        [(i, "done", f"2025-08-07 12:00:{i:02d}") for i in ids],
+        "INSERT INTO jobs VALUES (?, ?, ?)"
+    )
+
+
+def _appended(tmp_path):
+    return pq.read_table(tmp_path / "dbo.jobs").column("id").to_pylist()
+
+
+def test_late_committed_identity_rows_are_synced_once(sqlite_db, connector_factory, tmp_path):
+    _jobs(sqlite_db, [i for i in range(1, 11) if i != 4])
+    connector = connector_factory()
+    upserts, appends = tmp_path / "upsert", tmp_path / "append"
+    assert sync_table(connector, "jobs", upserts, "id", key_columns=["id"])["status"] == "completed"
+    assert sync_table(connector, "jobs", appends, "id")["status"] == "completed"
+
+    # Row 4 commits after the watermark reached 10
+    with sqlite3.connect(sqlite_db) as db:
+        db.execute("INSERT INTO jobs VALUES (4, 'late', '2025-08-07 12:00:04')")
+    upsert = sync_table(connector, "jobs", upserts, "id", key_columns=["id"])
+    append = sync_table(connector, "jobs", appends, "id")
+
+    assert upsert["rows_inserted"] == 1
+    assert pq.read_table(upserts / "dbo.jobs" / "data.parquet").num_rows == 10
+    assert append["rows_fetched"] == 1
+    assert sorted(_appended(appends)) == list(range(1, 11))
+    assert upsert["watermark"] == append["watermark"] == 10
+
+
+def test_datetime_append_is_refused(sqlite_db, connector_factory, tmp_path):
+    _jobs(sqlite_db, range(1, 4))
+    summary = sync_table(connector_factory(), "jobs", tmp_path, "updated_at", watermark_kind="datetime")
+
+    assert summary["status"] == "failed"
+    assert "key_columns" in summary["error"]
+
+
+class _CrashBeforeWatermark(SyncStateStore):
+    """Fails the final state write of a run, after its part file was published."""
+
+    def set(self, table_key, state):
+        previous = self.get(table_key) or {}
+        if "pending" in previous and "pending" not in state:
+            raise OSError("disk full")
+        super().set(table_key, state)
+
+
+def test_append_interrupted_after_publish_is_not_repeated(sqlite_db, connector_factory, tmp_path):
+    _jobs(sqlite_db, range(1, 11))
+    connector = connector_factory()
+    crashed = sync_table(connector, "jobs", tmp_path, "id",
+                         state_store=_CrashBeforeWatermark(tmp_path / STATE_FILE_NAME))
+    assert crashed["status"] == "failed"
+
+    # No lookback: the recorded part alone must prevent a second append
+    resumed = sync_table(connector, "jobs", tmp_path, "id", lookback=0)
+
+    assert resumed["status"] == "completed"
+    assert resumed["rows_fetched"] == 0
+    assert resumed["previous_watermark"] == 10
+    assert sorted(_appended(tmp_path)) == list(range(1, 11))
+
+
+def test_append_interrupted_before_publish_is_repeated(sqlite_db, connector_factory, tmp_path, monkeypatch):
+    _jobs(sqlite_db, range(1, 11))
+    connector = connector_factory()
+    replace = os.replace
+
+    def failing_replace(source, target):
+        if Path(target).name.startswith("part-"):
+            raise OSError("disk full")
+        replace(source, target)
+
+    monkeypatch.setattr(cxmidl_sync.os, "replace", failing_replace)
+    assert sync_table(connector, "jobs", tmp_path, "id")["status"] == "failed"
+    monkeypatch.setattr(cxmidl_sync.os, "replace", replace)
+
+    resumed = sync_table(connector, "jobs", tmp_path, "id", lookback=0)
+
+    assert resumed["rows_fetched"] == 10
+    assert sorted(_appended(tmp_path)) == list(range(1, 11))
+    assert not list((tmp_path / "dbo.jobs").glob("delta-*"))
@@ -0,0 +1,41 @@
+"""Tests for connector.transaction() against a SQLite backend."""
+
+import pytest
+
+from conftest import create_table
+
+
+@pytest.fixture
+def jobs(sqlite_db, connector_factory):
+    create_table(sqlite_db, "CREATE TABLE jobs (id INTEGER PRIMARY KEY, name TEXT)",
+                 [(i, f"job-{i}") for i in range(20)], "INSERT INTO jobs VALUES (?, ?)")
+    connector = connector_factory(pool_size=2, max_overflow=0, result_cache=True)
+    assert connector.connect()
+    return connector
+
+
+def test_queries_in_a_transaction_share_one_connection(jobs):
+    with jobs.transaction() as tx:
+        count = tx.execute_query("SELECT COUNT(*) as n FROM jobs", return_dataframe=False, cache_ttl=60)
+        assert jobs.pool_statistics()["checked_out"] == 1
+        batches = list(tx.execute_query_arrow_batches("SELECT id FROM jobs ORDER BY id", batch_size=7))
+        rows = list(tx.execute_query_stream("SELECT id FROM jobs", chunk_size=5, return_dataframe=False))
+        assert jobs.pool_statistics()["checked_out"] == 1
+        assert jobs.pool_statistics()["checkouts"] == 2
+
+    assert count == [{"n": 20}]
+    assert sum(batch.num_rows for batch in batches) == 20
+    assert sum(len(chunk) for chunk in rows) == 20
+    assert jobs.pool_statistics()["checked_out"] == 0
+    # The view bypasses the result cache
+    assert jobs.cache_statistics()["entries"] == 0
+
+
+def test_transaction_releases_its_connection_on_error(jobs):
+    with pytest.raises(RuntimeError):
+        with jobs.transaction() as tx:
+            tx.execute_query("SELECT 1 as one", return_dataframe=False)
+            raise RuntimeError("consumer failed")
+
+    assert jobs.pool_statistics()["checked_out"] == 0
+    assert jobs._pinned_connection is None